@@ -15,6 +15,7 @@ from importlib.metadata import entry_points
 from typing import ClassVar
 
 from rich.prompt import InvalidResponse, PromptBase, PromptType
+from rich.syntax import Syntax
 from typing_extensions import override
 
 from cobib.config import Event, LabelSuffix, config
@@ -67,6 +68,16 @@ class AddCommand(Command):
     case, the parser will attempt to provide a short-hand argument option, for example `-b` for
     `--bibtex`."""
 
+    _IDENTIFIER_KINDS: ClassVar[dict[str, tuple[Event, tuple[str, ...]]]] = {
+        "arxiv": (Event.PreArxivParse, ("arxiv",)),
+        "doi": (Event.PreDOIParse, ("doi",)),
+        "isbn": (Event.PreISBNParse, ("isbn",)),
+        "url": (Event.PreURLParse, ("url", "arxiv", "doi", "isbn")),
+    }
+    """The built-in parsers whose inputs are looked up in the identifier index of the database
+    (see `cobib.database.Database.identifier_index`) before querying them. The values are a tuple
+    of the event which fires before parsing and the kinds of identifiers to look up."""
+
     @override
     def __init__(self, *args: str) -> None:
         super().__init__(*args)
@@ -149,10 +160,46 @@ class AddCommand(Command):
         Event.PreAddCommand.fire(self)
 
         edit_entries = False
-        for name, (cls, _) in AddCommand._avail_parsers.items():
+        existing_label: str | None = None
+        resolution: str | None = None
+        for name, (cls, builtin) in AddCommand._avail_parsers.items():
             string = getattr(self.largs, name, None)
             if string is None:
                 continue
+            if builtin:
+                existing_label = self._find_existing_entry(name, string)
+            if existing_label is not None:
+                # the entry already exists, so we resolve the conflict before querying the parser
+                msg = (
+                    f"You tried to add a new entry from the {name} '{string}' which already exists "
+                    f"as '{existing_label}'!"
+                )
+                LOGGER.warning(msg)
+                resolution = self.largs.disambiguation
+                if resolution is None:
+                    resolution = await Prompt.ask(
+                        "How would you like to handle this conflict?",
+                        choices=["keep", "replace", "update", "cancel", "disambiguate", "help"],
+                        default="keep",
+                        pre_prompt_message=Syntax(
+                            BibtexParser().dump(Database()[existing_label]), "bibtex"
+                        ),
+                        process_response_wrapper=self._wrap_prompt_process_response,
+                    )
+                if resolution == "keep":
+                    msg = (
+                        f"Keeping the already existing entry '{existing_label}' without querying "
+                        f"the {name} parser."
+                    )
+                    LOGGER.info(msg)
+                    return
+                if resolution == "cancel":
+                    msg = (
+                        f"Cancelling the addition of the new entry from the {name} '{string}' "
+                        f"without querying the {name} parser."
+                    )
+                    LOGGER.warning(msg)
+                    return
             LOGGER.debug("Adding entries from %s: '%s'.", name, string)
             self.new_entries = cls().parse(string)
             break
@@ -191,6 +238,11 @@ class AddCommand(Command):
                 formatted_entries[formatted_label] = value
             self.new_entries = formatted_entries
 
+        if existing_label is not None and resolution in {"replace", "update"}:
+            # the new entry gets resolved against the existing one with the same identifier
+            for value in self.new_entries.copy().values():
+                self._rename_added_entry(value, existing_label)
+
         if self.largs.file is not None:
             assert len(self.new_entries.values()) == 1
             for value in self.new_entries.values():
@@ -242,8 +294,9 @@ class AddCommand(Command):
                     )
                     LOGGER.warning(msg)
 
-                # get the --disambiguation argument (which will be `None` by default)
-                res = self.largs.disambiguation
+                # get the --disambiguation argument (which will be `None` by default) unless the
+                # conflict has been resolved already based on the identifier index
+                res = resolution if resolution is not None else self.largs.disambiguation
 
                 parser = BibtexParser()
 
@@ -366,6 +419,34 @@ class AddCommand(Command):
             msg = f"'{label}' was added to the database."
             LOGGER.log(HINT, msg)
 
+    def _find_existing_entry(self, name: str, string: str) -> str | None:
+        """Finds an existing entry with the same identifier as the input to a built-in parser.
+
+        This only uses the identifier index of the database (see
+        `cobib.database.Database.identifier_index`) and, thus, requires no network access. The
+        lookup is skipped while any hooks are subscribed to the event which fires before parsing,
+        because these may change the input.
+
+        Args:
+            name: the name of the parser.
+            string: the input to the parser.
+
+        Returns:
+            The label of the existing entry or `None`, if no such entry exists.
+        """
+        if name not in self._IDENTIFIER_KINDS:
+            return None
+        event, kinds = self._IDENTIFIER_KINDS[name]
+        if config.events.get(event, None):
+            LOGGER.debug("Not looking up the %s '%s' as hooks may change it.", name, string)
+            return None
+        index = Database.identifier_index()
+        for kind in kinds:
+            labels = index.find(kind, string)
+            if labels:
+                return min(labels)
+        return None
+
     def _rename_added_entry(self, entry: Entry, new_label: str) -> None:
         """Renames the provided entry to the new provided label.
 
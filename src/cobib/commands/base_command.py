@@ -14,6 +14,7 @@ from rich.console import ConsoleRenderable
 from textual.widget import Widget
 
 from cobib.config import Event, config
+from cobib.database import Database
 from cobib.utils.git import is_inside_work_tree
 from cobib.utils.rel_path import RelPath
 
@@ -198,11 +199,24 @@ class Command(ABC):
         git_commit_args = ["--no-gpg-sign", "--quiet"]
         if allow_empty:
             git_commit_args.append("--allow-empty")
+        journal = Database.get_journal_file()
+        if journal.exists():
+            add_files = [*(add_files or []), shlex.quote(str(journal))]
+        staged = str(file)
+        written = Database.pop_written_files()
+        if config.database.backend == "sharded" and written:
+            # only stage the shard files which have actually been written
+            staged = " ".join(shlex.quote(str(path)) for path in sorted(written))
         commands = [
             f"cd {root}",
-            f"git add -- {file} {' '.join(add_files) if add_files is not None else ''}",
+            f"git add -- {staged} {' '.join(add_files) if add_files is not None else ''}",
             f"git commit {' '.join(git_commit_args)} --message {shlex.quote(msg)}",
         ]
+        if config.database.journal and not journal.exists():
+            # a compacted journal may still be tracked and its removal needs to be committed
+            commands.insert(
+                2, f"git rm --cached --quiet --ignore-unmatch -- {shlex.quote(str(journal))}"
+            )
         LOGGER.debug("Auto-commit to git from %s command.", self.name)
         os.system("; ".join(commands))
 
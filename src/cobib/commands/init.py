@@ -14,6 +14,7 @@ from pathlib import Path
 from typing_extensions import override
 
 from cobib.config import Event, config
+from cobib.database.shards import ShardedBackend
 from cobib.utils.git import is_inside_work_tree
 from cobib.utils.rel_path import RelPath
 
@@ -64,7 +65,8 @@ class InitCommand(Command):
         self.file = RelPath(config.database.file).path
         self.root = self.file.parent
 
-        file_exists = self.file.exists()
+        sharded = config.database.backend == "sharded"
+        file_exists = ShardedBackend(self.file).exists() if sharded else self.file.exists()
         git_tracked = is_inside_work_tree(self.root)
 
         if file_exists:
@@ -85,8 +87,14 @@ class InitCommand(Command):
             LOGGER.debug('Creating path for database file: "%s"', self.root)
             self.root.mkdir(parents=True, exist_ok=True)
 
-            LOGGER.debug('Creating empty database file: "%s"', self.file)
-            open(self.file, "w", encoding="utf-8").close()
+            if sharded:
+                LOGGER.debug('Creating empty sharded database directory: "%s"', self.file)
+                ShardedBackend(self.file).initialize(
+                    config.database.shard_by, config.database.shards
+                )
+            else:
+                LOGGER.debug('Creating empty database file: "%s"', self.file)
+                open(self.file, "w", encoding="utf-8").close()
 
         if self.largs.git:
             if not config.database.git:
@@ -42,8 +42,11 @@ class LintFormatter(logging.Formatter):
 
         self._database_path = RelPath(config.database.file)
 
-        with open(self._database_path.path, "r", encoding="utf-8") as database:
-            self._raw_database = database.readlines()
+        self._single_file = config.database.backend == "yaml"
+        self._raw_database: list[str] = []
+        if self._single_file:
+            with open(self._database_path.path, "r", encoding="utf-8") as database:
+                self._raw_database = database.readlines()
 
     def format(self, record: logging.LogRecord) -> str:
         """Format's the LogRecord.
@@ -61,14 +64,22 @@ class LintFormatter(logging.Formatter):
         try:
             entry = record.entry  # type: ignore[attr-defined]
             field = record.field  # type: ignore[attr-defined]
-            raw_db = enumerate(self._raw_database)
-            _, line = next(raw_db)
-            while not line.startswith(entry):
+            try:
+                raw_db = enumerate(self._raw_database)
                 _, line = next(raw_db)
-            while not line.strip().startswith(field):
-                line_no, line = next(raw_db)
-
-            formatted = f"{self._database_path}:{line_no + 1} {record.getMessage()}"
+                while not line.startswith(entry):
+                    _, line = next(raw_db)
+                while not line.strip().startswith(field):
+                    line_no, line = next(raw_db)
+
+                formatted = f"{self._database_path}:{line_no + 1} {record.getMessage()}"
+            except StopIteration:
+                if not self._single_file:
+                    # the SQLite or sharded database has no single file with meaningful line numbers
+                    formatted = f"{self._database_path}:{entry} {record.getMessage()}"
+                else:
+                    # the entry has not been folded from the journal into the database file, yet
+                    formatted = f"{self._database_path}.journal {record.getMessage()}"
 
             if record.levelno == logging.CRITICAL:
                 self.critical_messages.append(formatted)
@@ -95,6 +106,9 @@ class LintCommand(Command):
 
         * `-f`, `--format`: if specified, the database will be formatted to resolve those lint
             messages that are automatically resolvable.
+        * `-c`, `--compact`: if specified, the journal of the database (see also
+            `cobib.config.config.DatabaseConfig.journal`) gets folded back into the database file
+            before linting it.
     """
 
     name = "lint"
@@ -119,10 +133,21 @@ class LintCommand(Command):
             action="store_true",
             help="Automatically format database to conform with linter.",
         )
+        parser.add_argument(
+            "-c",
+            "--compact",
+            action="store_true",
+            help="Fold the database journal back into the database file.",
+        )
         cls.argparser = parser
 
     @override
     def execute(self) -> None:
+        if self.largs.compact:
+            Database.read(bypass_cache=True)
+            Database.compact()
+            self.git()
+
         output = StringIO()
 
         handler = logging.StreamHandler(output)
@@ -143,6 +168,7 @@ class LintCommand(Command):
 
         # trigger database reading to cause lint messages upon entry-construction
         Database.read(bypass_cache=True)
+        Database.materialize()
 
         self._lint_messages = output.getvalue().split("\n")
 
@@ -19,6 +19,7 @@ from typing_extensions import override
 
 from cobib.config import Event, config
 from cobib.database import Database, Entry
+from cobib.database.filter_plan import FilterPlan
 from cobib.ui.components import ListView
 from cobib.utils.regex import HAS_OPTIONAL_REGEX
 
@@ -319,17 +320,25 @@ class ListCommand(Command):
             # bypassing the unnecessary calls to `Entry.matches` when no filter was provided
             self.entries = list(Database().values())
         else:
-            for key, entry in Database().items():
-                if entry.matches(
-                    _filter,
-                    self.largs.OR,
-                    ignore_case=ignore_case,
-                    decode_latex=decode_latex,
-                    decode_unicode=decode_unicode,
-                    fuzziness=self.largs.fuzziness,
-                ):
-                    LOGGER.debug('Entry "%s" matches the filter.', key)
-                    self.entries.append(entry)
+            # the filter gets compiled once and is then applied to all entries
+            plan = FilterPlan(
+                _filter,
+                self.largs.OR,
+                ignore_case=ignore_case,
+                decode_latex=decode_latex,
+                decode_unicode=decode_unicode,
+                fuzziness=self.largs.fuzziness,
+            )
+            bib = Database()
+            ranges = Database.range_index(plan.comparison_fields)
+            value_fields = plan.fields - plan.comparison_fields if ranges else plan.fields
+            field_index = Database.value_index(value_fields)
+            if field_index is None:
+                self.entries.extend(plan.apply(bib.values()))
+            else:
+                LOGGER.debug("Evaluating the filter on the database indexes.")
+                selected = plan.select(field_index, bib.keys(), ranges)
+                self.entries.extend(bib[label] for label in bib.keys() if label in selected)
 
         return self.entries, filtered_keys
 
@@ -340,8 +349,13 @@ class ListCommand(Command):
         This method _must_ be run after `filter_entries` to ensure that the `entries` of this
         command instance are already populated.
 
+        The entries of the database are walked in the order of the sort index of the requested
+        field (see `cobib.database.Database.sorted_labels`) rather than being sorted from scratch.
+        Thus, when a limit was provided, only as many entries as are needed get collected.
+
         Returns:
-            The sorted list of entries.
+            The sorted list of entries. When a (non-negative) limit was provided, this list may
+            already be truncated to it.
         """
         if self.largs.reverse:
             LOGGER.debug("Reversing the entry order.")
@@ -353,11 +367,26 @@ class ListCommand(Command):
 
         LOGGER.debug("Sorting entries by key '%s'.", self.largs.sort)
 
-        self.entries = natsorted(
-            self.entries,
-            reverse=self.largs.reverse,
-            key=lambda entry: entry.stringify().get(str(self.largs.sort), ""),
-        )
+        bib = Database()
+        selected = {entry.label: entry for entry in self.entries}
+        if len(selected) != len(self.entries) or any(label not in bib for label in selected):
+            # NOTE: the sort index only covers the entries of the database
+            self.entries = natsorted(
+                self.entries,
+                reverse=self.largs.reverse,
+                key=lambda entry: entry.stringify_field(str(self.largs.sort)) or "",
+            )
+            return self.entries
+
+        limit = self.largs.limit if self.largs.limit is not None and self.largs.limit >= 0 else None
+        sorted_entries: list[Entry] = []
+        for label in Database.sorted_labels(str(self.largs.sort), reverse=self.largs.reverse):
+            if limit is not None and len(sorted_entries) >= limit:
+                break
+            entry = selected.get(label, None)
+            if entry is not None:
+                sorted_entries.append(entry)
+        self.entries = sorted_entries
 
         return self.entries
 
@@ -368,9 +397,7 @@ class ListCommand(Command):
         output.append("::".join(self.columns))
 
         for entry in self.entries:
-            stringified: dict[str, str] = entry.stringify()
-
-            output.append("::".join(stringified.get(col, "") for col in self.columns))
+            output.append("::".join(entry.stringify_field(col) or "" for col in self.columns))
 
         return output
 
@@ -382,9 +409,9 @@ class ListCommand(Command):
             rich_table.add_column(col)
 
         for entry in self.entries:
-            stringified: dict[str, str] = entry.stringify(markup=True)
-
-            rich_table.add_row(*(stringified.get(col, "") for col in self.columns))
+            rich_table.add_row(
+                *(entry.stringify_field(col, markup=True) or "" for col in self.columns)
+            )
 
         return rich_table
 
@@ -396,10 +423,11 @@ class ListCommand(Command):
             textual_table.add_column(col, width=None)
 
         for entry in self.entries:
-            stringified: dict[str, str] = entry.stringify(markup=True)
-
             textual_table.add_row(
-                *(Text.from_markup(stringified.get(col, "")) for col in self.columns),
+                *(
+                    Text.from_markup(entry.stringify_field(col, markup=True) or "")
+                    for col in self.columns
+                ),
                 key=entry.label,
             )
 
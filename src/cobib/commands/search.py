@@ -8,6 +8,13 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import math
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, ClassVar
 
 from rich.console import ConsoleRenderable
 from rich.text import Text
@@ -15,11 +22,12 @@ from rich.tree import Tree
 from typing_extensions import override
 
 from cobib.config import Event, config
-from cobib.database import Entry
+from cobib.database import Database, Entry, text_cache
 from cobib.ui.components import SearchView
 from cobib.utils.match import Match
 from cobib.utils.progress import Progress
 from cobib.utils.regex import HAS_OPTIONAL_REGEX
+from cobib.utils.rel_path import RelPath
 
 from .base_command import Command
 from .list_ import ListCommand
@@ -35,7 +43,7 @@ class SearchCommand(Command):
 
         * `query`: the required positional argument corresponds to the regex-interpreted text which
           will be searched for. You may provide multiple separate queries which will be searched for
-          independently.
+          independently. This may only be omitted when `--warm-cache` is specified.
         * `-i`, `--ignore-case`: if specified, the search will be case-**in**sensitive. This
           overwrites the `cobib.config.config.SearchCommandConfig.ignore_case` setting.
         * `-I`, `--no-ignore-case`: if specified, the search will be case-sensitive. This
@@ -65,12 +73,23 @@ class SearchCommand(Command):
             the `cobib.config.config.SearchCommandConfig.skip_notes` setting.
         * `--include-notes`: if specified, associated notes will be searched. This overwrites
             the `cobib.config.config.SearchCommandConfig.skip_notes` setting.
+        * `--parallel`: you can specify the number of processes with which to search many entries in
+            parallel. This overwrites the `cobib.config.config.SearchCommandConfig.parallel`
+            setting.
+        * `--warm-cache`: if specified, the texts of the associated files of all (filtered) entries
+            get extracted with the `cobib.config.config.SearchCommandConfig.extractor` command in a
+            process pool and cached (see `cobib.database.text_cache`). If any `query` is given, this
+            happens in the background while searching.
         * in addition to the above, you can add `filters` to narrow the search down to a subset of
           your database. For more information refer to `cobib.commands.list_`.
     """
 
     name = "search"
 
+    _PARALLEL_CHUNK_SIZE: ClassVar[int] = 100
+    """The minimum number of entries which get searched by a single process when searching in
+    parallel (see `cobib.config.config.SearchCommandConfig.parallel`)."""
+
     @override
     def __init__(self, *args: str) -> None:
         super().__init__(*args)
@@ -95,7 +114,7 @@ class SearchCommand(Command):
             description="Search subcommand parser.",
             epilog="Read cobib-search.1 for more help.",
         )
-        parser.add_argument("query", type=str, nargs="+", help="text to search for")
+        parser.add_argument("query", type=str, nargs="*", help="text to search for")
         ignore_case_group = parser.add_mutually_exclusive_group()
         ignore_case_group.add_argument(
             "-i",
@@ -189,6 +208,18 @@ class SearchCommand(Command):
             default=None,
             help="DO search through associated notes",
         )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=config.commands.search.parallel,
+            help="number of processes with which to search many entries in parallel",
+        )
+        parser.add_argument(
+            "--warm-cache",
+            action="store_true",
+            help="extract and cache the texts of associated files with the configured extractor "
+            "(in the background while searching, if a query is given)",
+        )
         parser.add_argument(
             "filter",
             nargs="*",
@@ -217,6 +248,9 @@ class SearchCommand(Command):
         largs = super()._parse_args(tuple(search_args))
         largs.filter = filter_args
 
+        if not largs.query and not largs.warm_cache:
+            cls._get_argparser().error("the following arguments are required: query")
+
         # NOTE: we ignore coverage below because the CI has an additional job running the unittests
         # without optional dependencies available.
         if largs.fuzziness > 0 and not HAS_OPTIONAL_REGEX:  # pragma: no branch
@@ -236,6 +270,12 @@ class SearchCommand(Command):
 
         self.entries, _ = ListCommand(*self.largs.filter).execute_dull()
 
+        if self.largs.warm_cache:
+            await self._warm_cache()
+            if not self.largs.query:
+                self.entries = []
+                return
+
         ignore_case = config.commands.search.ignore_case
         if self.largs.ignore_case is not None:
             ignore_case = self.largs.ignore_case
@@ -267,6 +307,15 @@ class SearchCommand(Command):
             "The search will%s look through associated notes", " NOT" if skip_notes else ""
         )
 
+        if not (decode_latex or decode_unicode or self.largs.fuzziness):
+            index = Database.search_index()
+            candidates = None
+            if index is not None:
+                candidates = index.candidates(self.largs.query, skip_files=skip_files)
+            if candidates is not None:
+                LOGGER.info("The full-text index yields %d candidate entries.", len(candidates))
+                self.entries = [entry for entry in self.entries if entry.label in candidates]
+
         progress_bar = Progress.initialize()
         optional_awaitable = progress_bar.start()
         if optional_awaitable is not None:
@@ -274,36 +323,56 @@ class SearchCommand(Command):
 
         task = progress_bar.add_task("Searching...", total=len(self.entries))
 
-        if ignore_case and not skip_files:
+        if ignore_case and not skip_files and config.commands.search.extractor is None:
             LOGGER.warning(
                 "The `--ignore-case` argument does NOT get forwarded to the external grep tool "
                 "which is used for searching associated files! Configure its additional arguments "
                 "manually via `config.commands.search.grep_args`."
             )
 
-        for entry in self.entries.copy():
-            progress_bar.advance(task, 1)
-            await asyncio.sleep(0)
+        grep_outputs: dict[str, list[str]] | None = None
+        if not skip_files:
+            # NOTE: the associated files of all entries get searched at once in a separate thread
+            grep_outputs = await asyncio.to_thread(
+                Entry.grep,
+                [file_ for entry in self.entries for file_ in entry.file],
+                self.largs.query,
+                self.largs.context,
+                ignore_case=ignore_case,
+                fuzziness=self.largs.fuzziness,
+            )
 
+        search_kwargs: dict[str, Any] = {
+            "context": self.largs.context,
+            "ignore_case": ignore_case,
+            "decode_unicode": decode_unicode,
+            "decode_latex": decode_latex,
+            "fuzziness": self.largs.fuzziness,
+        }
+
+        found: list[Entry] = []
+        async for entry, text_matches in self._search_texts(
+            search_kwargs, skip_notes, partial(progress_bar.advance, task)
+        ):
             matches = entry.search(
                 self.largs.query,
-                context=self.largs.context,
                 skip_files=skip_files,
                 skip_notes=skip_notes,
-                ignore_case=ignore_case,
-                decode_unicode=decode_unicode,
-                decode_latex=decode_latex,
-                fuzziness=self.largs.fuzziness,
+                grep_outputs=grep_outputs,
+                text_matches=text_matches,
+                **search_kwargs,
             )
             if not matches:
-                self.entries.remove(entry)
                 continue
 
+            found.append(entry)
             self.matches.append(matches)
             self.hits += len(matches)
 
             LOGGER.debug('Entry "%s" includes %d hits.', entry.label, len(matches))
 
+        self.entries = found
+
         progress_bar.stop()
 
         Event.PostSearchCommand.fire(self)
@@ -311,6 +380,139 @@ class SearchCommand(Command):
         if len(self.matches) == 0:
             LOGGER.warning("The search for %s returned no results!", self.largs.query)
 
+    async def _search_texts(
+        self, search_kwargs: dict[str, Any], skip_notes: bool, advance: Callable[[int], None]
+    ) -> AsyncIterator[tuple[Entry, list[list[Match]] | None]]:
+        """Searches the searchable texts of all entries.
+
+        Unless `--parallel` is set to more than one process and there are more than
+        `_PARALLEL_CHUNK_SIZE` entries, the texts get searched by `cobib.database.Entry.search`
+        itself. Otherwise, the entries get split into chunks of at least `_PARALLEL_CHUNK_SIZE`
+        entries (and no more than four chunks per process) whose texts get rendered ahead of time
+        and searched in a process pool (see `cobib.database.Entry.search_texts`). In either case,
+        the event loop remains responsive.
+
+        Args:
+            search_kwargs: the keyword arguments of the search.
+            skip_notes: if True, associated notes will *not* be searched.
+            advance: the callback advancing the progress by a number of entries.
+
+        Yields:
+            The pairs of every entry and the matches within its searchable text (or `None`, if these
+            still need to be determined) in the order of the entries.
+        """
+        processes = self.largs.parallel
+        if processes <= 1 or len(self.entries) <= self._PARALLEL_CHUNK_SIZE:
+            for entry in self.entries:
+                advance(1)
+                await asyncio.sleep(0)
+                yield entry, None
+            return
+
+        size = max(self._PARALLEL_CHUNK_SIZE, math.ceil(len(self.entries) / (4 * processes)))
+        chunks = [self.entries[start : start + size] for start in range(0, len(self.entries), size)]
+        LOGGER.debug("Searching %d chunks of entries in %d processes.", len(chunks), processes)
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = []
+            for chunk in chunks:
+                texts = [
+                    (
+                        entry.searchable_text(skip_notes=skip_notes),
+                        None if entry.notes is None else str(entry.notes),
+                    )
+                    for entry in chunk
+                ]
+                futures.append(
+                    loop.run_in_executor(
+                        executor,
+                        partial(Entry.search_texts, texts, self.largs.query, **search_kwargs),
+                    )
+                )
+                await asyncio.sleep(0)
+
+            for chunk, future in zip(chunks, futures):
+                results = await future
+                advance(len(chunk))
+                for entry, text_matches in zip(chunk, results):
+                    yield entry, text_matches
+
+    async def _warm_cache(self) -> None:
+        """Extracts and caches the texts of the associated files of all entries.
+
+        The texts get extracted in a process pool (see `cobib.database.text_cache.warm`). If any
+        `query` is given, this happens in a background thread (see `SearchCommand._warm_paths`) such
+        that the search does not wait for it. Otherwise, the progress is being reported.
+        """
+        command = config.commands.search.extractor
+        cache = text_cache.directory()
+        if command is None or cache is None:
+            LOGGER.warning(
+                "Warming the extracted-text cache requires `config.commands.search.extractor` and "
+                "`config.database.cache` to be configured!"
+            )
+            return
+
+        paths = list(
+            dict.fromkeys(
+                str(path)
+                for entry in self.entries
+                for file_ in entry.file
+                if (path := RelPath(file_).path).exists()
+            )
+        )
+        LOGGER.info("Extracting the texts of %d associated files.", len(paths))
+
+        if self.largs.query:
+            # NOTE: this is no daemon thread such that the extraction gets completed before exiting
+            threading.Thread(
+                target=SearchCommand._warm_paths, args=(paths, command, cache), name="warm-cache"
+            ).start()
+            return
+
+        progress_bar = Progress.initialize()
+        optional_awaitable = progress_bar.start()
+        if optional_awaitable is not None:
+            await optional_awaitable
+
+        task = progress_bar.add_task("Extracting...", total=len(paths))
+
+        loop = asyncio.get_running_loop()
+        failed = 0
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                loop.run_in_executor(executor, text_cache.warm, path, command, cache)
+                for path in paths
+            ]
+            for future in asyncio.as_completed(futures):
+                if not await future:
+                    failed += 1
+                progress_bar.advance(task, 1)
+
+        progress_bar.stop()
+
+        if failed:
+            LOGGER.warning("The texts of %d associated files could not be extracted.", failed)
+
+    @staticmethod
+    def _warm_paths(paths: list[str], command: list[str], cache: Path) -> None:
+        """Extracts and caches the texts of files in a process pool without reporting the progress.
+
+        Args:
+            paths: the paths of the files.
+            command: the extractor command.
+            cache: the directory storing the cache (see `cobib.database.text_cache.directory`).
+        """
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(text_cache.warm, paths, [command] * len(paths), [cache] * len(paths))
+            )
+        LOGGER.info("Extracted the texts of %d associated files.", results.count(True))
+        failed = results.count(False)
+        if failed:
+            LOGGER.warning("The texts of %d associated files could not be extracted.", failed)
+
     @override
     def render_porcelain(self) -> list[str]:
         output = []
@@ -20,7 +20,7 @@ from collections.abc import Callable
 from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, NamedTuple, TextIO
+from typing import TYPE_CHECKING, Any, NamedTuple, TextIO
 
 from rich.style import Style
 from rich.theme import Theme as RichTheme
@@ -326,19 +326,41 @@ class SearchCommandConfig(_ConfigBase):
     """Whether searches should decode all LaTeX sequences."""
     decode_unicode: bool = False
     """Whether searches should decode all Unicode characters."""
+    extractor: list[str] | None = None
+    """The command used to extract the text of the associated files of entries in the database,
+    specified as a list of strings (for example `["pdftotext", "-layout", "{}", "-"]`). The `{}`
+    argument gets replaced by the path of the file (otherwise, the path gets appended) and the text
+    must be printed to the standard output. When this is set, the extracted texts get cached in the
+    `extracted` directory of `config.database.cache` until the size or modification time of a file
+    changes and are searched directly rather than through `config.commands.search.grep`, which is
+    only used for files whose text could not be extracted. Use `cobib search --warm-cache` to fill
+    the cache ahead of time."""
     fuzziness: int = 0
     """How many fuzzy errors to allow during searches. Using this feature requires the optional
     `regex` dependency to be installed."""
+    full_text_index: bool = False
+    """Whether literal and word-prefix queries should be answered from a full-text index of the
+    searchable text of all entries. Only the candidate entries found in this index get searched.
+    The index is stored in a separate file next to the cache (see `config.database.cache`) with an
+    additional `.search` suffix."""
     grep: str = "grep"
     """The command used to search the associated files of entries in the database. The default tool
     (`grep(1)`) will not provide search results for attached PDF files, but other tools (such as
-    [ripgrep-all](https://github.com/phiresky/ripgrep-all)) will."""
+    [ripgrep-all](https://github.com/phiresky/ripgrep-all)) will. The associated files of all
+    searched entries get passed to as few invocations of this command as possible together with
+    all queries. Thus, it must understand the `-H` and `-e` options of `grep(1)`."""
     grep_args: list[str] = field(default_factory=list)
     """Additional input arguments for the `config.commands.search.grep` command specified as a list
     of strings. Note, that GNU's `grep(1)` understands extended regex patterns even without
     specifying `-E`."""
     ignore_case: bool = False
     """Whether searches should be performed case-insensitive."""
+    parallel: int = 0
+    """The number of processes with which to search many entries in parallel.
+
+    The entries get split into chunks whose searchable texts get searched by separate processes.
+    The results are still reported in the order of the entries. Parallel searching only kicks in
+    for searches over more than 100 entries. Set this to `0` to disable parallel searching."""
     skip_files: bool = False
     """Whether searches should skip looking through associated *files* using
     `config.commands.search.grep`."""
@@ -361,6 +383,15 @@ class SearchCommandConfig(_ConfigBase):
             isinstance(self.decode_unicode, bool),
             "config.commands.search.decode_unicode should be a boolean.",
         )
+        self._assert(
+            self.extractor is None
+            or (
+                isinstance(self.extractor, list)
+                and len(self.extractor) > 0
+                and all(isinstance(arg, str) for arg in self.extractor)
+            ),
+            "config.commands.search.extractor should be a non-empty list of strings or `None`.",
+        )
         self._assert(
             isinstance(self.fuzziness, int) and self.fuzziness >= 0,
             "config.commands.search.fuzziness should be a non-negative integer.",
@@ -373,6 +404,10 @@ class SearchCommandConfig(_ConfigBase):
                 "dependency to be installed! Falling back to `fuzziness=0`."
             )
             self.fuzziness = 0  # pragma: no cover
+        self._assert(
+            isinstance(self.full_text_index, bool),
+            "config.commands.search.full_text_index should be a boolean.",
+        )
         self._assert(
             isinstance(self.grep, str),
             "config.commands.search.grep should be a string.",
@@ -385,6 +420,10 @@ class SearchCommandConfig(_ConfigBase):
             isinstance(self.ignore_case, bool),
             "config.commands.search.ignore_case should be a boolean.",
         )
+        self._assert(
+            isinstance(self.parallel, int) and self.parallel >= 0,
+            "config.commands.search.parallel should be a non-negative integer.",
+        )
         self._assert(
             isinstance(self.skip_files, bool),
             "config.commands.search.skip_files should be a boolean.",
@@ -716,6 +755,14 @@ class EntryStringifyConfig(_ConfigBase):
 class DatabaseConfig(_ConfigBase):
     """The `config.database` section."""
 
+    backend: str = "yaml"
+    """The storage backend of the database file. The default, `"yaml"`, stores all entries in a
+    plain-text YAML file. Setting this to `"sqlite"` stores the entries in an SQLite file instead,
+    which scales better for very large databases. In that case, `file` points to the SQLite file
+    and neither `cache`, nor `journal`, nor `lazy` have any effect. Use `cobib export --yaml` to
+    obtain the plain-text format. Setting this to `"sharded"` splits the entries among multiple
+    YAML files instead (see `shard_by`). In that case, `file` points to a directory and neither
+    `cache`, nor `journal`, nor `lazy` have any effect either. See also `cobib.database`."""
     cache: str | Path | None = "$XDG_CACHE_HOME/cobib/databases/"
     """The path under which to store already parsed databases. Set this to `None` to disable this
     functionality entirely. See also `cobib.database`."""
@@ -726,12 +773,54 @@ class DatabaseConfig(_ConfigBase):
     """The nested section for database formatting settings."""
     git: bool = False
     """Whether to enable the `git(1)` integration, see also `cobib.utils.git`."""
+    indexed_fields: list[str] = field(default_factory=lambda: ["ENTRYTYPE", "journal", "tags"])
+    """The fields whose distinct values get indexed. Filters which only involve these fields (for
+    example `cobib list ++tags toread`) get evaluated on the distinct values of these fields rather
+    than on every entry. The index of a field gets built upon its first use and is stored alongside
+    the cache. Fields with mostly unique values (like `title`) do not benefit from being listed
+    here. See also `cobib.database`."""
+    journal: bool = False
+    """Whether to record changes in an append-only journal file rather than writing them to the
+    database file directly. The journal is stored next to the database file (with an additional
+    `.journal` suffix) and gets replayed on top of the database file whenever it is read. This turns
+    the cost of saving changes from scaling with the size of the database into scaling with the size
+    of the changes. The journal gets folded back into the database file by `cobib lint --compact` or
+    automatically, once it reaches `journal_threshold` records. See also `cobib.database`."""
+    journal_threshold: int = 100
+    """The number of journal records after which the journal gets folded back into the database file
+    automatically. Set this to `0` to disable the automatic compaction."""
+    lazy: bool = False
+    """Whether to construct the entries of the database lazily. When enabled, reading the database
+    only indexes the labels and raw YAML documents of all entries, and each entry gets parsed upon
+    its first access. This speeds up commands which only access a few entries of large databases.
+    The cache (see `cache`) is not used in this mode. Lazy reading is skipped automatically when
+    any hooks are subscribed to `Event.PreYAMLParse` or `Event.PostYAMLParse`. See also
+    `cobib.database`."""
+    numeric_fields: list[str] = field(default_factory=lambda: ["date", "pages", "volume", "year"])
+    """The fields whose numeric or date-like values get indexed in sorted order. Only filters on
+    these fields are interpreted as comparisons (see `cobib.database.range_index.Comparison`) and
+    these (for example `cobib list ++year ">=2015" ++year "<2021"`) get answered with a binary
+    search rather than by visiting every entry. The index of a field gets built upon its first use
+    and is stored alongside the cache. See also `cobib.database`."""
+    shard_by: str = "hash"
+    """How the entries of a sharded database (see `backend`) get partitioned among its shard files.
+    With `"hash"`, the entries are distributed among `shards` files by a hash of their labels. With
+    `"year"`, every shard file stores the entries of a single year. This setting only takes effect
+    when the database gets created by `cobib init`. Afterwards, the partitioning is recorded in the
+    manifest of the database. See also `cobib.database.shards`."""
+    shards: int = 16
+    """The number of shard files of a sharded database which is partitioned by label hashes (see
+    `shard_by`). This setting only takes effect when the database gets created by `cobib init`."""
     stringify: EntryStringifyConfig = field(default_factory=EntryStringifyConfig)
     """The nested section for database string-formatting settings."""
 
     @override
     def validate(self) -> None:
         LOGGER.debug("Validating the DATABASE configuration section.")
+        self._assert(
+            self.backend in ("yaml", "sqlite", "sharded"),
+            'config.database.backend should be one of "yaml", "sqlite", or "sharded".',
+        )
         self._assert(
             self.cache is None or isinstance(self.cache, (str, Path)),
             "config.database.cache should be a string, Path, or `None`.",
@@ -741,6 +830,30 @@ class DatabaseConfig(_ConfigBase):
         )
         self.format.validate()
         self._assert(isinstance(self.git, bool), "config.database.git should be a boolean.")
+        self._assert(
+            isinstance(self.indexed_fields, list)
+            and all(isinstance(name, str) for name in self.indexed_fields),
+            "config.database.indexed_fields should be a list of strings.",
+        )
+        self._assert(isinstance(self.journal, bool), "config.database.journal should be a boolean.")
+        self._assert(
+            isinstance(self.journal_threshold, int) and self.journal_threshold >= 0,
+            "config.database.journal_threshold should be a non-negative integer.",
+        )
+        self._assert(isinstance(self.lazy, bool), "config.database.lazy should be a boolean.")
+        self._assert(
+            isinstance(self.numeric_fields, list)
+            and all(isinstance(name, str) for name in self.numeric_fields),
+            "config.database.numeric_fields should be a list of strings.",
+        )
+        self._assert(
+            self.shard_by in ("hash", "year"),
+            'config.database.shard_by should be either "hash" or "year".',
+        )
+        self._assert(
+            isinstance(self.shards, int) and self.shards > 0,
+            "config.database.shards should be a positive integer.",
+        )
         self.stringify.validate()
 
         self._warn_legacy_path(
@@ -885,6 +998,13 @@ class BibtexParserConfig(_ConfigBase):
 class YAMLParserConfig(_ConfigBase):
     """The `config.parsers.yaml` section."""
 
+    parallel: int = 0
+    """The number of processes with which to parse large YAML files in parallel.
+
+    The file gets split into chunks of complete documents which get parsed by separate processes.
+    The entries are still constructed in their original order. Parallel parsing only kicks in for
+    files with more than 500 entries. Set this to `0` to disable parallel parsing."""
+
     use_c_lib_yaml: bool = True
     """Whether to use the C-based implementation of the YAML parser.
 
@@ -892,6 +1012,20 @@ class YAMLParserConfig(_ConfigBase):
     See the [ruamel.yaml installation instructions](https://yaml.dev/doc/ruamel.yaml/install/) for
     more details."""
 
+    use_fast_dumper: bool = False
+    """Whether to use coBib's purpose-built emitter for writing YAML files.
+
+    This emitter only supports the restricted subset of YAML which is used by coBib's database
+    files and falls back to `ruamel.yaml` for any entry which it cannot handle. Its output is
+    identical to that of `ruamel.yaml` while being faster when saving many entries at once."""
+
+    use_fast_loader: bool = False
+    """Whether to use coBib's purpose-built loader for reading YAML files.
+
+    This loader only supports the restricted subset of YAML which is used by coBib's database
+    files and falls back to `ruamel.yaml` for any document which it cannot handle. Thus, it
+    produces identical results while being faster for large databases."""
+
     @override
     def validate(self) -> None:
         LOGGER.debug("Validating the PARSERS.YAML configuration section.")
@@ -899,6 +1033,18 @@ class YAMLParserConfig(_ConfigBase):
             isinstance(self.use_c_lib_yaml, bool),
             "config.parsers.yaml.use_c_lib_yaml should be a boolean.",
         )
+        self._assert(
+            isinstance(self.use_fast_dumper, bool),
+            "config.parsers.yaml.use_fast_dumper should be a boolean.",
+        )
+        self._assert(
+            isinstance(self.use_fast_loader, bool),
+            "config.parsers.yaml.use_fast_loader should be a boolean.",
+        )
+        self._assert(
+            isinstance(self.parallel, int) and self.parallel >= 0,
+            "config.parsers.yaml.parallel should be a non-negative integer.",
+        )
 
 
 @dataclass
@@ -1136,6 +1282,23 @@ class TagsThemeConfig(_ConfigBase):
 
         return weights
 
+    @property
+    def signature(self) -> tuple[Any, ...]:
+        """Returns a snapshot of all special tag markups.
+
+        This is cheap to compute and compares equal for as long as none of the markups change. It is
+        used to invalidate the memoized markup of `cobib.database.Entry.markup_label`.
+        """
+        return (
+            *(
+                (field_.name, getattr(self, field_.name))
+                for field_ in fields(self)
+                if field_.name != "user_tags"
+            ),
+            # the items get copied such that in-place modifications of the dictionary are detected
+            *self.user_tags.items(),
+        )
+
     @override
     def validate(self) -> None:
         self._assert(
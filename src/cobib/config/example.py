@@ -97,12 +97,31 @@ config.commands.search.context = 1
 config.commands.search.decode_latex = False
 # Whether searches should decode all Unicode characters.
 config.commands.search.decode_unicode = False
+# The command used to extract the text of the associated _files_ of entries in the database,
+# specified as a list of strings (for example `["pdftotext", "-layout", "{}", "-"]`).
+# The `{}` argument gets replaced by the path of the file (otherwise, the path gets appended) and
+# the text must be printed to the standard output.
+# When this is set, the extracted texts get cached in the `extracted` directory of
+# `config.database.cache` until the size or modification time of a file changes and are searched
+# directly rather than through `config.commands.search.grep`, which is only used for files whose
+# text could not be extracted.
+# Use `cobib search --warm-cache` to fill the cache ahead of time.
+config.commands.search.extractor = None
 # How many fuzzy errors to allow during searches.
 # Using this feature requires the optional `regex` dependency to be installed.
 config.commands.search.fuzziness = 0
+# Whether literal and word-prefix queries should be answered from a full-text index of the
+# searchable text of all entries.
+# Only the candidate entries found in this index get searched.
+# The index is stored in a separate file next to the cache (see `config.database.cache`) with an
+# additional `.search` suffix.
+config.commands.search.full_text_index = False
 # The command used to search the associated _files_ of entries in the database.
 # The default tool (_grep(1)_) will not provide search results for attached PDF files, but other
 # tools (such as [ripgrep-all](https://github.com/phiresky/ripgrep-all)) will.
+# The associated files of all searched entries get passed to as few invocations of this command as
+# possible together with all queries.
+# Thus, it must understand the `-H` and `-e` options of _grep(1)_.
 config.commands.search.grep = "grep"
 # Additional input arguments for the `config.commands.search.grep` command specified as a list of
 # strings.
@@ -110,6 +129,11 @@ config.commands.search.grep = "grep"
 config.commands.search.grep_args = []
 # Whether searches should be performed case-insensitive.
 config.commands.search.ignore_case = False
+# The number of processes with which to search many entries in parallel.
+# The entries get split into chunks whose searchable texts get searched by separate processes.
+# The results are still reported in the order of the entries. Parallel searching only kicks in for
+# searches over more than 100 entries. Set this to `0` to disable parallel searching.
+config.commands.search.parallel = 0
 # Whether searches should skip looking through associated _files_ using
 # `config.commands.search.grep`.
 config.commands.search.skip_files = False
@@ -125,6 +149,15 @@ config.commands.show.encode_latex = True
 
 # DATABASE
 
+# The storage backend of the database file. The default, `"yaml"`, stores all entries in a
+# plain-text YAML file. Setting this to `"sqlite"` stores the entries in an SQLite file instead,
+# which scales better for very large databases. In that case, `file` points to the SQLite file and
+# neither `cache`, nor `journal`, nor `lazy` have any effect. Use `cobib export --yaml` to obtain
+# the plain-text format. Setting this to `"sharded"` splits the entries among multiple YAML files
+# instead (see `shard_by`). In that case, `file` points to a directory and neither `cache`, nor
+# `journal`, nor `lazy` have any effect either. See also `cobib.database`.
+config.database.backend = "yaml"
+
 # The path under which to store already parsed databases. Set this to `None` to disable this
 # functionality entirely. See also `cobib.database`.
 config.database.cache = "$XDG_CACHE_HOME/cobib/databases/"
@@ -136,6 +169,49 @@ config.database.file = "$XDG_DATA_HOME/cobib/literature.yaml"
 # Whether to enable the _git(1)_ integration, see also `cobib.utils.git`.
 config.database.git = False
 
+# The fields whose distinct values get indexed. Filters which only involve these fields (for example
+# `cobib list ++tags toread`) get evaluated on the distinct values of these fields rather than on
+# every entry. The index of a field gets built upon its first use and is stored alongside the cache.
+# Fields with mostly unique values (like `title`) do not benefit from being listed here. See also
+# `cobib.database`.
+config.database.indexed_fields = ["ENTRYTYPE", "journal", "tags"]
+
+# Whether to record changes in an append-only journal file rather than writing them to the database
+# file directly. The journal is stored next to the database file (with an additional `.journal`
+# suffix) and gets replayed on top of the database file whenever it is read. This turns the cost of
+# saving changes from scaling with the size of the database into scaling with the size of the
+# changes. The journal gets folded back into the database file by `cobib lint --compact` or
+# automatically, once it reaches `journal_threshold` records. See also `cobib.database`.
+config.database.journal = False
+
+# The number of journal records after which the journal gets folded back into the database file
+# automatically. Set this to `0` to disable the automatic compaction.
+config.database.journal_threshold = 100
+
+# Whether to construct the entries of the database lazily. When enabled, reading the database only
+# indexes the labels and raw YAML documents of all entries, and each entry gets parsed upon its
+# first access. This speeds up commands which only access a few entries of large databases. The
+# cache (see `cache`) is not used in this mode. Lazy reading is skipped automatically when any hooks
+# are subscribed to `Event.PreYAMLParse` or `Event.PostYAMLParse`. See also `cobib.database`.
+config.database.lazy = False
+
+# The fields whose numeric or date-like values get indexed in sorted order. Comparison filters (for
+# example `cobib list ++year ">=2015" ++year "<2021"`) on these fields get answered with a binary
+# search rather than by visiting every entry. The index of a field gets built upon its first use and
+# is stored alongside the cache. See also `cobib.database`.
+config.database.numeric_fields = ["date", "pages", "volume", "year"]
+
+# How the entries of a sharded database (see `backend`) get partitioned among its shard files.
+# With `"hash"`, the entries are distributed among `shards` files by a hash of their labels. With
+# `"year"`, every shard file stores the entries of a single year. This setting only takes effect
+# when the database gets created by `cobib init`. Afterwards, the partitioning is recorded in the
+# manifest of the database. See also `cobib.database.shards`.
+config.database.shard_by = "hash"
+
+# The number of shard files of a sharded database which is partitioned by label hashes (see
+# `shard_by`). This setting only takes effect when the database gets created by `cobib init`.
+config.database.shards = 16
+
 # DATABASE.FORMAT
 
 # How the `author` field of an entry gets stored.
@@ -221,12 +297,30 @@ config.parsers.bibtex.ignore_non_standard_types = False
 
 # PARSERS.YAML
 
+# The number of processes with which to parse large YAML files in parallel.
+# The file gets split into chunks of complete documents which get parsed by separate processes. The
+# entries are still constructed in their original order. Parallel parsing only kicks in for files
+# with more than 500 entries. Set this to `0` to disable parallel parsing.
+config.parsers.yaml.parallel = 0
+
 # Whether to use the C-based implementation of the YAML parser.
 # This **significantly** improves the performance but may require additional installation steps.
 # See the [ruamel.yaml installation instructions](https://yaml.dev/doc/ruamel.yaml/install/) for
 # more details.
 config.parsers.yaml.use_c_lib_yaml = True
 
+# Whether to use coBib's purpose-built emitter for writing YAML files.
+# This emitter only supports the restricted subset of YAML which is used by coBib's database files
+# and falls back to `ruamel.yaml` for any entry which it cannot handle. Its output is identical to
+# that of `ruamel.yaml` while being faster when saving many entries at once.
+config.parsers.yaml.use_fast_dumper = False
+
+# Whether to use coBib's purpose-built loader for reading YAML files.
+# This loader only supports the restricted subset of YAML which is used by coBib's database files
+# and falls back to `ruamel.yaml` for any document which it cannot handle. Thus, it produces
+# identical results while being faster for large databases.
+config.parsers.yaml.use_fast_loader = False
+
 # SHELL
 
 # The path under which to store the history of executed shell commands. Set this to `None` to
@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
 import logging
+import mmap
+import os
 import pickle
-import re
+import struct
 import sys
 from collections import OrderedDict
+from collections.abc import Collection, ItemsView, Iterable, Iterator, Mapping, ValuesView
 from pathlib import Path
-from typing import ClassVar, cast
+from typing import Any, ClassVar, cast
 
-from cobib.config import LabelSuffix, config
+from cobib.config import Event, config
 from cobib.utils.logging import HINT
 from cobib.utils.rel_path import RelPath
 
 from .entry import Entry
+from .identifier_index import IdentifierIndex
+from .label_index import LabelIndex
+from .range_index import RangeIndex
+from .search_index import SearchIndex
+from .shards import ShardedBackend
+from .sort_index import SortIndex
+from .sqlite import SQLiteBackend
+from .value_index import ValueIndex
 
 LOGGER = logging.getLogger(__name__)
 """@private module logger."""
@@ -37,6 +51,104 @@ class Database(OrderedDict[str, Entry]):
     Otherwise it is set to the label of the changed entry (which may be different from the previous
     label, indicating a renaming of the entry)."""
 
+    _entry_spans: ClassVar[dict[str, tuple[int, int]]] = {}
+    """An index of the byte ranges at which each entry is stored in the database file. The keys are
+    the entry labels and the values are the pairs of start and end positions of their YAML
+    documents as computed by `cobib.parsers.YAMLParser.index_documents`. This allows
+    `Database.save` to replace only the changed entries without having to scan the entire file."""
+
+    _entry_spans_stat: ClassVar[tuple[int, int] | None] = None
+    """The size and modification time of the database file at the time at which
+    `Database._entry_spans` was computed. This is used to detect external changes of the file which
+    invalidate the index."""
+
+    _entry_digests: ClassVar[dict[str, bytes]] = {}
+    """The content digests of the YAML documents of all entries in the database file. The keys are
+    the entry labels (in the order in which they occur in the file) and the values are computed by
+    `Database._digest_documents`. These are stored alongside the cache in order to validate it
+    against the contents of the database file."""
+
+    _journaled_entries: ClassVar[dict[str, str | None]] = {}
+    """A dictionary of changed entries which have been recorded in the journal file but have not
+    been folded into the database file, yet. Its structure is identical to
+    `Database._unsaved_entries` with the keys being the labels as they occur in the database
+    file."""
+
+    _journal_records: ClassVar[int] = 0
+    """The number of records currently stored in the journal file."""
+
+    _JOURNAL_MARKER: ClassVar[str] = "#> "
+    """The prefix of the lines in the journal file which start a new record."""
+
+    _lazy: ClassVar[bool] = False
+    """Indicates whether the database has been read lazily (see
+    `cobib.config.config.DatabaseConfig.lazy`) or from the cache. In this case, entries which have
+    not been accessed yet are stored as their raw YAML documents (`bytes`) or as their serialized
+    cache records (`memoryview`) and only get constructed upon their first access."""
+
+    _CACHE_MAGIC: ClassVar[bytes] = b"COBIBDB\x00"
+    """The magic bytes with which every cache file starts."""
+
+    _CACHE_VERSION: ClassVar[int] = 6
+    """The version of the cache file format. Cache files written with a different version are
+    treated as outdated."""
+
+    _CACHE_HEADER: ClassVar[struct.Struct] = struct.Struct("<8sI")
+    """The layout of the header of the cache file: the magic bytes and the format version."""
+
+    _CACHE_TRAILER: ClassVar[struct.Struct] = struct.Struct("<QQ")
+    """The layout of the trailer of the cache file: the offset and length of the cache index."""
+
+    _cache_records: ClassVar[dict[str, tuple[int, int]]] = {}
+    """The index of the cache file as it was last read or written. The keys are the entry labels and
+    the values are the pairs of offset and length of their serialized records."""
+
+    _cache_stat: ClassVar[tuple[int, int] | None] = None
+    """The size and modification time of the cache file at the time at which
+    `Database._cache_records` was read or written. This is used to detect whether the cache file
+    can be updated in-place."""
+
+    _cache_digests: ClassVar[dict[str, bytes]] = {}
+    """The document digests (see `Database._entry_digests`) stored in the cache file as it was last
+    read or written."""
+
+    _cache_file_stat: ClassVar[tuple[int, int] | None] = None
+    """The size and modification time of the database file (see `Database._entry_spans_stat`)
+    stored in the cache file as it was last read or written."""
+
+    _written_files: ClassVar[set[Path]] = set()
+    """The files which have been written by `Database.save` since they were last retrieved by
+    `Database.pop_written_files`. This is only used by the sharded backend (see
+    `cobib.config.config.DatabaseConfig.backend`) in order to stage only the touched shard files."""
+
+    _sort_index: ClassVar[SortIndex] = SortIndex()
+    """The natural sort orders of the entries by some of their fields (see
+    `Database.sorted_labels`). These are maintained incrementally by `Database.update`,
+    `Database.pop` and `Database.rename` and get stored alongside the cache."""
+
+    _value_index: ClassVar[ValueIndex] = ValueIndex()
+    """The inverted index of the values of the fields listed in
+    `cobib.config.config.DatabaseConfig.indexed_fields` (see `Database.value_index`). It is
+    maintained and stored just like `Database._sort_index`."""
+
+    _range_index: ClassVar[RangeIndex] = RangeIndex()
+    """The sorted index of the numeric and date-like values of the fields listed in
+    `cobib.config.config.DatabaseConfig.numeric_fields` (see `Database.range_index`). It is
+    maintained and stored just like `Database._sort_index`."""
+
+    _label_index: ClassVar[LabelIndex] = LabelIndex()
+    """The index of all labels by their base labels without a disambiguation suffix (see
+    `Database.label_index`). It is maintained and stored just like `Database._sort_index`."""
+
+    _identifier_index: ClassVar[IdentifierIndex] = IdentifierIndex()
+    """The index of the normalized DOIs, arXiv IDs, ISBNs and URLs of all entries (see
+    `Database.identifier_index`). It is maintained and stored just like `Database._sort_index`."""
+
+    _search_index: ClassVar[SearchIndex] = SearchIndex()
+    """The full-text index of the searchable text of all entries (see `Database.search_index`). It
+    is maintained just like `Database._sort_index` but gets stored in a separate file next to the
+    cache (see `Database._get_search_index_file`)."""
+
     _read: bool = False
     """Indicates whether the database has already been read. This state is purely used to avoid an
     endless recursion during the class construction. If this state if `False`, the `__new__` method
@@ -61,6 +173,65 @@ class Database(OrderedDict[str, Entry]):
             cls.read(bypass_cache=bypass_cache)
         return cls._instance
 
+    def __getitem__(self, label: str) -> Entry:
+        """Returns the entry pointed to by the given label.
+
+        If the database has been read lazily and the entry has not been accessed before, it gets
+        constructed from its raw YAML document or cache record and replaces the latter in-place.
+
+        Args:
+            label: the label of the entry.
+
+        Returns:
+            The entry pointed to by the given label.
+        """
+        entry: Entry | bytes | memoryview = super().__getitem__(label)
+        if isinstance(entry, (bytes, memoryview)):
+            entry = self._construct(label, entry)
+            super().__setitem__(label, entry)
+        return entry
+
+    def get(self, label: str, default: Any = None) -> Any:
+        """Returns the entry pointed to by the given label or a default value.
+
+        This function wraps `OrderedDict.get` in order to ensure lazily read entries get
+        constructed.
+
+        Args:
+            label: the label of the entry.
+            default: the value to return if no entry with the given label exists.
+
+        Returns:
+            The entry pointed to by the given label or the default value.
+        """
+        if label not in self:
+            return default
+        return self[label]
+
+    def values(self) -> ValuesView[Entry]:  # type: ignore[override]
+        """Returns a view of the entries in this database.
+
+        If the database has been read lazily, iterating this view constructs the entries on the fly.
+
+        Returns:
+            The view of all entries.
+        """
+        if Database._lazy:
+            return ValuesView(self)
+        return super().values()
+
+    def items(self) -> ItemsView[str, Entry]:  # type: ignore[override]
+        """Returns a view of the labels and entries in this database.
+
+        If the database has been read lazily, iterating this view constructs the entries on the fly.
+
+        Returns:
+            The view of all label-entry pairs.
+        """
+        if Database._lazy:
+            return ItemsView(self)
+        return super().items()
+
     def update(self, new_entries: dict[str, Entry]) -> None:  # type: ignore[override]
         """Updates the database with the given dictionary of entries.
 
@@ -76,6 +247,10 @@ class Database(OrderedDict[str, Entry]):
             LOGGER.debug("Updating entry %s", label)
             Database._unsaved_entries[label] = label
         super().update(new_entries)
+        for index in Database._maintained_indexes():
+            if index:
+                for label, entry in new_entries.items():
+                    index.update(label, entry)
 
     def pop(self, label: str) -> Entry:  # type: ignore[override]
         """Pops the entry pointed to by the given label.
@@ -90,9 +265,13 @@ class Database(OrderedDict[str, Entry]):
         Returns:
             The entry pointed to by the given label.
         """
-        entry: Entry = super().pop(label)
+        entry: Entry | bytes | memoryview = super().pop(label)
+        if isinstance(entry, (bytes, memoryview)):
+            entry = self._construct(label, entry)
         LOGGER.debug("Removing entry: %s", label)
         Database._unsaved_entries[label] = None
+        for index in Database._maintained_indexes():
+            index.remove(label)
         return entry
 
     def rename(self, old_label: str, new_label: str) -> None:
@@ -112,6 +291,8 @@ class Database(OrderedDict[str, Entry]):
             # database linting with "fake" renames in order to register entries for re-writing
             # during saving
             super().pop(old_label)
+            for index in Database._maintained_indexes():
+                index.remove(old_label)
 
     def disambiguate_label(self, label: str, entry: Entry) -> str:
         """Disambiguate a given label to ensure it becomes unique.
@@ -141,22 +322,27 @@ class Database(OrderedDict[str, Entry]):
 
         LOGGER.warning("The label '%s' already exists in database. Running disambiguation.", label)
         separator, enumerator = config.database.format.label_suffix
+        index = self.label_index()
         offset = 0
         while True:
-            offset += 1
+            # NOTE: the label index knows all suffixes which are in use for this label but a label
+            # whose suffix cannot be trimmed (e.g. beyond `z`) may still collide
+            offset = index.free_suffix(label, offset + 1)
             new_label: str = label + separator + enumerator(offset)  # type: ignore[operator]
             if new_label not in self.keys():
-                LOGGER.info("Found new unique label: %s", new_label)
-                return new_label
+                break
+        if offset > 1:
             LOGGER.log(
                 HINT,
                 "The label '%s' also already exists in the database. You are seeing this because "
                 "you are running a disambiguation of the label '%s'. You may want to check whether "
                 "these two entries are related and (if so) edit or merge them manually. For more "
                 "information see also: https://gitlab.com/cobib/cobib/-/issues/121",
-                new_label,
+                label + separator + enumerator(offset - 1),  # type: ignore[operator]
                 label,
             )
+        LOGGER.info("Found new unique label: %s", new_label)
+        return new_label
 
     def find_related_labels(self, label: str) -> tuple[set[str], set[str]]:
         """Finds related labels to the provided one.
@@ -171,22 +357,331 @@ class Database(OrderedDict[str, Entry]):
             labels, i.e. ones which also start with the same text as the original label but do not
             have a matching suffix.
         """
-        separator, enumerator = config.database.format.label_suffix
-        trimmed_label, _ = LabelSuffix.trim_label(label, separator, enumerator)
+        trimmed_label, _ = LabelIndex.trim(label)
+        return self.label_index().related(trimmed_label)
 
-        directly_related_labels = set()
-        indirectly_related_labels = set()
-        for existing_label in self.keys():
-            if not existing_label.startswith(trimmed_label):
-                continue
+    @classmethod
+    def _stored(cls) -> OrderedDict[str, Entry | bytes | memoryview]:
+        """Returns the database with the types of its stored values.
+
+        Lazily read entries are stored as their raw YAML documents (`bytes`) or cache records
+        (`memoryview`) until they get accessed for the first time (see `Database.__getitem__`).
+        The methods of `OrderedDict` must be called on the result explicitly in order to bypass the
+        construction of these entries.
+
+        Returns:
+            The database instance.
+        """
+        return cast("OrderedDict[str, Entry | bytes | memoryview]", cls._instance)
+
+    @staticmethod
+    def _construct(label: str, document: bytes | memoryview) -> Entry:
+        """Constructs a lazily read entry from its raw YAML document or cache record.
+
+        Args:
+            label: the label of the entry.
+            document: the raw YAML document of the entry or its serialized cache record.
+
+        Returns:
+            The constructed entry.
+        """
+        LOGGER.debug("Constructing the lazily read entry: %s", label)
+
+        if isinstance(document, memoryview):
+            return cast(Entry, pickle.loads(document))
+
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        return YAMLParser().parse_document(document.decode("utf-8"))
+
+    @classmethod
+    def materialize(cls) -> None:
+        """Constructs all entries which have not been accessed since reading the database lazily.
+
+        This method does nothing, if the database has not been read lazily.
+        """
+        if not cls._lazy or cls._instance is None:
+            return
+        for _ in cls._instance.values():
+            pass
+
+    @classmethod
+    def sorted_labels(cls, field: str, *, reverse: bool = False) -> Iterator[str]:
+        """Iterates the labels of all entries sorted naturally by one of their fields.
+
+        This yields the labels in the same order as sorting the entries with `natsort.natsorted` by
+        their stringified field values (see `Entry.stringify_field`). However, the sort keys of all
+        entries are indexed per field: the index of a field gets built upon its first use, is kept
+        up-to-date by `Database.update`, `Database.pop` and `Database.rename` and gets stored
+        alongside the cache (see `Database.save_cache`). Thus, only the first sort by a field needs
+        to stringify all entries and the labels can be taken from the index one by one.
+
+        Args:
+            field: the name of the field by which to sort.
+            reverse: whether to sort in descending order. Entries with identical field values keep
+                their relative order nonetheless.
+
+        Returns:
+            An iterator over the sorted labels.
+        """
+        if field not in cls._sort_index:
+            cls._sort_index.build(field, cls._unmaterialized_items())
+            cls._store_indexes()
+        return cls._sort_index.walk(field, reverse=reverse)
+
+    @classmethod
+    def value_index(cls, fields: Iterable[str]) -> ValueIndex | None:
+        """Returns the inverted index of the values of the given fields.
+
+        The index of a field gets built upon its first use, is kept up-to-date by `Database.update`,
+        `Database.pop` and `Database.rename` and gets stored alongside the cache (see
+        `Database.save_cache`). It allows filters to be evaluated without visiting every entry (see
+        `cobib.database.filter_plan.FilterPlan.select`).
+
+        Args:
+            fields: the names of the fields.
+
+        Returns:
+            The value index covering all of the given fields or `None`, if any of them is not listed
+            in `cobib.config.config.DatabaseConfig.indexed_fields`.
+        """
+        fields = set(fields)
+        if not fields.issubset(config.database.indexed_fields):
+            return None
+        missing = [field for field in sorted(fields) if field not in cls._value_index]
+        for field in missing:
+            cls._value_index.build(field, cls._unmaterialized_items())
+        if missing:
+            cls._store_indexes()
+        return cls._value_index
+
+    @classmethod
+    def tag_index(cls) -> Mapping[str, Collection[str]] | None:
+        """Returns the labels of the entries carrying every tag in the database.
+
+        This is the part of the value index (see `Database.value_index`) covering the `tags` field.
+        As such, it is kept up-to-date as entries change rather than requiring a scan over all
+        entries.
+
+        Returns:
+            A read-only mapping of all tags to the labels of the entries carrying them or `None`, if
+            the `tags` field is not listed in `cobib.config.config.DatabaseConfig.indexed_fields`.
+        """
+        index = cls.value_index(["tags"])
+        if index is None:
+            return None
+        return index.elements("tags")
+
+    @classmethod
+    def range_index(cls, fields: Iterable[str]) -> RangeIndex | None:
+        """Returns the sorted index of the numeric and date-like values of the given fields.
+
+        The index of a field gets built upon its first use, is kept up-to-date by `Database.update`,
+        `Database.pop` and `Database.rename` and gets stored alongside the cache (see
+        `Database.save_cache`). It allows comparison filters (like `++year ">=2015"`) to be
+        answered with a binary search (see `cobib.database.filter_plan.FilterPlan.select`).
+
+        Args:
+            fields: the names of the fields.
+
+        Returns:
+            The range index covering all of the given fields or `None`, if any of them is not listed
+            in `cobib.config.config.DatabaseConfig.numeric_fields`.
+        """
+        fields = set(fields)
+        if not fields.issubset(config.database.numeric_fields):
+            return None
+        missing = [field for field in sorted(fields) if field not in cls._range_index]
+        for field in missing:
+            cls._range_index.build(field, cls._unmaterialized_items())
+        if missing:
+            cls._store_indexes()
+        return cls._range_index
+
+    @classmethod
+    def label_index(cls) -> LabelIndex:
+        """Returns the index of all labels by their base labels.
+
+        The index gets built upon its first use (and again after
+        `cobib.config.config.DatabaseFormatConfig.label_suffix` has changed), is kept up-to-date by
+        `Database.update`, `Database.pop` and `Database.rename` and gets stored alongside the cache
+        (see `Database.save_cache`).
+
+        Returns:
+            The label index.
+        """
+        if not cls._label_index.is_current():
+            cls._label_index.build(cls._instance.keys() if cls._instance is not None else ())
+            cls._store_indexes()
+        return cls._label_index
+
+    @classmethod
+    def identifier_index(cls) -> IdentifierIndex:
+        """Returns the index of the normalized identifiers of all entries.
+
+        The index gets built upon its first use, is kept up-to-date by `Database.update`,
+        `Database.pop` and `Database.rename` and gets stored alongside the cache (see
+        `Database.save_cache`). It allows existing entries to be found by their DOI, arXiv ID, ISBN
+        or URL without visiting every entry (see `cobib.commands.AddCommand`).
+
+        Returns:
+            The identifier index.
+        """
+        if not cls._identifier_index:
+            cls._identifier_index.build(cls._unmaterialized_items())
+            cls._store_indexes()
+        return cls._identifier_index
+
+    @classmethod
+    def search_index(cls) -> SearchIndex | None:
+        """Returns the full-text index of the searchable text of all entries.
+
+        The index gets loaded from its file next to the cache (see
+        `Database._get_search_index_file`) or built upon its first use, is kept up-to-date by
+        `Database.update`, `Database.pop` and `Database.rename` and gets stored again whenever it
+        has been modified. Entries which have changed since the index was stored as well as entries
+        whose note files have been modified get indexed anew. The index allows literal and
+        word-prefix queries to be answered without searching every entry (see
+        `cobib.commands.SearchCommand`).
+
+        Returns:
+            The search index or `None`, if it is disabled via
+            `cobib.config.config.SearchCommandConfig.full_text_index` or if hooks are subscribed to
+            `Event.PreBibtexDump` or `Event.PostBibtexDump` which may alter the searchable text.
+        """
+        if (
+            not config.commands.search.full_text_index
+            or config.events.get(Event.PreBibtexDump)
+            or config.events.get(Event.PostBibtexDump)
+        ):
+            return None
+        _instance = cls._instance if cls._instance is not None else cls()
+        if not cls._search_index.is_current():
+            cls._load_search_index()
+        if not cls._search_index.is_current():
+            cls._search_index.build(cls._unmaterialized_items())
+        cls._search_index.refresh(_instance.__getitem__)
+        cls._store_search_index()
+        return cls._search_index
+
+    @classmethod
+    def _indexes(
+        cls,
+    ) -> dict[str, SortIndex | ValueIndex | RangeIndex | LabelIndex | IdentifierIndex]:
+        """Returns all indexes which are maintained for the entries of this database.
+
+        Returns:
+            The indexes keyed by the names under which they get stored alongside the cache.
+        """
+        return {
+            "sort": cls._sort_index,
+            "value": cls._value_index,
+            "range": cls._range_index,
+            "label": cls._label_index,
+            "identifier": cls._identifier_index,
+        }
+
+    @classmethod
+    def _maintained_indexes(
+        cls,
+    ) -> list[SortIndex | ValueIndex | RangeIndex | LabelIndex | IdentifierIndex | SearchIndex]:
+        """Returns all indexes which are maintained for the entries of this database.
+
+        Returns:
+            The indexes stored alongside the cache (see `Database._indexes`) and the search index.
+        """
+        return [*cls._indexes().values(), cls._search_index]
+
+    @classmethod
+    def _unmaterialized_items(cls) -> Iterator[tuple[str, Entry]]:
+        """Iterates all entries without materializing lazily read ones.
 
-            raw_label, _ = LabelSuffix.trim_label(existing_label, separator, enumerator)
-            if raw_label == trimmed_label:
-                directly_related_labels.add(existing_label)
+        Entries which have not been accessed yet get constructed on the fly but do not replace their
+        raw YAML documents or cache records. This keeps the cache records of unchanged entries
+        reusable by `Database.save_cache`.
+
+        Yields:
+            The pairs of labels and entries of the entire database in its order.
+        """
+        _instance = cls._instance if cls._instance is not None else cls()
+        for label, entry in OrderedDict.items(_instance):
+            if isinstance(entry, (bytes, memoryview)):
+                yield label, cls._construct(label, entry)
             else:
-                indirectly_related_labels.add(existing_label)
+                yield label, entry
+
+    @classmethod
+    def _store_indexes(cls) -> None:
+        """Stores newly built indexes alongside the cache.
+
+        This is skipped while any changes have not been written to the database file, yet, because
+        the cache must reflect the contents of the latter.
+        """
+        if (
+            config.database.backend == "yaml"
+            and not cls._unsaved_entries
+            and not cls._journaled_entries
+        ):
+            cls.save_cache()
 
-        return directly_related_labels, indirectly_related_labels
+    @classmethod
+    def _load_search_index(cls) -> None:
+        """Loads the search index from its file next to the cache.
+
+        The stored index gets validated against the content digests of the YAML documents of all
+        entries (see `Database._entry_digests`) just like the cache itself (see
+        `Database.read_cache`). Entries with unsaved or journaled changes are treated as outdated.
+        """
+        file = cls._get_search_index_file()
+        if file is None or config.database.backend != "yaml" or not file.exists():
+            return
+        LOGGER.debug("Reading the full-text search index from %s", str(file))
+        try:
+            version, digests, state = pickle.loads(file.read_bytes())
+        except Exception as exc:
+            LOGGER.info("Ignoring the corrupted full-text search index: %s", exc)
+            return
+        if version != cls._CACHE_VERSION:
+            return
+        _instance = cast(Database, cls._instance)
+        labels = list(OrderedDict.keys(_instance))
+        outdated = {
+            label
+            for label in labels
+            if label not in digests or digests[label] != cls._entry_digests.get(label, None)
+        }
+        outdated.update(cls._journaled_entries)
+        outdated.update(label for label in cls._unsaved_entries.values() if label is not None)
+        cls._search_index.load(state, labels, _instance.__getitem__, outdated)
+
+    @classmethod
+    def _store_search_index(cls) -> None:
+        """Stores the search index in its file next to the cache, if it has been modified.
+
+        Just like `Database._store_indexes`, this is skipped while any changes have not been written
+        to the database file, yet, because the content digests of the YAML documents of all entries
+        (see `Database._entry_digests`) get stored alongside the index.
+        """
+        file = cls._get_search_index_file()
+        if (
+            file is None
+            or not cls._search_index.modified
+            or config.database.backend != "yaml"
+            or cls._unsaved_entries
+            or cls._journaled_entries
+        ):
+            return
+        LOGGER.debug("Storing the full-text search index in %s", str(file))
+        file.parent.mkdir(parents=True, exist_ok=True)
+        target = file.with_name(file.name + ".tmp")
+        target.write_bytes(
+            pickle.dumps(
+                (cls._CACHE_VERSION, cls._entry_digests, cls._search_index.dump()),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+        os.replace(target, file)
+        cls._search_index.modified = False
 
     @classmethod
     def reset(cls) -> None:
@@ -196,6 +691,19 @@ class Database(OrderedDict[str, Entry]):
         """
         if cls._instance is not None:  # pragma: no branch
             cls._instance.clear()
+        cls._entry_spans = {}
+        cls._entry_spans_stat = None
+        cls._entry_digests = {}
+        cls._journaled_entries = {}
+        cls._journal_records = 0
+        cls._lazy = False
+        cls._cache_records = {}
+        cls._cache_stat = None
+        cls._cache_digests = {}
+        cls._cache_file_stat = None
+        cls._written_files = set()
+        for index in cls._maintained_indexes():
+            index.clear()
         cls._read = False
 
     @classmethod
@@ -209,6 +717,22 @@ class Database(OrderedDict[str, Entry]):
         *irreversibly* synchronizes the state of the runtime `Database` instance to the actually
         written contents of the database file on disc.
 
+        If a journal file exists (see `cobib.config.config.DatabaseConfig.journal`), its records get
+        replayed on top of the contents of the database file.
+
+        If `cobib.config.config.DatabaseConfig.lazy` is enabled, the entries do not get parsed but
+        only their raw YAML documents are stored. The actual entries get constructed upon their
+        first access (see also `Database.materialize`).
+
+        If `cobib.config.config.DatabaseConfig.backend` is set to `"sqlite"`, the entries get read
+        from an SQLite file instead (see `cobib.database.sqlite.SQLiteBackend`). Neither the cache,
+        nor the journal, nor lazy reading are used in this case.
+
+        If `cobib.config.config.DatabaseConfig.backend` is set to `"sharded"`, the entries get read
+        from all shard files of the database directory instead (see
+        `cobib.database.shards.ShardedBackend`). Again, neither the cache, nor the journal, nor lazy
+        reading are used in this case.
+
         Args:
             bypass_cache: whether or not to try reading the cache. Set this to `True` to bypass the
                 cache no matter its age or the user configuration.
@@ -217,10 +741,25 @@ class Database(OrderedDict[str, Entry]):
             cls.__new__(cls, bypass_cache=bypass_cache)
             return
         _instance = cls._instance
+        cls._lazy = False
+        for index in cls._maintained_indexes():
+            index.clear()
+
+        if config.database.backend == "sqlite":
+            cls._read_sqlite()
+            return
+
+        if config.database.backend == "sharded":
+            cls._read_sharded()
+            return
 
         try:
             if bypass_cache:
                 raise CacheError("Bypassing the cache.")
+            if config.database.lazy:
+                exc = CacheError("the cache is not used when reading the database lazily")
+                exc.log_level = logging.DEBUG
+                raise exc
             Database.read_cache()
         except CacheError as exc:
             LOGGER.log(
@@ -235,7 +774,18 @@ class Database(OrderedDict[str, Entry]):
 
                 cls._read = True
                 _instance.clear()
-                _instance.update(YAMLParser().parse(file))
+                data = file.read_bytes()
+                spans = YAMLParser.index_documents(data)
+                cls._set_entry_spans(file, spans, cls._digest_documents(data, spans))
+                if cls._can_read_lazily(data, spans):
+                    LOGGER.debug("Reading the database lazily.")
+                    cls._lazy = True
+                    OrderedDict.update(
+                        _instance,
+                        ((label, data[start:end]) for label, (start, end) in spans.items()),
+                    )
+                else:
+                    _instance.update(YAMLParser().parse(file))
             except FileNotFoundError:
                 LOGGER.critical(
                     "The database file %s does not exist! Please run `cobib init`!", file
@@ -245,28 +795,178 @@ class Database(OrderedDict[str, Entry]):
             Database.save_cache()
 
         cls._unsaved_entries.clear()
+        cls._replay_journal()
+
+    @classmethod
+    def _read_sqlite(cls) -> None:
+        """Reads all entries from the SQLite database file.
+
+        See `Database.read` for more details.
+        """
+        _instance = cast(Database, cls._instance)
+        file = RelPath(config.database.file).path
+        if not file.exists():
+            LOGGER.critical("The database file %s does not exist! Please run `cobib init`!", file)
+            sys.exit(1)
+
+        LOGGER.info("Loading SQLite database file: %s", file)
+        cls._read = True
+        _instance.clear()
+        _instance.update({label: Entry(label, data) for label, data in SQLiteBackend(file).read()})
+        cls._unsaved_entries.clear()
+
+    @classmethod
+    def _read_sharded(cls) -> None:
+        """Reads all entries from the shard files of the database directory.
+
+        See `Database.read` for more details.
+        """
+        _instance = cast(Database, cls._instance)
+        directory = RelPath(config.database.file).path
+        backend = ShardedBackend(directory)
+        if not backend.exists():
+            LOGGER.critical(
+                "The database directory %s does not exist! Please run `cobib init`!", directory
+            )
+            sys.exit(1)
+
+        LOGGER.info("Loading sharded database directory: %s", directory)
+        cls._read = True
+        _instance.clear()
+        _instance.update(backend.read())
+        cls._unsaved_entries.clear()
+
+    @staticmethod
+    def _can_read_lazily(data: bytes, spans: dict[str, tuple[int, int]]) -> bool:
+        """Checks whether the database can be read lazily.
+
+        Args:
+            data: the raw (binary) contents of the database file.
+            spans: the index of the entry documents in the database file.
+
+        Returns:
+            Whether lazy reading is enabled and safe to use.
+        """
+        if not config.database.lazy:
+            return False
+
+        if config.events.get(Event.PreYAMLParse) or config.events.get(Event.PostYAMLParse):
+            LOGGER.info(
+                "Not reading the database lazily because hooks are subscribed to the YAML parsing."
+            )
+            return False
+
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        if YAMLParser.count_documents(data) != len(spans):
+            LOGGER.warning(
+                "Not reading the database lazily because not all of its documents could be indexed "
+                "unambiguously. Please run `cobib lint` to check the database for problems."
+            )
+            return False
+
+        return True
 
     @classmethod
     def save(cls) -> None:
         """Saves all unsaved entries.
 
-        This uses `cobib.parsers.YAMLParser` to save all entries in `Database._unsaved_entries` to
-        disc. In doing so, this function preserves the order of the entries in the database file by
-        overwriting changed entries in-place and appending new entries to the end of the file.
-
-        The method of determining whether an entry was added, changed or removed is the following:
-        1. we read in the current database as written to disc.
-        2. we iterate all lines and determine the label of the entry we are currently on.
-        3. if this label is not in `Database._unsaved_entries` we continue.
-        4. Otherwise we query the runtime `Database` instance for the new contents of the unsaved
-           (and therefore changed) entry and remove the label from `Database._unsaved_entries`.
-        5. Using `Entry.save` and a `cobib.parsers.YAMLParser` we overwrite the previous lines of
-           the changed entry.
-        6. Finally, all labels still left in `Database._unsaved_entries` are newly added entries and
+        If `cobib.config.config.DatabaseConfig.journal` is enabled, the changes get appended to the
+        journal file (see `Database.get_journal_file`) and the database file itself remains
+        untouched. Once the journal contains
+        `cobib.config.config.DatabaseConfig.journal_threshold` records, it gets folded into the
+        database file via `Database.compact`. If journaling is disabled but a journal still exists,
+        it gets compacted together with the new changes.
+
+        Otherwise, this uses `cobib.parsers.YAMLParser` to save all entries in
+        `Database._unsaved_entries` to disc. In doing so, this function preserves the order of the
+        entries in the database file by overwriting changed entries in-place and appending new
+        entries to the end of the file.
+
+        The method of determining where an entry is located in the file is the following:
+        1. upon reading the database, `cobib.parsers.YAMLParser.index_documents` records the byte
+           range of every entry document in `Database._entry_spans`.
+        2. if the database file has been modified externally since this index was computed, it gets
+           recomputed from the current contents of the file.
+        3. for every label in `Database._unsaved_entries` which is present in the index, the byte
+           range of its document is replaced with the new contents of the changed entry (as produced
+           by `Entry.save` and a `cobib.parsers.YAMLParser`) or is removed entirely if the entry was
+           deleted.
+        4. finally, all labels still left in `Database._unsaved_entries` are newly added entries and
            can simply be appended to the file.
 
-        In order to optimize performance and IO access, all of the above is done with a single call
-        to `write`.
+        In order to optimize performance and IO access, the file is only rewritten starting from the
+        first changed entry and all of the above is done with a single call to `write`.
+
+        If the database file contains documents which cannot be indexed unambiguously (for example,
+        because of duplicate labels), it gets rewritten entirely from the runtime `Database`
+        instance instead.
+
+        If `cobib.config.config.DatabaseConfig.backend` is set to `"sqlite"`, all unsaved entries
+        get written to the SQLite file in a single transaction instead (see
+        `cobib.database.sqlite.SQLiteBackend.write`).
+
+        If `cobib.config.config.DatabaseConfig.backend` is set to `"sharded"`, only the shard files
+        which contain unsaved entries get rewritten instead (see
+        `cobib.database.shards.ShardedBackend.write`).
+        """
+        if config.database.backend == "sqlite":
+            cls._save_sqlite()
+            return
+
+        if config.database.backend == "sharded":
+            cls._save_sharded()
+            return
+
+        if config.database.journal:
+            cls._append_journal()
+            threshold = config.database.journal_threshold
+            if threshold > 0 and cls._journal_records >= threshold:
+                LOGGER.info("The database journal reached %d records.", cls._journal_records)
+                cls.compact()
+            return
+
+        if cls._journaled_entries or cls.get_journal_file().exists():
+            cls.compact()
+            return
+
+        cls._save_file()
+
+    @classmethod
+    def compact(cls) -> None:
+        """Folds the journal back into the database file.
+
+        All changes recorded in the journal file as well as any currently unsaved changes are
+        written to the database file after which the journal file gets removed.
+
+        The SQLite and sharded backends do not use a journal. Thus, this simply saves all unsaved
+        entries when `cobib.config.config.DatabaseConfig.backend` is set to either of them.
+        """
+        if config.database.backend == "sqlite":
+            cls._save_sqlite()
+            return
+
+        if config.database.backend == "sharded":
+            cls._save_sharded()
+            return
+
+        LOGGER.info("Compacting the database journal into the database file.")
+        changes = dict(cls._journaled_entries)
+        cls._compose_changes(changes, cls._unsaved_entries)
+        cls._unsaved_entries.clear()
+        cls._unsaved_entries.update(changes)
+
+        cls._save_file()
+
+        cls.get_journal_file().unlink(missing_ok=True)
+        cls._journaled_entries.clear()
+        cls._journal_records = 0
+
+    @classmethod
+    def _save_file(cls) -> None:
+        """Writes all unsaved entries to the database file.
+
+        See `Database.save` for more details.
         """
         if cls._instance is None:
             cls()  # pragma: no cover
@@ -277,63 +977,381 @@ class Database(OrderedDict[str, Entry]):
         yml = YAMLParser()
 
         file = RelPath(config.database.file).path
-        with open(file, "r", encoding="utf-8") as bib:
-            lines = bib.readlines()
+        spans = cls._get_entry_spans(file)
+
+        replacements: list[tuple[int, int, bytes]] = []
+        written: set[str] = set()
+        for old_label, new_label in cls._unsaved_entries.items():
+            if old_label not in spans:
+                continue
+            start, end = spans[old_label]
+            entry = _instance.get(new_label, None) if new_label is not None else None
+            if entry is not None:
+                LOGGER.debug('Writing modified entry "%s".', new_label)
+                replacements.append((start, end, entry.save(parser=yml).encode("utf-8")))
+                written.add(cast(str, new_label))
+            else:
+                LOGGER.debug('Deleting entry "%s".', old_label)
+                replacements.append((start, end, b""))
+
+        appendix: list[bytes] = []
+        for label in cls._unsaved_entries.values():
+            if label is None or label in written or label in spans:
+                # NOTE: `None` should never occur here but we avoid a type exception
+                continue
+            LOGGER.debug('Adding new entry "%s".', label)
+            appendix.append(_instance[label].save(parser=yml).encode("utf-8"))
+            written.add(label)
+
+        replacements.sort()
+        with open(file, "r+b") as bib:
+            data = bib.read()
+            if YAMLParser.count_documents(data) != len(spans):
+                # NOTE: the index keeps only the last document of duplicate labels. Splicing would
+                # leave the stale copies in the file, so we rewrite it entirely instead.
+                LOGGER.warning(
+                    "Rewriting the entire database file because not all of its documents could be "
+                    "indexed unambiguously. Please run `cobib lint` to check the database for "
+                    "problems."
+                )
+                spans = {}
+                splice_start = 0
+                new_tail = b"".join(
+                    _instance[label].save(parser=yml).encode("utf-8") for label in _instance
+                )
+            else:
+                splice_start = replacements[0][0] if replacements else len(data)
+                tail = data[splice_start:]
+
+                buffer: list[bytes] = []
+                cursor = splice_start
+                for start, end, contents in replacements:
+                    buffer.append(tail[cursor - splice_start : start - splice_start])
+                    buffer.append(contents)
+                    cursor = end
+                buffer.append(tail[cursor - splice_start :])
+                buffer.extend(appendix)
+                new_tail = b"".join(buffer)
+
+            bib.seek(splice_start)
+            bib.write(new_tail)
+            bib.truncate()
+
+        cls._unsaved_entries.clear()
+
+        # we only need to re-index the rewritten tail of the file
+        new_spans = OrderedDict(
+            (label, span) for label, span in spans.items() if span[1] <= splice_start
+        )
+        new_digests = {label: cls._entry_digests[label] for label in new_spans}
+        tail_spans = YAMLParser.index_documents(new_tail, offset=splice_start)
+        new_spans.update(tail_spans)
+        new_digests.update(cls._digest_documents(new_tail, tail_spans, offset=splice_start))
+        cls._set_entry_spans(file, new_spans, new_digests)
+
+        Database.save_cache()
+        Database._store_search_index()
+
+    @classmethod
+    def _save_sqlite(cls) -> None:
+        """Writes all unsaved entries to the SQLite database file.
+
+        See `Database.save` for more details.
+        """
+        if cls._instance is None:
+            cls()  # pragma: no cover
+        _instance = cast(Database, cls._instance)
+
+        changes: dict[str, Entry | None] = {
+            old_label: _instance.get(new_label, None) if new_label is not None else None
+            for old_label, new_label in cls._unsaved_entries.items()
+        }
+        SQLiteBackend(RelPath(config.database.file).path).write(changes)
+
+        cls._unsaved_entries.clear()
+
+    @classmethod
+    def _save_sharded(cls) -> None:
+        """Writes all unsaved entries to the shard files of the database directory.
+
+        See `Database.save` for more details.
+        """
+        if cls._instance is None:
+            cls()  # pragma: no cover
+        _instance = cast(Database, cls._instance)
+
+        changes: dict[str, Entry | None] = {
+            old_label: _instance.get(new_label, None) if new_label is not None else None
+            for old_label, new_label in cls._unsaved_entries.items()
+        }
+        written = ShardedBackend(RelPath(config.database.file).path).write(changes)
+        cls._written_files.update(written)
+
+        cls._unsaved_entries.clear()
+
+    @classmethod
+    def pop_written_files(cls) -> set[Path]:
+        """Returns and forgets the files which have been written since the last call.
+
+        This is used by `cobib.commands.base_command.Command.git` in order to stage only the shard
+        files which have actually been written by the sharded backend (see
+        `cobib.config.config.DatabaseConfig.backend`).
+
+        Returns:
+            The paths of the files which have been written by `Database.save`.
+        """
+        written, cls._written_files = cls._written_files, set()
+        return written
+
+    @staticmethod
+    def get_journal_file() -> Path:
+        """Returns the full path to the journal file for the current database file.
+
+        The journal file is stored next to the database file and its name is obtained by appending
+        the `.journal` suffix to that of the database file.
+
+        Returns:
+            The path to the journal file.
+        """
+        file = RelPath(config.database.file).path
+        return file.with_name(file.name + ".journal")
+
+    @classmethod
+    def _append_journal(cls) -> None:
+        """Appends all unsaved entries to the journal file.
+
+        Each change is stored as a record which starts with a line consisting of
+        `Database._JOURNAL_MARKER` followed by a JSON object describing the operation. Deletions and
+        renames are recorded before the updated entries, whose YAML documents directly follow their
+        record line. The journal file gets flushed to disc before this method returns.
+        """
+        if not cls._unsaved_entries:
+            return
+
+        _instance = cast(Database, cls._instance)
+
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        yml = YAMLParser()
+
+        records: list[str] = []
+        for old_label, new_label in cls._unsaved_entries.items():
+            if new_label is None:
+                LOGGER.debug('Journaling deletion of entry "%s".', old_label)
+                records.append(cls._journal_record({"op": "delete", "label": old_label}))
+            elif new_label != old_label:
+                LOGGER.debug('Journaling renaming of entry "%s" to "%s".', old_label, new_label)
+                records.append(
+                    cls._journal_record({"op": "rename", "label": old_label, "new": new_label})
+                )
+
+        for label in dict.fromkeys(cls._unsaved_entries.values()):
+            if label is None or label not in _instance:
+                continue
+            LOGGER.debug('Journaling entry "%s".', label)
+            records.append(
+                cls._journal_record({"op": "update", "label": label})
+                + _instance[label].save(parser=yml)
+            )
 
-        label_regex = re.compile(r"^([^:]+):$")
+        with open(cls.get_journal_file(), "a", encoding="utf-8") as journal:
+            journal.write("".join(records))
+            journal.flush()
+            os.fsync(journal.fileno())
 
-        overwrite = False
-        cur_label: str = ""
-        buffer: list[str] = []
-        for line in lines:
+        cls._compose_changes(cls._journaled_entries, cls._unsaved_entries)
+        cls._journal_records += len(records)
+        cls._unsaved_entries.clear()
+
+    @classmethod
+    def _journal_record(cls, record: dict[str, str]) -> str:
+        """Formats the line which starts a record in the journal file.
+
+        Args:
+            record: the description of the journaled operation.
+
+        Returns:
+            The line (including the trailing newline) starting the journal record.
+        """
+        return f"{cls._JOURNAL_MARKER}{json.dumps(record)}\n"
+
+    @classmethod
+    def _replay_journal(cls) -> None:
+        """Replays the records of the journal file on top of the current runtime database.
+
+        The replayed changes are tracked in `Database._journaled_entries` such that they can later
+        be folded into the database file by `Database.compact`. Replaying stops at the first record
+        which cannot be processed (for example due to an interrupted write).
+        """
+        cls._journaled_entries.clear()
+        cls._journal_records = 0
+
+        journal = cls.get_journal_file()
+        if not journal.exists():
+            return
+
+        LOGGER.info("Replaying the database journal: %s", journal)
+        _instance = cast(Database, cls._instance)
+        # NOTE: the replayed changes bypass the incremental maintenance of the indexes
+        for index in cls._maintained_indexes():
+            index.clear()
+
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        yml = YAMLParser()
+
+        records: list[tuple[str, list[str]]] = []
+        with open(journal, "r", encoding="utf-8") as file:
+            for line in file:
+                if line.startswith(cls._JOURNAL_MARKER):
+                    records.append((line[len(cls._JOURNAL_MARKER) :], []))
+                elif records:
+                    records[-1][1].append(line)
+
+        for header, document in records:
             try:
-                matches = label_regex.match(line)
-                if matches is None:
-                    raise AttributeError
-                new_label = matches.groups()[0]
-                if new_label in cls._unsaved_entries:
-                    LOGGER.debug('Entry "%s" found. Starting to replace lines.', new_label)
-                    overwrite = True
-                    cur_label = new_label
-                    continue
-            except AttributeError:
-                pass
-            if overwrite and line.startswith("..."):
-                LOGGER.debug('Reached end of entry "%s".', cur_label)
-                overwrite = False
-
-                new_label = cast(str, cls._unsaved_entries.pop(cur_label))
-                entry = _instance.get(new_label, None)
-                if entry:
-                    LOGGER.debug('Writing modified entry "%s".', new_label)
-                    entry_str = entry.save(parser=yml)
-                    buffer.append("\n".join(entry_str.split("\n")[1:]))
+                record = json.loads(header)
+                label = record["label"]
+                if record["op"] == "update":
+                    for new_label, entry in yml.parse("".join(document)).items():
+                        _instance[new_label] = entry
+                    change = {label: label}
+                elif record["op"] == "delete":
+                    OrderedDict.pop(_instance, label, None)
+                    change = {label: None}
+                elif record["op"] == "rename":
+                    cls._rename_in_place(label, record["new"])
+                    change = {label: record["new"]}
                 else:
-                    # Entry has been deleted. Pop the previous `---` line.
-                    LOGGER.debug('Deleting entry "%s".', new_label)
-                    buffer.pop()
-                # we pop `new_label` too, because in case of a rename it differs from `cur_label`
-                if new_label is not None:
-                    cls._unsaved_entries.pop(new_label, None)
-            elif not overwrite:
-                # keep previous line
-                buffer.append(line)
-
-        if cls._unsaved_entries:
-            for label in cls._unsaved_entries.copy().values():
-                if label is None:
-                    # NOTE: this should never occur but we avoid a type exception
-                    continue  # pragma: no cover
-                LOGGER.debug('Adding new entry "%s".', label)
-                entry_str = _instance[label].save(parser=yml)
-                buffer.append(entry_str)
-                cls._unsaved_entries.pop(label)
-
-        with open(file, "w", encoding="utf-8") as bib:
-            for line in buffer:
-                bib.write(line)
+                    raise KeyError(record["op"])
+            except Exception as exc:
+                LOGGER.error(
+                    "Failed to replay a record of the database journal. Ignoring it and all "
+                    "records following it. The encountered exception was: %s",
+                    exc,
+                )
+                break
+            cls._compose_changes(cls._journaled_entries, change)
+            cls._journal_records += 1
 
-        Database.save_cache()
+    @classmethod
+    def _rename_in_place(cls, old_label: str, new_label: str) -> None:
+        """Renames an entry while preserving its position in the runtime database.
+
+        Args:
+            old_label: the previous label.
+            new_label: the new label.
+        """
+        _instance = cast(Database, cls._instance)
+        if old_label not in _instance:
+            return
+
+        labels = list(_instance.keys())
+        entry = _instance[old_label]
+        OrderedDict.pop(_instance, old_label)
+        entry.label = new_label
+        _instance[new_label] = entry
+        for label in labels[labels.index(old_label) + 1 :]:
+            if label in _instance and label != new_label:
+                _instance.move_to_end(label)
+
+    @staticmethod
+    def _compose_changes(
+        changes: dict[str, str | None], new_changes: dict[str, str | None]
+    ) -> None:
+        """Composes a dictionary of changes with another one which happened after it.
+
+        Both dictionaries follow the structure of `Database._unsaved_entries`. The keys of `changes`
+        remain to be the labels as they occur in the database file, such that renaming an entry
+        twice is composed into a single renaming.
+
+        Args:
+            changes: the earlier changes. This dictionary gets updated in-place.
+            new_changes: the later changes.
+        """
+        for old_label, new_label in new_changes.items():
+            for label, current_label in changes.items():
+                if current_label == old_label:
+                    changes[label] = new_label
+                    break
+            else:
+                changes[old_label] = new_label
+
+    @classmethod
+    def _get_entry_spans(cls, file: Path) -> dict[str, tuple[int, int]]:
+        """Returns the index of byte ranges of all entries in the database file.
+
+        The index is only recomputed if the database file has changed since it was last computed.
+
+        Args:
+            file: the path to the database file.
+
+        Returns:
+            The mapping of entry labels to the byte ranges of their YAML documents.
+        """
+        if cls._entry_spans_stat == cls._stat_database(file):
+            return cls._entry_spans
+
+        LOGGER.debug("Indexing the entry locations in the database file %s", file)
+
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        data = file.read_bytes()
+        spans = YAMLParser.index_documents(data)
+        cls._set_entry_spans(file, spans, cls._digest_documents(data, spans))
+        return cls._entry_spans
+
+    @classmethod
+    def _set_entry_spans(
+        cls, file: Path, spans: dict[str, tuple[int, int]], digests: dict[str, bytes]
+    ) -> None:
+        """Sets the index of byte ranges of all entries in the database file.
+
+        Args:
+            file: the path to the database file.
+            spans: the mapping of entry labels to the byte ranges of their YAML documents.
+            digests: the mapping of entry labels to the content digests of their YAML documents.
+        """
+        cls._entry_spans = spans
+        cls._entry_spans_stat = cls._stat_database(file)
+        cls._entry_digests = digests
+
+    @staticmethod
+    def _digest_documents(
+        data: bytes, spans: dict[str, tuple[int, int]], offset: int = 0
+    ) -> dict[str, bytes]:
+        """Computes the content digests of the YAML documents of all entries.
+
+        Args:
+            data: the raw (binary) contents of the database file.
+            spans: the mapping of entry labels to the byte ranges of their YAML documents.
+            offset: an optional offset which gets subtracted from all byte positions. This can be
+                used when `data` contains only a tail of the actual file.
+
+        Returns:
+            The mapping of entry labels to the BLAKE2 digests of their YAML documents.
+        """
+        return {
+            label: hashlib.blake2b(data[start - offset : end - offset], digest_size=16).digest()
+            for label, (start, end) in spans.items()
+        }
+
+    @staticmethod
+    def _stat_database(file: Path) -> tuple[int, int] | None:
+        """Returns the size and modification time of the database file.
+
+        Args:
+            file: the path to the database file.
+
+        Returns:
+            The size (in bytes) and the modification time (in nanoseconds) of the file or `None` if
+            it does not exist.
+        """
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
 
     @staticmethod
     def _get_cache_file() -> Path | None:
@@ -363,37 +1381,40 @@ class Database(OrderedDict[str, Entry]):
         cache_file = (cache_location / file_name).with_suffix(".pickle")
         return cache_file
 
-    @staticmethod
-    def _is_cache_outdated(cache_file: Path) -> bool:
-        """Compares the age of the cache file with the database file itself.
+    @classmethod
+    def _get_search_index_file(cls) -> Path | None:
+        """Returns the full path to the file storing the search index (see `Database.search_index`).
 
-        Args:
-            cache_file: the full path to the cache file for the current database file.
+        This file is located next to the cache file (see `Database._get_cache_file`).
 
         Returns:
-            `True` if the cache file is outdated compared to the database file, `False` otherwise.
-
-        Raises:
-            FileNotFoundError: if the cache file does not exist.
+            The path to the file or `None`, if caching is disabled.
         """
-        if not cache_file.exists():
-            raise FileNotFoundError
-
-        database_location = RelPath(config.database.file).path
-        cache_age = cache_file.stat().st_mtime
-        database_age = database_location.stat().st_mtime
-
-        return cache_age < database_age
+        cache_file = cls._get_cache_file()
+        return None if cache_file is None else cache_file.with_suffix(".search")
 
     @classmethod
     def read_cache(cls) -> None:
         """Reads the database from a cache.
 
+        The cache file gets memory-mapped and only its index is deserialized. The entries are stored
+        as views onto their records and only get constructed upon their first access (see also
+        `Database.save_cache`).
+
+        If the size and modification time of the database file still match the ones at which the
+        cache was written, the cache is used without reading the database file at all. Otherwise,
+        the cache gets validated against the contents of the database file by comparing the content
+        digests of all YAML documents (see `Database._digest_documents`) such that merely touching
+        the file does not invalidate the cache. Entries whose documents have changed, get parsed
+        from the database file individually and the cache gets repaired accordingly.
+
         Raises:
             CacheError: if caching is disable via `cobib.config.config.DatabaseConfig.cache`.
             CacheError: if the current database has not been cached yet.
-            CacheError: if the cached database is older than the last modification time of the
-                database file itself, indicating that the cache is outdated.
+            CacheError: if the cache file was written in an outdated format or is corrupted.
+            CacheError: if the cached database is outdated and cannot be repaired incrementally.
+                This is the case when hooks are subscribed to `Event.PreYAMLParse` or
+                `Event.PostYAMLParse` or when the database file cannot be indexed unambiguously.
         """
         cache_file = cls._get_cache_file()
         if cache_file is None:
@@ -401,43 +1422,200 @@ class Database(OrderedDict[str, Entry]):
             exc.log_level = logging.DEBUG
             raise exc
 
+        if not cache_file.exists():
+            raise CacheError("the database has not been cached yet")
+
+        LOGGER.debug("Reading the cached database from %s", str(cache_file))
+
+        with open(cache_file, "rb") as cache:
+            try:
+                contents = memoryview(mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ))
+            except ValueError as exc:
+                raise CacheError("the cached database is corrupted") from exc
+        cache_stat = cls._stat_database(cache_file)
+
+        if len(contents) < cls._CACHE_HEADER.size + cls._CACHE_TRAILER.size or (
+            cls._CACHE_HEADER.unpack_from(contents) != (cls._CACHE_MAGIC, cls._CACHE_VERSION)
+        ):
+            raise CacheError("the cached database was written in an outdated format")
+
+        index_offset, index_length = cls._CACHE_TRAILER.unpack_from(
+            contents, len(contents) - cls._CACHE_TRAILER.size
+        )
         try:
-            cache_outdated = cls._is_cache_outdated(cache_file)
+            records, digests, file_stat, spans, indexes = pickle.loads(
+                contents[index_offset : index_offset + index_length]
+            )
+        except Exception as exc:
+            raise CacheError("the cached database is corrupted") from exc
 
-            if cache_outdated:
-                raise CacheError("the cached database is outdated")
-        except FileNotFoundError as exc:
-            raise CacheError("the database has not been cached yet") from exc
+        file = RelPath(config.database.file).path
+        current_stat = cls._stat_database(file)
+        if current_stat is None:
+            raise CacheError("the database file does not exist")
 
-        LOGGER.debug("Reading the cached database from %s", str(cache_file))
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        data = b""
+        outdated: set[str] = set()
+        new_digests = digests
+        if current_stat != file_stat:
+            LOGGER.debug("Validating the cached database against the digests of its documents.")
+            try:
+                data = file.read_bytes()
+            except FileNotFoundError as exc:  # pragma: no cover
+                raise CacheError("the database file does not exist") from exc
+            spans = YAMLParser.index_documents(data)
+            new_digests = cls._digest_documents(data, spans)
+            outdated = {
+                label
+                for label, digest in new_digests.items()
+                if label not in records or digests.get(label) != digest
+            }
+        if outdated:
+            if (
+                config.events.get(Event.PreYAMLParse)
+                or config.events.get(Event.PostYAMLParse)
+                or YAMLParser.count_documents(data) != len(spans)
+            ):
+                raise CacheError("the cached database is outdated")
+            LOGGER.info("Repairing %d outdated entries of the cached database.", len(outdated))
 
         cls._read = True
-        with open(cache_file, "rb") as cache:
-            cast(Database, cls._instance).update(pickle.load(cache))
+        _instance = cast(Database, cls._instance)
+        _instance.clear()
+        for label, (start, end) in spans.items():
+            if label in outdated:
+                entry: Entry | memoryview = YAMLParser().parse_document(
+                    data[start:end].decode("utf-8")
+                )
+            else:
+                offset, length = records[label]
+                entry = contents[offset : offset + length]
+            OrderedDict.__setitem__(cls._stored(), label, entry)
+        cls._lazy = True
+        cls._cache_records = records
+        cls._cache_stat = cache_stat
+        cls._cache_digests = digests
+        cls._cache_file_stat = file_stat
+        cls._set_entry_spans(file, spans, new_digests)
+        for name, index in cls._indexes().items():
+            index.load(indexes.get(name, {}), list(spans), _instance.__getitem__, outdated)
+
+        if (
+            current_stat != file_stat
+            or list(digests.items()) != list(new_digests.items())
+            or any(index.modified for index in cls._indexes().values())
+        ):
+            # this also stores the current size and modification time of the database file
+            cls.save_cache()
 
     @classmethod
     def save_cache(cls) -> None:
         """Saves the current database to a cache.
 
-        This method does nothing, if the cache is already newer than the last modification time of
-        the database file itself.
+        The cache file starts with a header (see `Database._CACHE_HEADER`) which is followed by one
+        pickled record per entry, the cache index and a trailer (see `Database._CACHE_TRAILER`)
+        pointing to the index. The index maps every entry label to the location of its record and
+        also stores `Database._entry_spans`. This allows `Database.read_cache` to memory-map the
+        cache file and to only deserialize the entries which are actually accessed.
+
+        If the cache file has not been modified since it was last read or written, it gets updated
+        in-place: the records of all entries which have not been accessed are kept as they are and
+        only the remaining ones get appended, followed by a new index. Once the superseded records
+        take up more space than the current ones, the cache file gets rewritten from scratch.
+
+        Alongside the records, the cache index stores the content digests of the YAML documents of
+        all entries (see `Database._entry_digests`) together with the size and modification time of
+        the database file at which these were computed and the byte ranges of all documents (see
+        `Database._entry_spans`), which are used by `Database.read_cache` to validate the cache. It
+        also stores the sort, value, range, label and identifier indexes (see
+        `Database.sorted_labels`, `Database.value_index`, `Database.range_index`,
+        `Database.label_index` and `Database.identifier_index`). This method does nothing, if the
+        cache already matches these digests and none of the indexes have been modified.
         """
         cache_file = cls._get_cache_file()
-        if cache_file is None:
+        if cache_file is None or config.database.lazy:
             return
 
         LOGGER.debug("Caching the database in %s", str(cache_file))
 
-        try:
-            cache_outdated = cls._is_cache_outdated(cache_file)
-            if not cache_outdated:  # pragma: no branch
-                LOGGER.info("The cache is already up-to-date")
+        in_place = cls._cache_stat is not None and cls._cache_stat == cls._stat_database(cache_file)
+        if (
+            in_place
+            and not any(index.modified for index in cls._indexes().values())
+            and list(cls._cache_digests.items()) == list(cls._entry_digests.items())
+            and cls._cache_file_stat == cls._entry_spans_stat
+        ):
+            LOGGER.info("The cache is already up-to-date")
+            return
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        _instance = cast(Database, cls._instance)
+
+        reused: dict[str, tuple[int, int]] = {}
+        pending: dict[str, bytes | memoryview] = {}
+        for label, entry in OrderedDict.items(cls._stored()):
+            if isinstance(entry, memoryview) and label in cls._cache_records:
+                reused[label] = cls._cache_records[label]
+                pending[label] = entry
+            else:
+                pending[label] = pickle.dumps(_instance[label], protocol=pickle.HIGHEST_PROTOCOL)
+
+        data_end = cls._CACHE_HEADER.size
+        if in_place:
+            with open(cache_file, "rb") as cache:
+                cache.seek(-cls._CACHE_TRAILER.size, io.SEEK_END)
+                data_end, _ = cls._CACHE_TRAILER.unpack(cache.read(cls._CACHE_TRAILER.size))
+            live_size = sum(len(record) for record in pending.values())
+            new_size = sum(len(pending[label]) for label in pending if label not in reused)
+            if data_end + new_size - cls._CACHE_HEADER.size > 2 * live_size:
+                LOGGER.info("Rewriting the cache file to discard superseded records.")
+                in_place = False
+
+        target = cache_file if in_place else cache_file.with_name(cache_file.name + ".tmp")
+        records: dict[str, tuple[int, int]] = {}
+        with open(target, "r+b" if in_place else "wb") as cache:
+            if in_place:
+                cursor = cache.seek(data_end)
+            else:
+                cursor = cache.write(cls._CACHE_HEADER.pack(cls._CACHE_MAGIC, cls._CACHE_VERSION))
+            for label, record in pending.items():
+                if in_place and label in reused:
+                    records[label] = reused[label]
+                    continue
+                records[label] = (cursor, len(record))
+                cursor += cache.write(record)
+            index = pickle.dumps(
+                (
+                    records,
+                    cls._entry_digests,
+                    cls._entry_spans_stat,
+                    cls._entry_spans,
+                    {name: index.dump() for name, index in cls._indexes().items()},
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            cache.write(index)
+            cache.write(cls._CACHE_TRAILER.pack(cursor, len(index)))
+            cache.truncate()
+
+        if not in_place:
+            try:
+                os.replace(target, cache_file)
+            except OSError as exc:  # pragma: no cover
+                # NOTE: this can happen on Windows, where a memory-mapped file cannot be replaced
+                LOGGER.warning("Failed to update the cache file %s: %s", cache_file, exc)
+                target.unlink(missing_ok=True)
                 return
-        except FileNotFoundError:
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(cache_file, "wb") as cache:
-            pickle.dump(cls._instance, cache)
+        cls._cache_records = records
+        cls._cache_stat = cls._stat_database(cache_file)
+        cls._cache_digests = cls._entry_digests
+        cls._cache_file_stat = cls._entry_spans_stat
+        for maintained in cls._indexes().values():
+            maintained.modified = False
 
 
 class CacheError(Exception):
@@ -6,10 +6,13 @@
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
+from bisect import bisect_left, bisect_right
 from enum import Enum
+from functools import lru_cache
 from itertools import accumulate
-from typing import TYPE_CHECKING, Any, List, Optional, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, NamedTuple, Optional, cast
 
 from pylatexenc.latex2text import LatexNodes2Text
 from pylatexenc.latexencode import UnicodeToLatexEncoder
@@ -20,14 +23,86 @@ from cobib.utils.match import Match, Span
 from cobib.utils.regex import HAS_OPTIONAL_REGEX, regex
 from cobib.utils.rel_path import RelPath
 
+from . import text_cache
 from .author import Author
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import cobib.parsers
 
 LOGGER = logging.getLogger(__name__)
 """@private module logger."""
 
+GREP_BATCH_SIZE = 256
+"""The maximum number of files which get passed to a single invocation of the
+`cobib.config.config.SearchCommandConfig.grep` tool (see `Entry.grep`)."""
+
+_PORTABLE_PATTERN = re.compile(r"[^\\+?|(){}\[\]]*")
+"""@private matches the patterns without any characters which the
+`cobib.config.config.SearchCommandConfig.grep` tool may interpret differently from the regex engine
+(like the parentheses which are literal characters in the basic regex syntax of `grep(1)`)."""
+
+
+class LatexCodecInfo(NamedTuple):
+    """Profiling counters of the LaTeX encoding or decoding of field values.
+
+    These are returned by `Entry.latex_codec_info`.
+    """
+
+    skipped: int
+    """The number of values which did not need to be converted at all."""
+    hits: int
+    """The number of values whose conversion was found in the cache."""
+    misses: int
+    """The number of values which actually had to be converted."""
+    currsize: int
+    """The number of values currently stored in the cache."""
+
+
+class _EntryData(Dict[str, Any]):
+    """The `data` dictionary of an `Entry` which counts its modifications.
+
+    Only modifications of the dictionary itself get counted. Values (such as lists) must not be
+    modified in-place but have to be assigned anew.
+    """
+
+    version: int = 0
+    """The number of modifications of this dictionary. The class-level default ensures that this is
+    available even while unpickling, during which the items get set before the instance state."""
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.version += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.version += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> _EntryData:  # type: ignore[override,misc]
+        self.version += 1
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self.version += 1
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, Any]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.version += 1
+        super().update(*args, **kwargs)
+
 
 class Entry:
     """coBib's bibliographic entry.
@@ -75,6 +150,71 @@ class Entry:
 
         return cls._latex_to_text_decoder
 
+    _LATEX_SPECIALS: ClassVar[re.Pattern[str]] = re.compile(r"[\\{}$%&~]|--|''|``|[!?]`")
+    """The pattern matching all characters and ligatures which `LatexNodes2Text` does not return
+    verbatim. Values without any of these do not need to be decoded."""
+
+    _latex_codec_skipped: ClassVar[dict[str, int]] = {"encode": 0, "decode": 0}
+    """The number of values for which the encoding or decoding was skipped entirely."""
+
+    @classmethod
+    def encode_latex(cls, value: str) -> str:
+        """Encodes the non-ASCII characters of a value using LaTeX sequences.
+
+        Pure ASCII values are returned unchanged, since the `_unicode_to_latex_encoder` only encodes
+        non-ASCII characters. All other values get encoded through a bounded LRU cache.
+
+        Args:
+            value: the value to encode.
+
+        Returns:
+            The encoded value.
+        """
+        if value.isascii():
+            cls._latex_codec_skipped["encode"] += 1
+            return value
+        return _unicode_to_latex(value)
+
+    @classmethod
+    def decode_latex(cls, value: str) -> str:
+        """Decodes the LaTeX sequences of a value into Unicode.
+
+        Values without any LaTeX special characters (see `_LATEX_SPECIALS`) are returned unchanged.
+        All other values get decoded through a bounded LRU cache.
+
+        Args:
+            value: the value to decode.
+
+        Returns:
+            The decoded value.
+        """
+        if cls._LATEX_SPECIALS.search(value) is None:
+            cls._latex_codec_skipped["decode"] += 1
+            return value
+        return _latex_to_text(value)
+
+    @classmethod
+    def latex_codec_info(cls) -> dict[str, LatexCodecInfo]:
+        """Returns the profiling counters of `Entry.encode_latex` and `Entry.decode_latex`.
+
+        Returns:
+            A dictionary mapping `"encode"` and `"decode"` to their respective counters.
+        """
+        infos = {"encode": _unicode_to_latex.cache_info(), "decode": _latex_to_text.cache_info()}
+        return {
+            key: LatexCodecInfo(
+                cls._latex_codec_skipped[key], info.hits, info.misses, info.currsize
+            )
+            for key, info in infos.items()
+        }
+
+    @classmethod
+    def clear_latex_codec(cls) -> None:
+        """Clears the caches and resets the profiling counters of the LaTeX encoding/decoding."""
+        _unicode_to_latex.cache_clear()
+        _latex_to_text.cache_clear()
+        cls._latex_codec_skipped = {"encode": 0, "decode": 0}
+
     def __init__(self, label: str, data: dict[str, Any]) -> None:
         """Initializes a new Entry.
 
@@ -88,8 +228,28 @@ class Entry:
 
         self._label: str = str(label)
 
-        self.data: dict[str, Any] = {}
-        """The actual bibliographic data."""
+        self._version: int = 0
+        """The number of modifications of this entry apart from those of its current `data`.
+        Together with the latter, this forms the modification counter returned by
+        `Entry._revision`."""
+
+        self._dumps: dict[tuple[Any, ...], tuple[int, str]] = {}
+        """The memoized dumps of this entry. The keys are provided by
+        `cobib.parsers.base_parser.Parser.dump_key` and the values are pairs of the modification
+        counter of this entry at the time of dumping and the dumped string."""
+
+        self._stringified: dict[tuple[str, bool], tuple[int, str | None, str]] = {}
+        """The memoized results of `Entry.stringify_field`. The keys are pairs of the field name and
+        the `encode_latex` setting and the values are triples of the modification counter of this
+        entry, the list separator of the field at the time of stringification and the resulting
+        string."""
+
+        self._markup: tuple[tuple[str, ...], tuple[Any, ...], str, str] | None = None
+        """The memoized markup of `Entry.markup_label`. This is a quadruple of the tags of this
+        entry and the `cobib.config.config.TagsThemeConfig.signature` at the time of resolving the
+        markup as well as the resulting markup prefix and suffix of the label."""
+
+        self._data = _EntryData()
 
         # NOTE: we first resolve the presence of `note` and `notes` to deal with ongoing deprecation
         self._init_note_fields(note=data.pop("note", None), notes=data.pop("notes", None))
@@ -119,6 +279,25 @@ class Entry:
                 extra={"entry": label, "field": "ID"},
             )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state of this entry for pickling without its memoized strings."""
+        state = self.__dict__.copy()
+        state.pop("_dumps", None)
+        state.pop("_stringified", None)
+        state.pop("_markup", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the state of this entry from unpickling.
+
+        Args:
+            state: the state as returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self._dumps = {}
+        self._stringified = {}
+        self._markup = None
+
     def __eq__(self, other: object) -> bool:
         """Checks equality of two entries."""
         if not isinstance(other, Entry):
@@ -149,6 +328,58 @@ class Entry:
         else:
             self.data.update(other.data)
 
+    @property
+    def data(self) -> dict[str, Any]:
+        """The actual bibliographic data.
+
+        Every modification of this dictionary invalidates the memoized dumps of this entry (see
+        `Entry.memoized_dump`). Values (such as lists) must not be modified in-place but have to be
+        assigned anew.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: dict[str, Any]) -> None:
+        """Sets the actual bibliographic data.
+
+        Args:
+            data: the new data dictionary.
+        """
+        self._version += self._data.version + 1
+        self._data = data if isinstance(data, _EntryData) else _EntryData(data)
+
+    def _revision(self) -> int:
+        """Returns the modification counter of this entry.
+
+        This counter increases with every change of the `label` or the `data` of this entry. It is
+        used to invalidate the memoized dumps of this entry (see `Entry.memoized_dump`).
+
+        Note, that this is a private method in order to not collide with any `version` field of an
+        entry.
+        """
+        return self._version + self._data.version
+
+    def memoized_dump(self, key: tuple[Any, ...]) -> str | None:
+        """Returns a memoized dump of this entry.
+
+        Args:
+            key: the key of the dump as provided by `cobib.parsers.base_parser.Parser.dump_key`.
+
+        Returns:
+            The memoized dump, if it exists and this entry has not been modified since, or `None`.
+        """
+        revision, string = self._dumps.get(key, (-1, ""))
+        return string if revision == self._revision() else None
+
+    def memoize_dump(self, key: tuple[Any, ...], string: str) -> None:
+        """Memoizes a dump of this entry.
+
+        Args:
+            key: the key of the dump as provided by `cobib.parsers.base_parser.Parser.dump_key`.
+            string: the dumped string.
+        """
+        self._dumps[key] = (self._revision(), string)
+
     @property
     def label(self) -> str:
         """The `Database` label of this entry."""
@@ -163,20 +394,30 @@ class Entry:
         """
         LOGGER.debug("Changing the label '%s' to '%s'.", self.label, label)
         self._label = str(label)
+        self._version += 1
 
     def markup_label(self) -> str:
-        """Returns the label of this entry with the rich markup based on special tags."""
-        markup_label = self.label
-
-        markup_tags: dict[str, int] = {}
-        for tag in self.tags:
-            if tag in config.theme.tags.names:
-                markup_tags[f"tag.{tag}"] = config.theme.tags.weights[tag]
-
-        for tag, _ in sorted(markup_tags.items(), key=lambda item: item[1], reverse=True):
-            markup_label = f"[{tag}]{markup_label}[/{tag}]"
+        """Returns the label of this entry with the rich markup based on special tags.
 
-        return markup_label
+        The markup gets memoized until the tags of this entry or the special tags configured in
+        `cobib.config.config.TagsThemeConfig` change.
+        """
+        tags = tuple(self.tags)
+        signature = config.theme.tags.signature
+        if self._markup is None or self._markup[:2] != (tags, signature):
+            weights = config.theme.tags.weights
+            markup_tags: dict[str, int] = {}
+            for tag in tags:
+                if tag in weights:
+                    markup_tags[f"tag.{tag}"] = weights[tag]
+
+            # the tag with the highest weight gets applied innermost
+            ordered = sorted(markup_tags.items(), key=lambda item: item[1], reverse=True)
+            prefix = "".join(f"[{tag}]" for tag, _ in reversed(ordered))
+            suffix = "".join(f"[/{tag}]" for tag, _ in ordered)
+            self._markup = (tags, signature, prefix, suffix)
+
+        return f"{self._markup[2]}{self.label}{self._markup[3]}"
 
     @property
     def author(self) -> str:
@@ -227,8 +468,6 @@ class Entry:
         if not isinstance(authors, list):
             authors = " ".join(authors.split()).split(" and ")
 
-        dec = self._get_latex_to_text_decoder()
-
         parsed_authors: list[str | Author] = []
         for author in authors:
             if isinstance(author, Author):
@@ -239,7 +478,7 @@ class Entry:
                 continue
 
             # we explicitly convert any latex instructions to Unicode
-            author = cast(str, dec.latex_to_text(author))  # noqa: PLW2901
+            author = self.decode_latex(author)  # noqa: PLW2901
             LOGGER.debug("Converted the author to Unicode: '%s'", author)
 
             parsed_author = Author.parse(author)
@@ -542,27 +781,61 @@ class Entry:
         Returns:
             The data of this `Entry` as pure string fields.
         """
-        if encode_latex:
-            enc = self._get_unicode_to_latex_encoder()
         data = {}
         data["label"] = self.markup_label() if markup else self.label
-        for field, value in self.data.items():
-            if hasattr(self, field):
-                value = getattr(self, field)  # noqa: PLW2901
-            if field == "author":
-                data[field] = str(value)
-            elif inline_note and field == "notes":
-                data[field] = open(RelPath(value).path, "r", encoding="utf-8").read().strip()
-            elif isinstance(value, list) and hasattr(
-                config.database.stringify.list_separator, field
-            ):
-                data[field] = getattr(config.database.stringify.list_separator, field).join(value)
+        for field in self.data:
+            if inline_note and field == "notes":
+                path = RelPath(self.data[field]).path
+                data[field] = open(path, "r", encoding="utf-8").read().strip()
+                if encode_latex:
+                    data[field] = self.encode_latex(data[field])
             else:
-                data[field] = str(value)
-            if encode_latex:
-                data[field] = enc.unicode_to_latex(data[field])
+                data[field] = cast(str, self.stringify_field(field, encode_latex=encode_latex))
         return data
 
+    def stringify_field(
+        self, field: str, *, encode_latex: bool = True, markup: bool = False
+    ) -> str | None:
+        """Returns a single field of this entry converted to a string.
+
+        This is identical to `stringify(...).get(field)` but only converts the requested field. The
+        result is memoized until this entry gets modified. This makes it suitable for repeatedly
+        accessing a few fields of many entries, like when sorting or rendering lists.
+
+        Args:
+            field: the name of the field. This may also be `"label"`.
+            encode_latex: whether to encode non-ASCII characters using LaTeX sequences (see
+                `Entry.encode_latex`).
+            markup: whether or not to add markup based on the configured special tags. This only
+                affects the `"label"` field.
+
+        Returns:
+            The string-converted field or `None`, if this entry does not have such a field.
+        """
+        if field == "label":
+            return self.markup_label() if markup else self.label
+        if field not in self.data:
+            return None
+
+        separator: str | None = getattr(config.database.stringify.list_separator, field, None)
+        revision = self._revision()
+        memoized = self._stringified.get((field, encode_latex), None)
+        if memoized is not None and memoized[:2] == (revision, separator):
+            return memoized[2]
+
+        value = getattr(self, field) if hasattr(self, field) else self.data[field]
+        if field == "author":
+            string = str(value)
+        elif isinstance(value, list) and separator is not None:
+            string = separator.join(value)
+        else:
+            string = str(value)
+        if encode_latex:
+            string = self.encode_latex(string)
+
+        self._stringified[(field, encode_latex)] = (revision, separator, string)
+        return string
+
     def formatted(self) -> Entry:
         """Formats the entry in a clean and reproducible manner.
 
@@ -578,7 +851,6 @@ class Entry:
         Returns:
             A new `Entry` instance with all fields properly formatted.
         """
-        enc = self._get_unicode_to_latex_encoder()
         formatted_entry = Entry(self.label, {})
         for key, value in self.data.items():
             if key in config.database.format.verbatim_fields:
@@ -588,13 +860,13 @@ class Entry:
 
             if key == "author":
                 if config.database.format.author_format == AuthorFormat.BIBLATEX:
-                    formatted_entry.data[key] = enc.unicode_to_latex(self.author)
+                    formatted_entry.data[key] = self.encode_latex(self.author)
                 elif config.database.format.author_format == AuthorFormat.YAML:  # pragma: no branch
                     formatted_entry.data[key] = value
                 continue
 
             if isinstance(value, str):
-                formatted_entry.data[key] = enc.unicode_to_latex(value)
+                formatted_entry.data[key] = self.encode_latex(value)
             else:
                 formatted_entry.data[key] = value
 
@@ -608,6 +880,8 @@ class Entry:
         special character escaping) only before saving ensures a consistent state of the database
         while also providing a fast startup because these conversions are prevented at that time.
 
+        The result is memoized until this entry gets modified (see `Entry.memoized_dump`).
+
         Args:
             parser: the parser instance to use for dumping. If set to `None` it will default to a
                 `cobib.parsers.YAMLParser`. Supplying a ready instance can improve efficiency
@@ -616,12 +890,28 @@ class Entry:
         Returns:
             The string-representation of this entry as produced by the provided parser.
         """
-        formatted_entry = self.formatted()
         if parser is None:
             from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
 
             parser = YAMLParser()
-        return parser.dump(formatted_entry) or ""  # `dump` may return `None`
+
+        key = parser.dump_key(self)
+        if key is not None:
+            key = (
+                "save",
+                *key,
+                config.database.format.author_format,
+                tuple(config.database.format.verbatim_fields),
+            )
+            string = self.memoized_dump(key)
+            if string is not None:
+                return string
+
+        formatted_entry = self.formatted()
+        string = parser.dump(formatted_entry) or ""  # `dump` may return `None`
+        if key is not None:
+            self.memoize_dump(key, string)
+        return string
 
     def matches(
         self,
@@ -665,45 +955,25 @@ class Entry:
 
         Returns:
             Boolean indicating whether this entry matches the filter.
+
+        .. note::
+           This compiles the filter for every call. When filtering many entries, build a
+           `cobib.database.filter_plan.FilterPlan` once and apply it to all of them instead.
         """
         LOGGER.debug("Checking whether entry %s matches.", self.label)
 
-        if decode_latex:
-            dec = self._get_latex_to_text_decoder()
-
-        re_flags = regex.IGNORECASE if ignore_case else 0
-
-        match_list = []
-        stringified_data = self.stringify(encode_latex=False)
+        from .filter_plan import FilterPlan  # noqa: PLC0415
 
-        for key, values in filter_.items():
-            if key[0] not in stringified_data:
-                match_list.append(not key[1])
-                continue
-
-            field_data = stringified_data[key[0]]
-
-            if decode_latex:
-                field_data = dec.latex_to_text(field_data)
+        return FilterPlan(
+            filter_,
+            or_,
+            ignore_case=ignore_case,
+            decode_unicode=decode_unicode,
+            decode_latex=decode_latex,
+            fuzziness=fuzziness,
+        ).matches(self)
 
-            if decode_unicode:
-                field_data = unidecode(field_data)
-
-            for val in values:
-                if fuzziness:
-                    re_compiled = regex.compile(rf"({val}){{e<={fuzziness}}}", flags=re_flags)
-                else:
-                    re_compiled = regex.compile(rf"{val}", flags=re_flags)
-
-                if re_compiled.search(field_data):
-                    match_list.append(key[1])
-                else:
-                    match_list.append(not key[1])
-        if or_:
-            return any(m for m in match_list)
-        return all(m for m in match_list)
-
-    def search(  # noqa: PLR0912
+    def search(
         self,
         query: list[str],
         *,
@@ -714,11 +984,13 @@ class Entry:
         decode_unicode: bool = False,
         decode_latex: bool = False,
         fuzziness: int = 0,
+        grep_outputs: dict[str, list[str]] | None = None,
+        text_matches: list[list[Match]] | None = None,
     ) -> list[Match]:
         """Search entry contents for the query strings.
 
         The entry will *always* be converted to a searchable string using the
-        `cobib.parsers.BibtexParser.dump` method.
+        `cobib.parsers.BibtexParser.dump` method (see `Entry.searchable_text`).
 
         .. note::
            Setting `decode_latex=True` and/or `decode_unicode=True` does *NOT* affect the output of
@@ -727,10 +999,15 @@ class Entry:
            will be decoded.
 
         This text will then be search for each item in `query` and will interpret these as regex
-        patterns.
+        patterns (see `Entry.search_text`). When searching multiple entries in parallel, this can be
+        done ahead of time (for example in separate processes) and the results be passed via
+        `text_matches`.
         If a `file` is associated with this entry, the search will try its best to recursively query
         its contents, too. However, the success of this depends highly on the configured search
-        tool, `cobib.config.config.SearchCommandConfig.grep`.
+        tool, `cobib.config.config.SearchCommandConfig.grep`. All files get searched with as few
+        invocations of this tool as possible (see `Entry.grep`). When searching multiple entries,
+        their files should be searched at once ahead of time and the outputs be passed via
+        `grep_outputs`.
 
         Args:
             query: the list of regex patterns to search for.
@@ -743,6 +1020,11 @@ class Entry:
             decode_latex: if True, all LaTeX sequences will be decoded before search.
             fuzziness: the amount of fuzzy errors to allow for search matches. Using this feature
                 requires the optional `regex` dependency to be installed.
+            grep_outputs: the outputs of `Entry.grep` for (at least) all associated files of this
+                entry and the same `query`, `context`, `ignore_case` and `fuzziness`. If omitted,
+                the files get searched by this method.
+            text_matches: the result of `Entry.search_text` for the searchable text of this entry
+                and the same arguments. If omitted, the text gets searched by this method.
 
         Returns:
             A list of lists containing the context for each match associated with this entry.
@@ -756,18 +1038,104 @@ class Entry:
             )
 
         LOGGER.debug("Searching entry %s.", self.label)
+
+        if text_matches is None:
+            text_matches = self.search_text(
+                self.searchable_text(skip_notes=skip_notes),
+                query,
+                notes=None if self.notes is None else str(self.notes),
+                context=context,
+                ignore_case=ignore_case,
+                decode_unicode=decode_unicode,
+                decode_latex=decode_latex,
+                fuzziness=fuzziness,
+            )
+
+        if skip_files:
+            LOGGER.debug("Skipping the search in associated files of %s", self.label)
+            return [match_ for query_matches in text_matches for match_ in query_matches]
+
+        _, compiled = self._compile(query, ignore_case=ignore_case, fuzziness=fuzziness)
+        file_outputs = self._grep_files(
+            query, context, grep_outputs, ignore_case=ignore_case, fuzziness=fuzziness
+        )
+
         matches: list[Match] = []
+        for query_idx, (re_compiled, query_matches) in enumerate(zip(compiled, text_matches)):
+            matches.extend(query_matches)
 
+            for file_, outputs in file_outputs.items():
+                stdout = outputs[query_idx]
+                if not stdout:
+                    continue
+
+                for file_match in stdout.split("\n--\n"):
+                    stripped = file_match.strip()
+                    file_matches = list(re_compiled.finditer(stripped))
+                    matches.append(
+                        Match(
+                            stripped,
+                            [Span(m.start(), m.end()) for m in file_matches],
+                            str(file_),
+                        )
+                    )
+
+        return matches
+
+    def searchable_text(self, *, skip_notes: bool = False) -> str:
+        """Returns the text of this entry which gets searched by `Entry.search`.
+
+        Args:
+            skip_notes: if True, the associated note will *not* be inlined.
+
+        Returns:
+            The `cobib.parsers.BibtexParser.dump` of this entry without encoding any LaTeX
+            sequences.
+        """
         from cobib.parsers.bibtex import BibtexParser  # noqa: PLC0415
 
-        # get searchable text
-        bibtex_raw = BibtexParser(encode_latex=False, inline_note=not skip_notes).dump(self)
+        return BibtexParser(encode_latex=False, inline_note=not skip_notes).dump(self)
+
+    @staticmethod
+    def search_text(
+        text: str,
+        query: list[str],
+        *,
+        notes: str | None = None,
+        context: int = 1,
+        ignore_case: bool = False,
+        decode_unicode: bool = False,
+        decode_latex: bool = False,
+        fuzziness: int = 0,
+    ) -> list[list[Match]]:
+        """Searches the searchable text of an entry for the query strings.
+
+        This only depends on its arguments (rather than on the entry or the configuration) such that
+        it can be run in a separate process (see also `Entry.search_texts`). All patterns get
+        combined into a single alternation such that the text only needs to be scanned once (see
+        `Entry._scan`).
+
+        Args:
+            text: the searchable text of the entry as returned by `Entry.searchable_text`.
+            query: the list of regex patterns to search for.
+            notes: the path of the associated note of the entry, if it has one. This is used as the
+                source of the matches within the note.
+            context: the number of context lines to provide for each match.
+            ignore_case: if True, the search will be case-*in*sensitive.
+            decode_unicode: if True, all Unicode characters will be decoded before search.
+            decode_latex: if True, all LaTeX sequences will be decoded before search.
+            fuzziness: the amount of fuzzy errors to allow for search matches.
+
+        Returns:
+            The matches of every pattern in the order of the patterns.
+        """
+        bibtex_raw = text
 
         # split into lines and compute their lengths and offsets
         lines = bibtex_raw.split("\n")
         line_lengths = [len(line) + 1 for line in lines]  # + 1 to account for the newline character
         line_offsets = list(accumulate(line_lengths))
-        has_notes = self.notes is not None
+        has_notes = notes is not None
         if has_notes:
             notes_begin = next(
                 idx for idx, line in enumerate(lines) if line.strip().startswith("notes = {")
@@ -777,30 +1145,24 @@ class Entry:
             )
 
         if decode_latex:
-            dec = self._get_latex_to_text_decoder()
-            bibtex_raw = dec.latex_to_text(bibtex_raw)
+            bibtex_raw = Entry.decode_latex(bibtex_raw)
 
         if decode_unicode:
             bibtex_raw = unidecode(bibtex_raw)
 
         re_flags = regex.IGNORECASE if ignore_case else 0
-        for query_str in query:
-            if fuzziness:
-                re_compiled = regex.compile(rf"({query_str}){{e<={fuzziness}}}", flags=re_flags)
-            else:
-                re_compiled = regex.compile(rf"{query_str}", flags=re_flags)
+        patterns, compiled = Entry._compile(query, ignore_case=ignore_case, fuzziness=fuzziness)
 
-            # find all query matches
-            re_matches = list(re_compiled.finditer(bibtex_raw))
+        # find all query matches
+        query_matches = Entry._scan(bibtex_raw, patterns, compiled, re_flags, fuzziness=fuzziness)
 
+        results: list[list[Match]] = []
+        for re_matches in query_matches:
+            matches: list[Match] = []
             # determine line index for each match
-            matched_line_indices = []
-            for match_ in re_matches:
-                end = match_.span()[1]
-                for line_idx, offset in enumerate(line_offsets):
-                    if offset > end:
-                        matched_line_indices.append(line_idx)
-                        break
+            matched_line_indices = [
+                bisect_right(line_offsets, match_.end()) for match_ in re_matches
+            ]
 
             matched_line_indices_set = set(matched_line_indices)
             prev_idx = 0
@@ -834,7 +1196,7 @@ class Entry:
 
                 source = ""
                 if has_notes and (line_idx >= notes_begin or line_idx <= notes_end):
-                    source = str(self.notes)
+                    source = str(notes)
 
                 offset = line_offsets[start - 1] if start > 0 else 0
                 matches.append(
@@ -847,45 +1209,437 @@ class Entry:
 
                 prev_idx = line_idx
 
-            if skip_files:
-                LOGGER.debug("Skipping the search in associated files of %s", self.label)
+            results.append(matches)
+
+        return results
+
+    @staticmethod
+    def search_texts(
+        texts: list[tuple[str, str | None]],
+        query: list[str],
+        *,
+        context: int = 1,
+        ignore_case: bool = False,
+        decode_unicode: bool = False,
+        decode_latex: bool = False,
+        fuzziness: int = 0,
+    ) -> list[list[list[Match]]]:
+        """Searches the searchable texts of multiple entries for the query strings.
+
+        This is executed in the worker processes of a parallel search (see
+        `cobib.config.config.SearchCommandConfig.parallel`).
+
+        Args:
+            texts: the pairs of the searchable text (see `Entry.searchable_text`) and the path of
+                the associated note (if any) of every entry.
+            query: the list of regex patterns to search for.
+            context: the number of context lines to provide for each match.
+            ignore_case: if True, the search will be case-*in*sensitive.
+            decode_unicode: if True, all Unicode characters will be decoded before search.
+            decode_latex: if True, all LaTeX sequences will be decoded before search.
+            fuzziness: the amount of fuzzy errors to allow for search matches.
+
+        Returns:
+            The result of `Entry.search_text` for every entry in the given order.
+        """
+        return [
+            Entry.search_text(
+                text,
+                query,
+                notes=notes,
+                context=context,
+                ignore_case=ignore_case,
+                decode_unicode=decode_unicode,
+                decode_latex=decode_latex,
+                fuzziness=fuzziness,
+            )
+            for text, notes in texts
+        ]
+
+    @staticmethod
+    def _compile(
+        query: list[str], *, ignore_case: bool = False, fuzziness: int = 0
+    ) -> tuple[list[str], list[regex.Pattern[str]]]:
+        """Compiles the search patterns.
+
+        Args:
+            query: the list of regex patterns to search for.
+            ignore_case: if True, the patterns will be case-*in*sensitive.
+            fuzziness: the amount of fuzzy errors to allow for matches.
+
+        Returns:
+            The pair of the patterns (including their fuzziness) and their compiled versions.
+        """
+        re_flags = regex.IGNORECASE if ignore_case else 0
+        if fuzziness:
+            patterns = [rf"({query_str}){{e<={fuzziness}}}" for query_str in query]
+        else:
+            patterns = [rf"{query_str}" for query_str in query]
+        return patterns, [regex.compile(pattern, flags=re_flags) for pattern in patterns]
+
+    @staticmethod
+    def _scan(
+        text: str,
+        patterns: list[str],
+        compiled: list[regex.Pattern[str]],
+        flags: int,
+        *,
+        fuzziness: int = 0,
+    ) -> list[list[regex.Match[str]]]:
+        """Finds all matches of multiple patterns in a single scan of a text.
+
+        The patterns get combined into an alternation of named groups whose matches get assigned to
+        their patterns based on the group which matched. The result is identical to finding all
+        matches of every pattern independently. Thus, the text gets scanned once per pattern
+        instead, whenever the alternation would hide a match of one pattern behind a match of
+        another one. This is also the case for empty matches, patterns with their own groups and
+        fuzzy patterns.
+
+        Args:
+            text: the text to search.
+            patterns: the regex patterns.
+            compiled: the compiled regex patterns.
+            flags: the flags with which the patterns were compiled.
+            fuzziness: the amount of fuzzy errors allowed by the patterns.
+
+        Returns:
+            The matches of every pattern in the order of the patterns.
+        """
+        if len(compiled) > 1 and not fuzziness and not any(pattern.groups for pattern in compiled):
+            try:
+                combined = regex.compile(
+                    "|".join(f"(?P<q{idx}>{pattern})" for idx, pattern in enumerate(patterns)),
+                    flags=flags,
+                )
+            except regex.error:
+                LOGGER.debug("The search patterns cannot be combined into a single alternation.")
+            else:
+                results: list[list[regex.Match[str]]] = [[] for _ in compiled]
+                for match_ in combined.finditer(text):
+                    start, end = match_.span()
+                    owner = int(cast(str, match_.lastgroup)[1:])
+                    if start == end or any(
+                        pattern.match(text, position)
+                        for idx, pattern in enumerate(compiled)
+                        if idx != owner
+                        for position in range(start, end)
+                    ):
+                        break
+                    results[owner].append(match_)
+                else:
+                    return results
+        return [list(pattern.finditer(text)) for pattern in compiled]
+
+    def _grep_files(
+        self,
+        query: list[str],
+        context: int,
+        grep_outputs: dict[str, list[str]] | None,
+        *,
+        ignore_case: bool = False,
+        fuzziness: int = 0,
+    ) -> dict[str, list[str]]:
+        """Searches the associated files of this entry.
+
+        Args:
+            query: the list of regex patterns to search for.
+            context: the number of context lines to provide for each match.
+            grep_outputs: the optional outputs of `Entry.grep` which were computed ahead of time.
+            ignore_case: if True, the search of extracted texts will be case-*in*sensitive.
+            fuzziness: the amount of fuzzy errors to allow for matches in extracted texts.
+
+        Returns:
+            The output of the search tool for every pattern, indexed by the associated file.
+        """
+        existing: list[str] = []
+        for file_ in self.file:
+            if not RelPath(file_).path.exists():
+                LOGGER.warning(
+                    "The associated file %s of entry %s does not exist!", file_, self.label
+                )
                 continue
+            existing.append(file_)
 
-            for file_ in self.file:
-                grep_prog = config.commands.search.grep
-                path = RelPath(file_).path
-                if not path.exists():
-                    LOGGER.warning(
-                        "The associated file %s of entry %s does not exist!", file_, self.label
-                    )
+        if grep_outputs is None:
+            grep_outputs = Entry.grep(
+                existing, query, context, ignore_case=ignore_case, fuzziness=fuzziness
+            )
+        return {file_: grep_outputs.get(file_, None) or [""] * len(query) for file_ in existing}
+
+    @staticmethod
+    def grep(
+        files: Iterable[str],
+        query: list[str],
+        context: int,
+        *,
+        ignore_case: bool = False,
+        fuzziness: int = 0,
+    ) -> dict[str, list[str]]:
+        """Searches multiple files with the `cobib.config.config.SearchCommandConfig.grep` tool.
+
+        When `cobib.config.config.SearchCommandConfig.extractor` is configured, the texts of the
+        files get extracted by it instead (see `cobib.database.text_cache.extract`) and searched
+        in-process just like the entries themselves. Since these texts are cached, no subprocess
+        gets spawned for files whose texts have been extracted before. Only files whose texts could
+        not be extracted get searched with the tool.
+
+        All files get passed to a single invocation of this tool together with all patterns (via
+        `-e`), split into batches of at most `GREP_BATCH_SIZE` files per invocation. When multiple
+        patterns were given, the matching lines reported by the tool get re-tested against every
+        single pattern in-process in order to report the (context) lines of every pattern separately
+        (see `Entry._attribute`). These re-tests are case-*in*sensitive if the tool is configured
+        to be so via the `-i` or `--ignore-case` argument. Only patterns with characters which the
+        tool may interpret differently from the regex engine (like `(`, `|` or `+`) get searched
+        once more on their own by the tool instead.
+
+        The output of the tool gets split back into the outputs of the individual files based on the
+        file name which prefixes every line (see `Entry._demultiplex`). Thus, these are identical to
+        the outputs of searching the files one by one. Batches in which these prefixes are ambiguous
+        (see `Entry._ambiguous`) get searched one file at a time instead.
+
+        Args:
+            files: the paths of the files. Files which do not exist are skipped.
+            query: the list of regex patterns to search for.
+            context: the number of context lines to provide for each match.
+            ignore_case: if True, the search of extracted texts will be case-*in*sensitive. This
+                does not affect the tool (see `cobib.config.config.SearchCommandConfig.grep_args`).
+            fuzziness: the amount of fuzzy errors to allow for matches in extracted texts.
+
+        Returns:
+            The output of the search tool for every pattern, indexed by the files with any results.
+        """
+        paths: dict[str, list[str]] = {}
+        for file_ in files:
+            resolved = RelPath(file_).path
+            if resolved.exists():
+                path_str = str(resolved)
+                paths.setdefault(path_str, [])
+                if file_ not in paths[path_str]:
+                    paths[path_str].append(file_)
+
+        outputs: dict[str, list[str]] = {}
+        extracted: set[str] = set()
+        command = config.commands.search.extractor
+        cache = text_cache.directory()
+        if command and cache is not None:
+            _, compiled = Entry._compile(query, ignore_case=ignore_case, fuzziness=fuzziness)
+            for path in paths:
+                text = text_cache.extract(path, command, cache)
+                if text is None:
+                    continue
+                output = text_cache.grep(text, compiled, context)
+                if any(output):
+                    outputs[path] = output
+                extracted.add(path)
+
+        remaining = [path for path in paths if path not in extracted]
+        LOGGER.debug(
+            "Searching %d associated files with %s", len(remaining), config.commands.search.grep
+        )
+        combined = Entry._grep_batches(remaining, query, context) if remaining else {}
+        if len(query) > 1 and combined:
+            tool_ignore_case = any(
+                arg in {"-i", "--ignore-case"} for arg in config.commands.search.grep_args
+            )
+            _, separate = Entry._compile(query, ignore_case=tool_ignore_case)
+            for path in combined:
+                outputs[path] = []
+            for query_str, pattern in zip(query, separate):
+                if _PORTABLE_PATTERN.fullmatch(query_str):
+                    for path, groups in combined.items():
+                        outputs[path].append(Entry._attribute(groups, pattern, context))
                     continue
+                rerun = Entry._grep_batches(list(combined), [query_str], context)
+                for path in combined:
+                    outputs[path].append(Entry._render(rerun.get(path, [])))
+        else:
+            outputs.update({path: [Entry._render(groups)] for path, groups in combined.items()})
 
-                LOGGER.debug("Searching associated file %s with %s", file_, grep_prog)
-                with subprocess.Popen(
-                    [
-                        grep_prog,
-                        *config.commands.search.grep_args,
-                        f"-C{context}",
-                        query_str,
-                        RelPath(file_).path,
-                    ],
-                    stdout=subprocess.PIPE,
-                ) as grep:
-                    if grep.stdout is None:
-                        continue
-                    stdout = grep.stdout.read().decode()
-                    if not stdout:
-                        continue
+        return {file_: output for path, output in outputs.items() for file_ in paths[path]}
 
-                for file_match in stdout.split("\n--\n"):
-                    stripped = file_match.strip()
-                    file_matches = list(re_compiled.finditer(stripped))
-                    matches.append(
-                        Match(
-                            stripped,
-                            [Span(m.start(), m.end()) for m in file_matches],
-                            str(file_),
-                        )
-                    )
+    @staticmethod
+    def _grep_batches(
+        paths: list[str], query: list[str], context: int
+    ) -> dict[str, list[list[tuple[bool | None, str]]]]:
+        """Runs the `cobib.config.config.SearchCommandConfig.grep` tool over batches of files.
 
-        return matches
+        Args:
+            paths: the paths of the files.
+            query: the list of regex patterns to search for.
+            context: the number of context lines to provide for each match.
+
+        Returns:
+            The groups of lines reported by the search tool (see `Entry._demultiplex`), indexed by
+            the paths of the files with any results.
+        """
+        batches: list[list[str]] = []
+        for batch_start in range(0, len(paths), GREP_BATCH_SIZE):
+            batch = paths[batch_start : batch_start + GREP_BATCH_SIZE]
+            if Entry._ambiguous(batch):
+                LOGGER.debug("Searching the files of an ambiguous batch one by one.")
+                batches.extend([path] for path in batch)
+            else:
+                batches.append(batch)
+
+        outputs: dict[str, list[list[tuple[bool | None, str]]]] = {}
+        for batch in batches:
+            with subprocess.Popen(
+                [
+                    config.commands.search.grep,
+                    *config.commands.search.grep_args,
+                    "-H",
+                    f"-C{context}",
+                    *(arg for query_str in query for arg in ("-e", query_str)),
+                    *batch,
+                ],
+                stdout=subprocess.PIPE,
+            ) as grep:
+                if grep.stdout is None:
+                    continue  # pragma: no cover
+                stdout = grep.stdout.read().decode()
+            outputs.update(Entry._demultiplex(stdout, batch))
+        return outputs
+
+    @staticmethod
+    def _ambiguous(paths: list[str]) -> bool:
+        """Checks whether the output of the search tool over multiple files is ambiguous.
+
+        This is the case if a path followed by `:` or `-` (see `Entry._demultiplex`) is the prefix
+        of another path, like for `x` and `x-1`. Then, a line of the output cannot be attributed to
+        either of these files reliably.
+
+        Args:
+            paths: the paths of the searched files.
+
+        Returns:
+            Whether any line of the output could be attributed to more than one file.
+        """
+        ordered = sorted(paths)
+        for path in ordered:
+            for prefix in (f"{path}:", f"{path}-"):
+                idx = bisect_left(ordered, prefix)
+                if idx < len(ordered) and ordered[idx].startswith(prefix):
+                    return True
+        return False
+
+    @staticmethod
+    def _demultiplex(
+        stdout: str, paths: list[str]
+    ) -> dict[str, list[list[tuple[bool | None, str]]]]:
+        """Splits the output of the search tool over multiple files into the outputs per file.
+
+        Every matching line is prefixed with `path:` and every context line with `path-`. These
+        prefixes get removed. Groups of consecutive lines are separated by `--`. Any other lines
+        (like notices about matching binary files) get assigned to the file whose path they contain
+        or otherwise to the preceding file.
+
+        Args:
+            stdout: the output of the search tool.
+            paths: the paths of the searched files.
+
+        Returns:
+            The groups of lines reported by the search tool, indexed by the paths of the files with
+            any results. Every line is paired with whether it is a matching line rather than a
+            context line or `None`, if it is neither.
+        """
+        candidates = sorted(paths, key=len, reverse=True)
+        groups: dict[str, list[list[tuple[bool | None, str]]]] = {}
+        current: str | None = None
+        separated = False
+        for line in stdout.split("\n"):
+            if line == "--":
+                separated = True
+                continue
+            if not line:
+                continue
+            path = next(
+                (
+                    candidate
+                    for candidate in candidates
+                    if line.startswith((f"{candidate}:", f"{candidate}-"))
+                ),
+                None,
+            )
+            matched: bool | None = None
+            if path is not None:
+                matched = line[len(path)] == ":"
+                text = line[len(path) + 1 :]
+            else:
+                path = next((candidate for candidate in candidates if candidate in line), current)
+                text = line
+            if path is None:
+                continue
+            file_groups = groups.setdefault(path, [])
+            if not file_groups or (separated and path == current):
+                file_groups.append([])
+            separated = False
+            file_groups[-1].append((matched, text))
+            current = path
+        return groups
+
+    @staticmethod
+    def _render(groups: list[list[tuple[bool | None, str]]]) -> str:
+        """Renders groups of lines of the search tool just like its output for a single file.
+
+        Args:
+            groups: the groups of lines (see `Entry._demultiplex`).
+
+        Returns:
+            The lines of all groups separated by `--` lines or an empty string, if there are none.
+        """
+        if not groups:
+            return ""
+        return "\n--\n".join("\n".join(text for _, text in group) for group in groups) + "\n"
+
+    @staticmethod
+    def _attribute(
+        groups: list[list[tuple[bool | None, str]]], pattern: regex.Pattern[str], context: int
+    ) -> str:
+        """Extracts the output of a single pattern from the output of the search tool for many.
+
+        The output for all patterns contains every line matching any of them together with its
+        `context` lines. Thus, it also contains the context lines of every line which matches the
+        given pattern. These get selected and merged into groups just like the search tool would
+        have done when searching for this pattern alone. Lines which are neither matching nor
+        context lines (see `Entry._demultiplex`) are kept for every pattern.
+
+        Args:
+            groups: the groups of lines reported for all patterns (see `Entry._demultiplex`).
+            pattern: the compiled regex pattern.
+            context: the number of context lines provided for each match.
+
+        Returns:
+            The output of the search tool for the given pattern (see `Entry._render`).
+        """
+        selected: list[list[tuple[bool | None, str]]] = []
+        for group in groups:
+            spans: list[list[int]] = []
+            for idx, (matched, text) in enumerate(group):
+                if matched is None:
+                    start, stop = idx, idx
+                elif matched and pattern.search(text) is not None:
+                    start, stop = max(idx - context, 0), min(idx + context, len(group) - 1)
+                else:
+                    continue
+                if spans and start <= spans[-1][1] + 1:
+                    spans[-1][1] = max(spans[-1][1], stop)
+                else:
+                    spans.append([start, stop])
+            selected.extend(group[start : stop + 1] for start, stop in spans)
+        return Entry._render(selected)
+
+
+_LATEX_CODEC_CACHE_SIZE = 4096
+"""The maximum number of values stored in each of the LaTeX encoding and decoding caches."""
+
+
+@lru_cache(maxsize=_LATEX_CODEC_CACHE_SIZE)
+def _unicode_to_latex(value: str) -> str:
+    """Encodes a value using the `Entry._unicode_to_latex_encoder` (see `Entry.encode_latex`)."""
+    return cast(str, Entry._get_unicode_to_latex_encoder().unicode_to_latex(value))
+
+
+@lru_cache(maxsize=_LATEX_CODEC_CACHE_SIZE)
+def _latex_to_text(value: str) -> str:
+    """Decodes a value using the `Entry._latex_to_text_decoder` (see `Entry.decode_latex`)."""
+    return cast(str, Entry._get_latex_to_text_decoder().latex_to_text(value))
@@ -0,0 +1,261 @@
+"""coBib's compiled entry filters.
+
+This module implements the `FilterPlan` which evaluates the filters described in
+*cobib-filter(7)* (see also `cobib.database.Entry.matches`). It gets built once per filter and can
+then be applied to any number of entries.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Collection, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from text_unidecode import unidecode
+
+from cobib.config import config
+from cobib.utils.regex import regex
+
+from .entry import Entry
+from .range_index import Comparison
+
+if TYPE_CHECKING:
+    from .range_index import RangeIndex
+    from .value_index import ValueIndex
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+_METACHARACTERS = regex.compile(r"[\\.^$*+?{}\[\]|()]")
+"""@private matches any character with a special meaning in a regex pattern."""
+
+
+class FilterPlan:
+    """A filter whose patterns have been compiled ahead of its evaluation.
+
+    Compared to evaluating the filter description for every entry anew, a plan:
+
+    1. compiles every pattern (including its fuzzy variant) exactly once and parses comparison
+       filters (see `cobib.database.range_index.Comparison`),
+    2. only stringifies (and decodes) the fields which are actually filtered on, and
+    3. stops evaluating the remaining patterns of an entry as soon as its result is determined.
+    """
+
+    def __init__(
+        self,
+        filter_: dict[tuple[str, bool], list[Any]],
+        or_: bool,
+        *,
+        ignore_case: bool = False,
+        decode_unicode: bool = False,
+        decode_latex: bool = False,
+        fuzziness: int = 0,
+    ) -> None:
+        """Initializes the plan.
+
+        Args:
+            filter_: dictionary describing the filter as explained in
+                `cobib.database.Entry.matches`.
+            or_ : boolean indicating whether logical OR (`true`) or AND (`false`) is used to combine
+                multiple filter items.
+            ignore_case: if True, the matching will be case-*in*sensitive.
+            decode_unicode: if True, all Unicode characters will be decoded before matching.
+            decode_latex: if True, all LaTeX sequences will be decoded before matching.
+            fuzziness: the amount of fuzzy errors to allow for matches. Using this feature requires
+                the optional `regex` dependency to be installed.
+        """
+        self.or_ = or_
+        """Whether the filter items are combined with a logical OR rather than an AND."""
+
+        self.decode_unicode = decode_unicode
+        """Whether all Unicode characters are decoded before matching."""
+
+        self.decode_latex = decode_latex
+        """Whether all LaTeX sequences are decoded before matching."""
+
+        self.exact = not (ignore_case or decode_unicode or decode_latex or fuzziness)
+        """Whether the patterns are matched against the field values exactly as they are. Only then
+        can literal and prefix patterns be looked up in a `cobib.database.value_index.ValueIndex`
+        directly."""
+
+        re_flags = regex.IGNORECASE if ignore_case else 0
+
+        self.clauses: list[tuple[str, bool, list[regex.Pattern[str] | Comparison]]] = []
+        """The filter items as triplets of the field name, whether a positive match is required and
+        the compiled patterns or comparisons."""
+
+        for (field, positive), values in filter_.items():
+            numeric = field in config.database.numeric_fields
+            patterns: list[regex.Pattern[str] | Comparison] = []
+            for val in values:
+                comparison = Comparison.parse(str(val)) if numeric else None
+                if comparison is not None:
+                    patterns.append(comparison)
+                elif fuzziness:
+                    patterns.append(regex.compile(rf"({val}){{e<={fuzziness}}}", flags=re_flags))
+                else:
+                    patterns.append(regex.compile(rf"{val}", flags=re_flags))
+            self.clauses.append((field, positive, patterns))
+
+        LOGGER.debug("Compiled the filter plan: %s", self.clauses)
+
+    @property
+    def fields(self) -> set[str]:
+        """The names of all fields which are filtered on."""
+        return {field for field, _, _ in self.clauses}
+
+    @property
+    def comparison_fields(self) -> set[str]:
+        """The names of all fields which are only filtered on by comparisons."""
+        return self.fields - {
+            field
+            for field, _, patterns in self.clauses
+            if not all(isinstance(pattern, Comparison) for pattern in patterns)
+        }
+
+    def _decode(self, field_data: str) -> str:
+        """Decodes a field value as configured for this plan.
+
+        Args:
+            field_data: the stringified field value.
+
+        Returns:
+            The decoded field value.
+        """
+        if self.decode_latex:
+            field_data = Entry.decode_latex(field_data)
+        if self.decode_unicode:
+            field_data = unidecode(field_data)
+        return field_data
+
+    def _results(self, entry: Entry) -> Iterator[bool]:
+        """Evaluates the filter items lazily.
+
+        Args:
+            entry: the entry to evaluate.
+
+        Yields:
+            One result per pattern of every filter item whose field is present in the entry and a
+            single result for every filter item whose field is missing.
+        """
+        fields: dict[str, str | None] = {}
+        for field, positive, patterns in self.clauses:
+            if field not in fields:
+                field_data = entry.stringify_field(field, encode_latex=False)
+                fields[field] = None if field_data is None else self._decode(field_data)
+
+            field_data = fields[field]
+            if field_data is None:
+                yield not positive
+                continue
+
+            for pattern in patterns:
+                if pattern.search(field_data):
+                    yield positive
+                else:
+                    yield not positive
+
+    def matches(self, entry: Entry) -> bool:
+        """Checks whether an entry matches this filter.
+
+        Args:
+            entry: the entry to check.
+
+        Returns:
+            Whether the entry matches this filter.
+        """
+        if self.or_:
+            return any(self._results(entry))
+        return all(self._results(entry))
+
+    def apply(self, entries: Iterable[Entry]) -> Iterator[Entry]:
+        """Applies this filter to multiple entries.
+
+        Args:
+            entries: the entries to filter.
+
+        Yields:
+            The entries which match this filter in their given order.
+        """
+        for entry in entries:
+            if self.matches(entry):
+                LOGGER.debug('Entry "%s" matches the filter.', entry.label)
+                yield entry
+
+    def _select_pattern(
+        self,
+        index: ValueIndex,
+        field: str,
+        pattern: regex.Pattern[str] | Comparison,
+        ranges: RangeIndex | None,
+    ) -> set[str]:
+        """Looks up the labels of all entries whose field matches a pattern.
+
+        Comparisons are looked up in the range index, if it contains the field. Literal patterns are
+        looked up among the list elements and patterns consisting of a `^` followed by a literal
+        prefix are looked up among the sorted field values. All other patterns get evaluated once
+        for every distinct field value.
+
+        Args:
+            index: the value index. It must contain the field unless it is only filtered on by
+                comparisons and the range index contains it.
+            field: the name of the field.
+            pattern: the compiled pattern or comparison.
+            ranges: the optional range index.
+
+        Returns:
+            The labels of all entries whose field matches the pattern.
+        """
+        if isinstance(pattern, Comparison) and ranges is not None and field in ranges:
+            return ranges.select(field, pattern)
+        if self.exact and not isinstance(pattern, Comparison):
+            source = pattern.pattern
+            if not _METACHARACTERS.search(source):
+                labels = index.contains(field, source)
+                if labels is not None:
+                    return labels
+            if source.startswith("^") and not _METACHARACTERS.search(source[1:]):
+                return index.startswith(field, source[1:])
+        return index.match(field, lambda value: bool(pattern.search(self._decode(value))))
+
+    def select(
+        self, index: ValueIndex, labels: Collection[str], ranges: RangeIndex | None = None
+    ) -> set[str]:
+        """Evaluates this filter on a value index rather than on the individual entries.
+
+        Every pattern gets turned into the set of labels of the entries which it matches (see
+        `FilterPlan._select_pattern`) and these sets get combined according to the filter items.
+        The result is identical to applying `FilterPlan.matches` to all entries.
+
+        Args:
+            index: the value index. It must contain all fields of this filter (see `fields`), except
+                for those only filtered on by comparisons (see `comparison_fields`), if these are
+                contained in the range index.
+            labels: the labels of all entries in the database.
+            ranges: the optional range index.
+
+        Returns:
+            The labels of the entries which match this filter.
+        """
+        results: list[set[str]] = []
+        for field, positive, patterns in self.clauses:
+            selections = [
+                self._select_pattern(index, field, pattern, ranges) for pattern in patterns
+            ]
+            if positive and not self.or_:
+                # the field must be present and match all patterns
+                results.append(selections[0].intersection(*selections[1:]))
+            elif positive:
+                # the field must be present and match any pattern
+                results.append(set.union(*selections))
+            elif not self.or_:
+                # the field must be missing or match none of the patterns
+                results.append(set(labels).difference(*selections))
+            else:
+                # the field must be missing or not match all of the patterns
+                results.append(set(labels).difference(selections[0].intersection(*selections[1:])))
+        if not results:
+            return set() if self.or_ else set(labels)
+        if self.or_:
+            return set.union(*results)
+        return set.intersection(*results)
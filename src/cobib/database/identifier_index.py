@@ -0,0 +1,290 @@
+"""coBib's identifier index.
+
+This module implements the index of the normalized identifiers (DOIs, arXiv IDs, ISBNs and URLs) of
+all entries which is maintained by the `cobib.database.Database` class. This allows the
+`cobib.commands.AddCommand` to detect an existing entry before querying any of the online parsers.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+# NOTE: the following patterns mirror those of the corresponding parsers in `cobib.parsers` which
+# cannot be imported here without causing a circular import.
+_DOI = re.compile(r'(10\.[0-9a-zA-Z]+\/(?:(?!["&\'\?])\S)+)\b')
+"""@private matches a DOI."""
+
+_ARXIV = re.compile(r"(\d{4}.\d{4,5}|[a-z\-]+(\.[A-Z]{2})?\/\d{7})(v\d+)?")
+"""@private matches an arXiv ID with an optional version."""
+
+_ISBN = re.compile(r"(97[89]{1}(?:-?\d){10}|\d{9}[0-9X]{1}|[-0-9X]{10,16})", re.I | re.M | re.S)
+"""@private matches an ISBN."""
+
+_URL = re.compile(r"\s*(?:https?://)?(?:www\.)?([^/\s]+)(\S*?)/*\s*")
+"""@private matches a URL split into its host and remainder."""
+
+KINDS = ("doi", "arxiv", "isbn", "url")
+"""The kinds of identifiers which are indexed. These match the names of the corresponding parsers
+in `cobib.parsers`."""
+
+_ISBN10_LENGTH = 10
+"""@private the number of characters of an ISBN-10."""
+
+_ISBN13_LENGTH = 13
+"""@private the number of digits of an ISBN-13."""
+
+
+def _isbn13_checksum(digits: str) -> int:
+    """Computes the weighted sum of the first digits of an ISBN-13 modulo 10.
+
+    Args:
+        digits: the digits.
+
+    Returns:
+        The weighted sum modulo 10, which is zero for a valid ISBN-13.
+    """
+    return sum(int(char) * (3 if pos % 2 else 1) for pos, char in enumerate(digits)) % 10
+
+
+def _isbn13(string: str) -> str | None:
+    """Normalizes an ISBN to its ISBN-13 form.
+
+    Args:
+        string: the ISBN-10 or ISBN-13, optionally including hyphens or spaces.
+
+    Returns:
+        The ISBN-13 consisting only of digits or `None`, if the checksum is invalid.
+    """
+    digits = re.sub(r"[^0-9X]", "", string.upper())
+    if len(digits) == _ISBN10_LENGTH and digits[:-1].isdigit():
+        weights = range(_ISBN10_LENGTH, 0, -1)
+        values = [10 if char == "X" else int(char) for char in digits]
+        if sum(weight * value for weight, value in zip(weights, values)) % 11:
+            return None
+        digits = "978" + digits[:-1]
+        return digits + str(-_isbn13_checksum(digits) % 10)
+    if len(digits) == _ISBN13_LENGTH and digits.isdigit() and not _isbn13_checksum(digits):
+        return digits
+    return None
+
+
+def normalize(kind: str, string: str) -> str | None:
+    """Normalizes an identifier.
+
+    * DOIs are case-insensitive and, thus, get lower-cased.
+    * arXiv IDs are stripped of any prefix (like `arXiv:` or the URL of the abstract) and version.
+    * ISBNs are converted to their ISBN-13 form without any separators.
+    * URLs are stripped of their scheme, any `www.` subdomain and trailing slashes and their host is
+      lower-cased.
+
+    Args:
+        kind: one of the `KINDS` of identifiers.
+        string: the string containing the identifier.
+
+    Returns:
+        The normalized identifier or `None`, if the string does not contain a valid one.
+    """
+    match: re.Match[str] | None
+    if kind == "doi":
+        match = _DOI.search(string)
+        return None if match is None else match.group(1).lower()
+    if kind == "arxiv":
+        match = _ARXIV.search(string)
+        return None if match is None else match.group(1)
+    if kind == "isbn":
+        match = _ISBN.search(string)
+        return None if match is None else _isbn13(match.group(1))
+    if kind == "url":
+        match = _URL.fullmatch(string)
+        return None if match is None else match.group(1).lower() + match.group(2)
+    return None
+
+
+class IdentifierIndex:
+    """The index of the normalized identifiers of all entries.
+
+    The identifiers are taken from the following fields:
+
+    * DOIs: `doi`
+    * arXiv IDs: `arxivid` and `eprint` (unless the `archivePrefix` is not `arXiv`)
+    * ISBNs: `isbn`
+    * URLs: `url`
+
+    The index is maintained incrementally through `IdentifierIndex.update` and
+    `IdentifierIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty identifier index."""
+        self._identifiers: dict[str, tuple[tuple[str, str], ...]] = {}
+        """The pairs of the kind and normalized value of all identifiers of every entry, indexed by
+        label."""
+
+        self._labels: dict[tuple[str, str], set[str]] = {}
+        """The labels of the entries with a given identifier, indexed by the pair of its kind and
+        normalized value."""
+
+        self._built: bool = False
+        """Whether the index has been built."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether the index has been built."""
+        return self._built
+
+    def clear(self) -> None:
+        """Drops the index."""
+        self._identifiers = {}
+        self._labels = {}
+        self._built = False
+        self.modified = False
+
+    @staticmethod
+    def identifiers(entry: Entry) -> tuple[tuple[str, str], ...]:
+        """Extracts the normalized identifiers of an entry.
+
+        Args:
+            entry: the entry.
+
+        Returns:
+            The distinct pairs of the kind and normalized value of all identifiers of the entry.
+        """
+        data = entry.data
+        candidates: list[tuple[str, Any]] = [("doi", data.get("doi", None))]
+        if str(data.get("archivePrefix", "arXiv")).lower() == "arxiv":
+            candidates.append(("arxiv", data.get("eprint", None)))
+        candidates.append(("arxiv", data.get("arxivid", None)))
+        candidates.append(("isbn", data.get("isbn", None)))
+        urls = data.get("url", None)
+        candidates.extend(("url", url) for url in (urls if isinstance(urls, list) else [urls]))
+
+        identifiers: dict[tuple[str, str], None] = {}
+        for kind, value in candidates:
+            if value is None:
+                continue
+            normalized = normalize(kind, str(value))
+            if normalized is not None:
+                identifiers[(kind, normalized)] = None
+        return tuple(identifiers)
+
+    def _add(self, label: str, identifiers: tuple[tuple[str, str], ...]) -> None:
+        """Adds an entry to the index.
+
+        Args:
+            label: the label of the entry.
+            identifiers: its identifiers as returned by `IdentifierIndex.identifiers`.
+        """
+        self._identifiers[label] = identifiers
+        for identifier in identifiers:
+            self._labels.setdefault(identifier, set()).add(label)
+
+    def _discard(self, label: str) -> None:
+        """Removes an entry from the index.
+
+        Args:
+            label: the label of the entry.
+        """
+        for identifier in self._identifiers.pop(label, ()):
+            labels = self._labels[identifier]
+            labels.discard(label)
+            if not labels:
+                del self._labels[identifier]
+
+    def build(self, entries: Iterable[tuple[str, Entry]]) -> None:
+        """Builds the index.
+
+        Args:
+            entries: the pairs of labels and entries of the entire database.
+        """
+        LOGGER.info("Building the identifier index.")
+        self.clear()
+        for label, entry in entries:
+            self._add(label, self.identifiers(entry))
+        self._built = True
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the index after an entry has been added or changed.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        self._discard(label)
+        self._add(label, self.identifiers(entry))
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the index after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        if label in self._identifiers:
+            self._discard(label)
+            self.modified = True
+
+    def find(self, kind: str, string: str) -> set[str]:
+        """Finds the entries with a given identifier.
+
+        Args:
+            kind: one of the `KINDS` of identifiers.
+            string: the string containing the identifier. This is normalized just like the field
+                values of the entries (see `normalize`).
+
+        Returns:
+            The labels of all entries with this identifier.
+        """
+        normalized = normalize(kind, string)
+        if normalized is None:
+            return set()
+        return set(self._labels.get((kind, normalized), ()))
+
+    def dump(self) -> dict[str, tuple[tuple[str, str], ...]]:
+        """Returns the state of the index for storage.
+
+        Returns:
+            A dictionary mapping the labels of all entries to their identifiers.
+        """
+        return self._identifiers if self._built else {}
+
+    def load(
+        self,
+        state: dict[str, tuple[tuple[str, str], ...]],
+        labels: list[str],
+        construct: Callable[[str], Entry],
+        outdated: set[str],
+    ) -> None:
+        """Restores the index from its stored state.
+
+        The identifiers of entries which are missing from the index or have changed get extracted
+        anew.
+
+        Args:
+            state: the stored state as returned by `IdentifierIndex.dump`.
+            labels: the labels of the entire database.
+            construct: a callable returning the entry of a label.
+            outdated: the labels of all entries which have changed since the state was stored.
+        """
+        self.clear()
+        if not state:
+            return
+        for label in labels:
+            if label in outdated or label not in state:
+                self._add(label, self.identifiers(construct(label)))
+                self.modified = True
+            else:
+                self._add(label, state[label])
+        self._built = True
+        if len(self._identifiers) != len(state):
+            self.modified = True
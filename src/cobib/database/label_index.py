@@ -0,0 +1,262 @@
+"""coBib's label index.
+
+This module implements the index of entry labels by their base labels (i.e. the labels without their
+disambiguation suffix as configured via `cobib.config.config.DatabaseFormatConfig.label_suffix`)
+which is maintained by the `cobib.database.Database` class. This allows related labels to be found
+(see `cobib.database.Database.find_related_labels`) and labels to be disambiguated (see
+`cobib.database.Database.disambiguate_label`) without visiting every label in the database.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from cobib.config import LabelSuffix, config
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+
+class LabelIndex:
+    """The index of all entry labels by their base labels.
+
+    For every label, this stores its base label and the numeric value of its disambiguation suffix
+    (see `cobib.config.config.LabelSuffix.trim_label`). For every base label, this tracks the labels
+    sharing it, the values of their suffixes and the highest one among these. Additionally, all
+    labels are kept in a sorted list in order to look up those starting with a given prefix.
+
+    The index is maintained incrementally through `LabelIndex.update` and `LabelIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty label index."""
+        self._bases: dict[str, tuple[str, int]] = {}
+        """The base label and suffix value of every label."""
+
+        self._groups: dict[str, set[str]] = {}
+        """The labels sharing a base label, indexed by the latter."""
+
+        self._suffixes: dict[str, dict[int, int]] = {}
+        """The number of labels per suffix value, indexed by the base label."""
+
+        self._highest: dict[str, int] = {}
+        """The highest suffix value, indexed by the base label."""
+
+        self._sorted: list[str] = []
+        """All labels in sorted order."""
+
+        self._label_suffix: tuple[str, str] | None = None
+        """The separator and first suffix (which identifies the enumerator) of the
+        `cobib.config.config.DatabaseFormatConfig.label_suffix` setting with which the labels were
+        trimmed. This is `None` while the index has not been built."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether the index has been built."""
+        return self._label_suffix is not None
+
+    def is_current(self) -> bool:
+        """Returns whether the index has been built and is still valid.
+
+        The index becomes invalid when the configured label suffix changes.
+
+        Returns:
+            Whether the index is valid.
+        """
+        return self._label_suffix is not None and self._label_suffix == self._current_suffix()
+
+    def clear(self) -> None:
+        """Drops the index."""
+        self._bases = {}
+        self._groups = {}
+        self._suffixes = {}
+        self._highest = {}
+        self._sorted = []
+        self._label_suffix = None
+        self.modified = False
+
+    @staticmethod
+    def _current_suffix() -> tuple[str, str]:
+        """Returns the currently configured label suffix in a comparable form.
+
+        Returns:
+            The pair of the separator and the first suffix produced by the enumerator.
+        """
+        separator, enumerator = config.database.format.label_suffix
+        return separator, enumerator(1)  # type: ignore[operator]
+
+    @staticmethod
+    def trim(label: str) -> tuple[str, int]:
+        """Trims a label based on the configured label suffix.
+
+        Args:
+            label: the label to trim.
+
+        Returns:
+            The pair of the base label and the numeric value of its suffix.
+        """
+        separator, enumerator = config.database.format.label_suffix
+        return LabelSuffix.trim_label(label, separator, enumerator)
+
+    def _add(self, label: str, base: str, value: int) -> None:
+        """Adds a label to the index.
+
+        Args:
+            label: the label.
+            base: its base label.
+            value: the numeric value of its suffix.
+        """
+        self._bases[label] = (base, value)
+        self._groups.setdefault(base, set()).add(label)
+        suffixes = self._suffixes.setdefault(base, {})
+        suffixes[value] = suffixes.get(value, 0) + 1
+        self._highest[base] = max(self._highest.get(base, 0), value)
+
+    def build(self, labels: Iterable[str]) -> None:
+        """Builds the index.
+
+        Args:
+            labels: the labels of the entire database.
+        """
+        LOGGER.info("Building the label index.")
+        self.clear()
+        self._label_suffix = self._current_suffix()
+        for label in labels:
+            self._add(label, *self.trim(label))
+        self._sorted = sorted(self._bases)
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the index after an entry has been added or changed.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry. This is unused because the index only depends on the label.
+        """
+        if label in self._bases:
+            return
+        self._add(label, *self.trim(label))
+        insort(self._sorted, label)
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the index after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        if label not in self._bases:
+            return
+        base, value = self._bases.pop(label)
+        self._groups[base].discard(label)
+        suffixes = self._suffixes[base]
+        suffixes[value] -= 1
+        if not suffixes[value]:
+            del suffixes[value]
+            if value == self._highest[base]:
+                self._highest[base] = max(suffixes, default=0)
+        if not self._groups[base]:
+            del self._groups[base]
+            del self._suffixes[base]
+            del self._highest[base]
+        del self._sorted[bisect_left(self._sorted, label)]
+        self.modified = True
+
+    def related(self, base: str) -> tuple[set[str], set[str]]:
+        """Returns the labels related to a base label.
+
+        Args:
+            base: the base label.
+
+        Returns:
+            The pair of the labels with this exact base label and the labels which merely start with
+            it.
+        """
+        direct = set(self._groups.get(base, ()))
+        indirect: set[str] = set()
+        for position in range(bisect_left(self._sorted, base), len(self._sorted)):
+            label = self._sorted[position]
+            if not label.startswith(base):
+                break
+            if label not in direct:
+                indirect.add(label)
+        return direct, indirect
+
+    def free_suffix(self, base: str, start: int = 1) -> int:
+        """Returns the lowest suffix value which is not used together with a base label.
+
+        When the used suffix values of the base label have no gaps, this takes constant time.
+
+        Args:
+            base: the base label.
+            start: the lowest suffix value to consider.
+
+        Returns:
+            The lowest unused suffix value which is not lower than `start`.
+        """
+        suffixes = self._suffixes.get(base, None)
+        if not suffixes:
+            return start
+        highest = self._highest[base]
+        if start > highest:
+            return start
+        if start <= 1 and len(suffixes) - (0 in suffixes) == highest:
+            return highest + 1
+        value = start
+        while value in suffixes:
+            value += 1
+        return value
+
+    def dump(self) -> dict[tuple[str, str], dict[str, tuple[str, int]]]:
+        """Returns the state of the index for storage.
+
+        Returns:
+            A dictionary mapping the label suffix setting with which the labels were trimmed (if the
+            index is valid) to the base label and suffix value of every label.
+        """
+        if not self.is_current():
+            return {}
+        return {self._current_suffix(): self._bases}
+
+    def load(
+        self,
+        state: dict[tuple[str, str], dict[str, tuple[str, int]]],
+        labels: list[str],
+        construct: Callable[[str], Any],
+        outdated: set[str],
+    ) -> None:
+        """Restores the index from its stored state.
+
+        A stale index is dropped and labels which are missing from the index get trimmed anew.
+
+        Args:
+            state: the stored state as returned by `LabelIndex.dump`.
+            labels: the labels of the entire database.
+            construct: a callable returning the entry of a label. This is unused because the index
+                only depends on the labels.
+            outdated: the labels of all entries which have changed since the state was stored. This
+                is unused because the index only depends on the labels.
+        """
+        self.clear()
+        for label_suffix, stored in state.items():
+            if label_suffix != self._current_suffix():
+                LOGGER.info("Dropping the stale label index.")
+                self.modified = True
+                continue
+            self._label_suffix = label_suffix
+            for label in labels:
+                if label in stored:
+                    self._add(label, *stored[label])
+                else:
+                    self._add(label, *self.trim(label))
+                    self.modified = True
+            self._sorted = sorted(self._bases)
+            if len(self._bases) != len(stored):
+                self.modified = True
@@ -0,0 +1,380 @@
+"""coBib's range index.
+
+This module implements the comparison filters described in *cobib-filter(7)* (like `>=2015`) as
+well as the sorted index of numeric and date-like field values which is maintained by the
+`cobib.database.Database` class for the fields listed in
+`cobib.config.config.DatabaseConfig.numeric_fields`. This allows such filters (see
+`cobib.database.filter_plan.FilterPlan.select`) to be answered with a binary search rather than by
+visiting every entry.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable
+from typing import cast
+
+from cobib.config import config
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+_NUMBER = r"\d+(?:[-/.]\d+)*"
+"""@private a number or a date-like sequence of numbers separated by single `-`, `/` or `.`."""
+
+_NUMERIC_VALUE = re.compile(rf"\s*({_NUMBER})")
+"""@private matches the leading number of a field value."""
+
+_COMPARISON = re.compile(rf"(<=|>=|<|>|=)\s*({_NUMBER})\s*")
+"""@private matches a comparison filter."""
+
+
+def numeric_key(value: str) -> tuple[int, ...] | None:
+    """Converts a field value into a comparable key.
+
+    The key consists of the numbers of the leading number or date-like sequence of numbers of the
+    value. For example, `"2015"` yields `(2015,)`, `"2015-03-01"` yields `(2015, 3, 1)` and the page
+    range `"891--921"` yields `(891,)`.
+
+    Args:
+        value: the stringified field value.
+
+    Returns:
+        The key or `None`, if the value does not start with a number.
+    """
+    match = _NUMERIC_VALUE.match(value)
+    if match is None:
+        return None
+    return tuple(int(part) for part in re.split(r"[-/.]", match.group(1)))
+
+
+class Comparison:
+    """A filter which compares numeric or date-like field values against a bound.
+
+    Field values get compared at the precision of the bound. For example, the date `2015-03-01`
+    compares equal to the bound `2015`. Thus, it matches `>=2015` and `<=2015` but neither `>2015`
+    nor `<2015`.
+    """
+
+    def __init__(self, operator: str, bound: tuple[int, ...], pattern: str) -> None:
+        """Initializes the comparison.
+
+        Args:
+            operator: one of `<`, `<=`, `>`, `>=` and `=`.
+            bound: the key (see `numeric_key`) against which to compare.
+            pattern: the filter string from which this comparison was parsed.
+        """
+        self.operator = operator
+        """The comparison operator."""
+
+        self.bound = bound
+        """The key against which to compare."""
+
+        self.pattern = pattern
+        """The filter string from which this comparison was parsed."""
+
+    def __repr__(self) -> str:
+        """Returns the filter string from which this comparison was parsed."""
+        return f"Comparison({self.pattern!r})"
+
+    @classmethod
+    def parse(cls, pattern: str) -> Comparison | None:
+        """Parses a comparison filter.
+
+        Args:
+            pattern: the filter string, for example `">=2015"`.
+
+        Returns:
+            The comparison or `None`, if the filter string is not a comparison.
+        """
+        match = _COMPARISON.fullmatch(pattern)
+        if match is None:
+            return None
+        operator, number = match.groups()
+        return cls(operator, cast(tuple[int, ...], numeric_key(number)), pattern)
+
+    def compare(self, key: tuple[int, ...]) -> bool:
+        """Compares a key against the bound.
+
+        Args:
+            key: the key (see `numeric_key`) of a field value.
+
+        Returns:
+            Whether the key satisfies this comparison.
+        """
+        key = key[: len(self.bound)]
+        if self.operator == "<":
+            return key < self.bound
+        if self.operator == "<=":
+            return key <= self.bound
+        if self.operator == ">":
+            return key > self.bound
+        if self.operator == ">=":
+            return key >= self.bound
+        return key == self.bound
+
+    def search(self, string: str) -> bool:
+        """Checks whether a field value satisfies this comparison.
+
+        This mirrors the `search` method of compiled regex patterns.
+
+        Args:
+            string: the stringified field value.
+
+        Returns:
+            Whether the field value starts with a number which satisfies this comparison.
+        """
+        key = numeric_key(string)
+        return key is not None and self.compare(key)
+
+
+class RangeIndex:
+    """The sorted index of the numeric and date-like values of some fields of all entries.
+
+    For every indexed field, this stores the keys (see `numeric_key`) of the stringified field
+    values (see `cobib.database.Entry.stringify_field`) of all entries in a sorted list. Entries
+    which lack a field or whose value does not start with a number are tracked separately.
+
+    The indexes are maintained incrementally through `RangeIndex.update` and `RangeIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty range index."""
+        self._keys: dict[str, dict[str, tuple[int, ...]]] = {}
+        """The keys of all entries, indexed by field and label."""
+
+        self._missing: dict[str, set[str]] = {}
+        """The labels of the entries without a key, indexed by field."""
+
+        self._orders: dict[str, list[tuple[tuple[int, ...], str]]] = {}
+        """The sorted pairs of key and label, indexed by field."""
+
+        self._separators: dict[str, str | None] = {}
+        """The list separators (see `cobib.config.config.StringifyConfig.list_separator`) with which
+        the indexed fields were stringified."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether any field is indexed."""
+        return bool(self._orders)
+
+    def __contains__(self, field: object) -> bool:
+        """Returns whether the given field is indexed and its index is still valid.
+
+        An index becomes invalid when the list separator configured for its field changes.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            Whether the field is indexed.
+        """
+        return field in self._orders and self._separators[field] == self._separator(str(field))
+
+    def clear(self) -> None:
+        """Drops all indexes."""
+        self._keys = {}
+        self._missing = {}
+        self._orders = {}
+        self._separators = {}
+        self.modified = False
+
+    @staticmethod
+    def _separator(field: str) -> str | None:
+        """Returns the list separator configured for the given field.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            The configured list separator or `None`.
+        """
+        return getattr(config.database.stringify.list_separator, field, None)
+
+    @staticmethod
+    def key(entry: Entry, field: str) -> tuple[int, ...] | None:
+        """Computes the indexed key of an entry.
+
+        Args:
+            entry: the entry.
+            field: the name of the field.
+
+        Returns:
+            The key (see `numeric_key`) of the stringified field value or `None`, if the entry lacks
+            the field or its value does not start with a number.
+        """
+        value = entry.stringify_field(field, encode_latex=False)
+        return None if value is None else numeric_key(value)
+
+    def _add(self, field: str, label: str, key: tuple[int, ...] | None) -> None:
+        """Adds an entry to the index of a field.
+
+        Args:
+            field: the name of the field.
+            label: the label of the entry.
+            key: the key of the entry as returned by `RangeIndex.key`.
+        """
+        if key is None:
+            self._missing[field].add(label)
+            return
+        self._keys[field][label] = key
+        insort(self._orders[field], (key, label))
+
+    def _discard(self, field: str, label: str) -> None:
+        """Removes an entry from the index of a field.
+
+        Args:
+            field: the name of the field.
+            label: the label of the entry.
+        """
+        self._missing[field].discard(label)
+        key = self._keys[field].pop(label, None)
+        if key is None:
+            return
+        order = self._orders[field]
+        position = bisect_left(order, (key, label))
+        if position < len(order) and order[position] == (key, label):
+            del order[position]
+
+    def _initialize(self, field: str) -> None:
+        """Initializes the empty index of a field.
+
+        Args:
+            field: the name of the field.
+        """
+        self._keys[field] = {}
+        self._missing[field] = set()
+        self._orders[field] = []
+        self._separators[field] = self._separator(field)
+
+    def build(self, field: str, entries: Iterable[tuple[str, Entry]]) -> None:
+        """Builds the index of a field.
+
+        Args:
+            field: the name of the field.
+            entries: the pairs of labels and entries of the entire database.
+        """
+        LOGGER.info("Building the range index of the '%s' field.", field)
+        self._initialize(field)
+        for label, entry in entries:
+            key = self.key(entry, field)
+            if key is None:
+                self._missing[field].add(label)
+            else:
+                self._keys[field][label] = key
+        self._orders[field] = sorted((key, label) for label, key in self._keys[field].items())
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the indexes after an entry has been added or changed.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        for field in self._orders:
+            self._discard(field, label)
+            self._add(field, label, self.key(entry, field))
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the indexes after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        for field in self._orders:
+            if label in self._keys[field] or label in self._missing[field]:
+                self._discard(field, label)
+                self.modified = True
+
+    def select(self, field: str, comparison: Comparison) -> set[str]:
+        """Returns the labels of all entries whose field satisfies a comparison.
+
+        This only takes a binary search plus the time to collect the matching labels.
+
+        Args:
+            field: the name of the field. This must be indexed.
+            comparison: the comparison.
+
+        Returns:
+            The labels of all matching entries.
+        """
+        order = self._orders[field]
+        # all keys which compare equal to the bound at its precision lie within [lower, upper)
+        lower = bisect_left(order, (comparison.bound,))
+        upper = bisect_left(order, ((*comparison.bound, math.inf),))
+        if comparison.operator == "<":
+            matching = order[:lower]
+        elif comparison.operator == "<=":
+            matching = order[:upper]
+        elif comparison.operator == ">":
+            matching = order[upper:]
+        elif comparison.operator == ">=":
+            matching = order[lower:]
+        else:
+            matching = order[lower:upper]
+        return {label for _, label in matching}
+
+    def dump(
+        self,
+    ) -> dict[str, tuple[str | None, dict[str, tuple[int, ...]], set[str]]]:
+        """Returns the state of all valid indexes for storage.
+
+        Returns:
+            A dictionary mapping the indexed fields to their list separator, the keys of all entries
+            which have one and the labels of all entries which do not.
+        """
+        return {
+            field: (self._separators[field], keys, self._missing[field])
+            for field, keys in self._keys.items()
+            if field in self
+        }
+
+    def load(
+        self,
+        state: dict[str, tuple[str | None, dict[str, tuple[int, ...]], set[str]]],
+        labels: list[str],
+        construct: Callable[[str], Entry],
+        outdated: set[str],
+    ) -> None:
+        """Restores the indexes from their stored state.
+
+        Stale indexes as well as fields which are no longer listed in
+        `cobib.config.config.DatabaseConfig.numeric_fields` are dropped and the keys of entries
+        which are missing from an index or have changed get recomputed.
+
+        Args:
+            state: the stored state as returned by `RangeIndex.dump`.
+            labels: the labels of the entire database.
+            construct: a callable returning the entry of a label.
+            outdated: the labels of all entries which have changed since the state was stored.
+        """
+        self.clear()
+        for field, (separator, stored, missing) in state.items():
+            if separator != self._separator(field) or field not in config.database.numeric_fields:
+                LOGGER.info("Dropping the stale range index of the '%s' field.", field)
+                self.modified = True
+                continue
+            self._initialize(field)
+            keys = self._keys[field]
+            for label in labels:
+                if label in outdated or (label not in stored and label not in missing):
+                    key = self.key(construct(label), field)
+                    self.modified = True
+                else:
+                    key = stored.get(label, None)
+                if key is None:
+                    self._missing[field].add(label)
+                else:
+                    keys[label] = key
+            self._orders[field] = sorted((key, label) for label, key in keys.items())
+            if len(keys) + len(self._missing[field]) != len(stored) + len(missing):
+                self.modified = True
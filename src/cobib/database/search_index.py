@@ -0,0 +1,406 @@
+"""coBib's full-text search index.
+
+This module implements the inverted index of the words of the searchable text of all entries (i.e.
+their BibTeX rendering and their associated notes) which is maintained by the
+`cobib.database.Database` class. This allows the `cobib.commands.SearchCommand` to only search the
+entries which can contain a match of a literal or word-prefix query rather than every entry.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from cobib.config import config
+from cobib.utils.regex import regex
+from cobib.utils.rel_path import RelPath
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+_WORD = regex.compile(r"\w+")
+"""@private matches a single word."""
+
+_METACHARACTERS = regex.compile(r"[\\.^$*+?{}\[\]|()]")
+"""@private matches any character with a special meaning in a regex pattern."""
+
+_WORD_BOUNDARY = r"\b"
+"""@private the regex assertion of a word boundary."""
+
+_CASE_FOLDING = str.maketrans({"\u0130": "i", "\u0131": "i"})
+"""@private folds the dotted capital and the dotless small I which case-insensitive regex patterns
+match against an ASCII `i` but which `str.casefold` leaves intact."""
+
+
+def _fold(string: str) -> str:
+    """Folds the case of a string such that case-insensitive matches are preserved.
+
+    Args:
+        string: the string to fold.
+
+    Returns:
+        The folded string.
+    """
+    return string.translate(_CASE_FOLDING).casefold()
+
+
+def literal_terms(query: str) -> list[tuple[str, bool, bool]] | None:
+    r"""Splits a literal or word-prefix query into the words which it consists of.
+
+    A query can be answered by the index if it is an ASCII string without any regex metacharacters
+    except for an optional leading and trailing word boundary (`\b`). For example, `quantum`,
+    `quantum computing` and `\bquant` can be answered while `quant.*` cannot.
+
+    Args:
+        query: the query.
+
+    Returns:
+        The case-folded words of the query together with whether they are bounded on the left and
+        on the right, respectively, or `None`, if the query cannot be answered by the index. An
+        unbounded word may be part of a longer word in the searched text.
+    """
+    literal = query
+    left = literal.startswith(_WORD_BOUNDARY)
+    if left:
+        literal = literal[len(_WORD_BOUNDARY) :]
+    right = literal.endswith(_WORD_BOUNDARY)
+    if right:
+        literal = literal[: -len(_WORD_BOUNDARY)]
+    if not literal.isascii() or "\n" in literal or _METACHARACTERS.search(literal):
+        return None
+    terms = [
+        (match.group(), left or match.start() > 0, right or match.end() < len(literal))
+        for match in _WORD.finditer(_fold(literal))
+    ]
+    return terms or None
+
+
+class SearchIndex:
+    """The inverted index of the words of the searchable text of all entries.
+
+    The searchable text of an entry is its BibTeX rendering (see `cobib.parsers.BibtexParser`) with
+    its associated note inlined, just like it gets searched by `cobib.database.Entry.search`. For
+    every case-folded word, this stores the labels of the entries containing it together with the
+    lines on which it occurs. The lines are encoded as a bitmask where the bit `n + 1` stands for
+    the `n`-th line and the bit `0` stands for the `notes` field as it gets rendered without
+    inlining the note. Furthermore, the modification times of the note files as well as the labels
+    of the entries with associated files are tracked.
+
+    The index is maintained incrementally through `SearchIndex.update` and `SearchIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty search index."""
+        self._postings: dict[str, dict[str, int]] = {}
+        """The bitmasks of the lines on which a word occurs in every entry, indexed by the word."""
+
+        self._words: dict[str, tuple[str, ...]] = {}
+        """The words occurring in every entry, indexed by label."""
+
+        self._notes: dict[str, tuple[str, int]] = {}
+        """The path and modification time of the note file of every entry which has one, indexed by
+        label. The modification time is `-1` for a missing file."""
+
+        self._files: set[str] = set()
+        """The labels of the entries with associated files."""
+
+        self._vocabulary: list[str] | None = None
+        """All words in sorted order. This is `None` while it needs to be recomputed."""
+
+        self._stamp: str | None = None
+        """The `cobib.config.config.StringifyConfig.list_separator` setting with which the entries
+        were rendered. This is `None` while the index has not been built."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether the index has been built."""
+        return self._stamp is not None
+
+    def is_current(self) -> bool:
+        """Returns whether the index has been built and is still valid.
+
+        The index becomes invalid when the configured list separators change.
+
+        Returns:
+            Whether the index is valid.
+        """
+        return self._stamp is not None and self._stamp == self._current_stamp()
+
+    def clear(self) -> None:
+        """Drops the index."""
+        self._postings = {}
+        self._words = {}
+        self._notes = {}
+        self._files = set()
+        self._vocabulary = None
+        self._stamp = None
+        self.modified = False
+
+    @staticmethod
+    def _current_stamp() -> str:
+        """Returns the configuration affecting the searchable text in a comparable form.
+
+        Returns:
+            The representation of the configured list separators.
+        """
+        return repr(config.database.stringify.list_separator)
+
+    @staticmethod
+    def _note_stamp(entry: Entry) -> tuple[str, int] | None:
+        """Returns the path and modification time of the note file of an entry.
+
+        Args:
+            entry: the entry.
+
+        Returns:
+            The pair of the path and modification time (or `-1`, if the file does not exist) or
+            `None`, if the entry has no associated note.
+        """
+        if entry.notes is None:
+            return None
+        path = RelPath(entry.notes).path
+        return str(path), path.stat().st_mtime_ns if path.exists() else -1
+
+    @staticmethod
+    def lines(entry: Entry) -> dict[str, int]:
+        """Extracts the words of the searchable text of an entry.
+
+        Args:
+            entry: the entry.
+
+        Returns:
+            The bitmasks of the lines on which every case-folded word occurs.
+        """
+        from cobib.parsers.bibtex import BibtexParser  # noqa: PLC0415
+
+        try:
+            text = BibtexParser(encode_latex=False, inline_note=True).dump(entry)
+        except OSError:
+            text = BibtexParser(encode_latex=False, inline_note=False).dump(entry)
+
+        masks: dict[str, int] = {}
+        if entry.notes is not None:
+            for word in _WORD.findall(_fold(f"notes = {{{entry.notes}}}")):
+                masks[word] = masks.get(word, 0) | 1
+        for line_idx, line in enumerate(text.split("\n")):
+            bit = 1 << (line_idx + 1)
+            for word in _WORD.findall(_fold(line)):
+                masks[word] = masks.get(word, 0) | bit
+        return masks
+
+    def _add(self, label: str, entry: Entry) -> None:
+        """Adds an entry to the index.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        masks = self.lines(entry)
+        self._words[label] = tuple(masks)
+        for word, mask in masks.items():
+            postings = self._postings.get(word, None)
+            if postings is None:
+                postings = self._postings[word] = {}
+                self._vocabulary = None
+            postings[label] = mask
+        note = self._note_stamp(entry)
+        if note is not None:
+            self._notes[label] = note
+        if entry.file:
+            self._files.add(label)
+
+    def _discard(self, label: str) -> None:
+        """Removes an entry from the index.
+
+        Args:
+            label: the label of the entry.
+        """
+        for word in self._words.pop(label, ()):
+            postings = self._postings[word]
+            postings.pop(label, None)
+            if not postings:
+                del self._postings[word]
+                self._vocabulary = None
+        self._notes.pop(label, None)
+        self._files.discard(label)
+
+    def build(self, entries: Iterable[tuple[str, Entry]]) -> None:
+        """Builds the index.
+
+        Args:
+            entries: the pairs of labels and entries of the entire database.
+        """
+        LOGGER.info("Building the full-text search index.")
+        self.clear()
+        self._stamp = self._current_stamp()
+        for label, entry in entries:
+            self._add(label, entry)
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the index after an entry has been added or changed.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        self._discard(label)
+        self._add(label, entry)
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the index after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        if label in self._words:
+            self._discard(label)
+            self.modified = True
+
+    def refresh(self, construct: Callable[[str], Entry]) -> None:
+        """Updates the index after note files have been modified.
+
+        Args:
+            construct: a callable returning the entry of a label.
+        """
+        for label, (path, mtime) in list(self._notes.items()):
+            file = RelPath(path).path
+            if mtime != (file.stat().st_mtime_ns if file.exists() else -1):
+                LOGGER.debug("Re-indexing the modified note of entry '%s'.", label)
+                self.update(label, construct(label))
+
+    def _lookup(self, word: str, left: bool, right: bool) -> dict[str, int]:
+        """Looks up the lines on which a word of a query may occur in every entry.
+
+        Args:
+            word: the case-folded word of the query.
+            left: whether the word is bounded on the left. Otherwise, it may be the end of a longer
+                word in the searched text.
+            right: whether the word is bounded on the right. Otherwise, it may be the start of a
+                longer word in the searched text.
+
+        Returns:
+            The bitmasks of the lines on which the word may occur, indexed by label.
+        """
+        if left and right:
+            return self._postings.get(word, {})
+        if left:
+            if self._vocabulary is None:
+                self._vocabulary = sorted(self._postings)
+            words: list[str] = []
+            for position in range(bisect_left(self._vocabulary, word), len(self._vocabulary)):
+                if not self._vocabulary[position].startswith(word):
+                    break
+                words.append(self._vocabulary[position])
+        elif right:
+            words = [other for other in self._postings if other.endswith(word)]
+        else:
+            words = [other for other in self._postings if word in other]
+        merged: dict[str, int] = {}
+        for other in words:
+            for label, mask in self._postings[other].items():
+                merged[label] = merged.get(label, 0) | mask
+        return merged
+
+    def candidates(self, query: list[str], *, skip_files: bool = False) -> set[str] | None:
+        """Looks up the entries which may contain a match of any of the given queries.
+
+        An entry is a candidate for a query if all of the words of the latter (see `literal_terms`)
+        occur on a common line of its searchable text. Case is ignored during the lookup such that
+        the candidates can be verified both, case-sensitively and case-insensitively.
+
+        Args:
+            query: the list of queries.
+            skip_files: if `False`, all entries with associated files are included because these
+                files are not indexed.
+
+        Returns:
+            The labels of all candidate entries or `None`, if any of the queries cannot be answered
+            by the index.
+        """
+        labels: set[str] = set() if skip_files else set(self._files)
+        for query_str in query:
+            terms = literal_terms(query_str)
+            if terms is None:
+                return None
+            matches: dict[str, int] | None = None
+            for word, left, right in terms:
+                lines = self._lookup(word, left, right)
+                if matches is None:
+                    matches = dict(lines)
+                else:
+                    matches = {
+                        label: mask & lines[label]
+                        for label, mask in matches.items()
+                        if label in lines and mask & lines[label]
+                    }
+                if not matches:
+                    break
+            labels.update(matches or ())
+        return labels
+
+    def dump(
+        self,
+    ) -> dict[
+        str,
+        tuple[
+            dict[str, dict[str, int]],
+            dict[str, tuple[str, ...]],
+            dict[str, tuple[str, int]],
+            set[str],
+        ],
+    ]:
+        """Returns the state of the index for storage.
+
+        Returns:
+            A dictionary mapping the list separator setting with which the entries were rendered (if
+            the index is valid) to the postings, the words of every entry, the note stamps and the
+            labels of the entries with associated files.
+        """
+        if not self.is_current():
+            return {}
+        return {
+            self._current_stamp(): (self._postings, self._words, self._notes, self._files),
+        }
+
+    def load(
+        self,
+        state: dict[str, Any],
+        labels: list[str],
+        construct: Callable[[str], Entry],
+        outdated: set[str],
+    ) -> None:
+        """Restores the index from its stored state.
+
+        A stale index is dropped, entries which no longer exist get removed and entries which are
+        missing from the index or have changed get indexed anew.
+
+        Args:
+            state: the stored state as returned by `SearchIndex.dump`.
+            labels: the labels of the entire database.
+            construct: a callable returning the entry of a label.
+            outdated: the labels of all entries which have changed since the state was stored.
+        """
+        self.clear()
+        for stamp, (postings, words, notes, files) in state.items():
+            if stamp != self._current_stamp():
+                LOGGER.info("Dropping the stale full-text search index.")
+                continue
+            self._stamp = stamp
+            self._postings = postings
+            self._words = words
+            self._notes = notes
+            self._files = files
+            existing = set(labels)
+            for label in [label for label in self._words if label not in existing]:
+                self.remove(label)
+            for label in labels:
+                if label in outdated or label not in self._words:
+                    self.update(label, construct(label))
@@ -0,0 +1,262 @@
+"""coBib's sharded storage backend.
+
+When `cobib.config.config.DatabaseConfig.backend` is set to `"sharded"`, the database file is a
+directory rather than a single YAML file. This directory contains a manifest and multiple YAML shard
+files among which the entries are partitioned. This module implements the storage of the entries in
+such a directory. The runtime interface remains the `cobib.database.Database` class.
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import ClassVar
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+
+class ShardedBackend:
+    """Stores the entries of a database in a directory of YAML shard files.
+
+    Every shard file has the same format as a regular YAML database file. The entries are
+    partitioned among the shard files either by a hash of their labels or by their `year` field
+    (see `cobib.config.config.DatabaseConfig.shard_by`).
+
+    The manifest file (`ShardedBackend.MANIFEST`) records the partitioning of the database followed
+    by a line for every entry, which maps its label to the name of its shard file:
+    ```
+    version: 1
+    partition: hash
+    shards: 16
+    ---
+    Label1<TAB>shard-07.yaml
+    Label2<TAB>shard-13.yaml
+    ```
+    The order of these lines determines the order of the entries in the database. The manifest only
+    gets rewritten when this order changes, i.e. when entries get added, deleted or renamed.
+    """
+
+    VERSION: ClassVar[int] = 1
+    """The version of the manifest format."""
+
+    MANIFEST: ClassVar[str] = "cobib.manifest"
+    """The name of the manifest file."""
+
+    _SEPARATOR: ClassVar[str] = "---"
+    """The line separating the header of the manifest from its entries."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initializes the backend.
+
+        Args:
+            directory: the path to the database directory.
+        """
+        self.directory = directory
+        """The path to the database directory."""
+
+        self.manifest = directory / self.MANIFEST
+        """The path to the manifest file."""
+
+    def initialize(self, partition: str, shards: int) -> None:
+        """Creates an empty database.
+
+        Args:
+            partition: how the entries get partitioned (either `"hash"` or `"year"`).
+            shards: the number of shard files when partitioning by hash.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write_manifest(partition, shards, OrderedDict())
+
+    def exists(self) -> bool:
+        """Checks whether the database exists.
+
+        Returns:
+            Whether the manifest file exists.
+        """
+        return self.manifest.exists()
+
+    def _read_manifest(self) -> tuple[str, int, dict[str, str]]:
+        """Reads the manifest file.
+
+        Returns:
+            The partitioning scheme, the number of hash shards and an `OrderedDict` mapping the
+            labels of all entries to the names of their shard files.
+
+        Raises:
+            ValueError: if the manifest has been written with an unsupported version.
+        """
+        header: dict[str, str] = {}
+        locations: dict[str, str] = OrderedDict()
+        with open(self.manifest, "r", encoding="utf-8") as file:
+            for line in file:
+                stripped = line.rstrip("\n")
+                if stripped == self._SEPARATOR:
+                    break
+                key, _, value = stripped.partition(":")
+                header[key.strip()] = value.strip()
+            for line in file:
+                label, _, shard = line.rstrip("\n").rpartition("\t")
+                if label:
+                    locations[label] = shard
+
+        if int(header.get("version", 0)) != self.VERSION:
+            raise ValueError(
+                f"The manifest {self.manifest} uses the unsupported version "
+                f"{header.get('version')}."
+            )
+        return header.get("partition", "hash"), int(header.get("shards", 1)), locations
+
+    def _write_manifest(self, partition: str, shards: int, locations: dict[str, str]) -> None:
+        """Writes the manifest file.
+
+        Args:
+            partition: the partitioning scheme.
+            shards: the number of hash shards.
+            locations: the mapping of the labels of all entries to the names of their shard files.
+        """
+        lines = [
+            f"version: {self.VERSION}\n",
+            f"partition: {partition}\n",
+            f"shards: {shards}\n",
+            f"{self._SEPARATOR}\n",
+        ]
+        lines.extend(f"{label}\t{shard}\n" for label, shard in locations.items())
+        with open(self.manifest, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+
+    @staticmethod
+    def shard_of(entry: Entry, partition: str, shards: int) -> str:
+        """Determines the name of the shard file in which an entry gets stored.
+
+        Args:
+            entry: the entry.
+            partition: the partitioning scheme.
+            shards: the number of hash shards.
+
+        Returns:
+            The name of the shard file.
+        """
+        if partition == "year":
+            year = str(entry.data.get("year", "")).strip()
+            return f"{year if year.isdigit() else 'unknown'}.yaml"
+        index = zlib.crc32(entry.label.encode("utf-8")) % shards
+        return f"shard-{index:0{len(str(shards - 1))}d}.yaml"
+
+    def shard_files(self) -> list[Path]:
+        """Lists all shard files.
+
+        Returns:
+            The sorted paths of all YAML files in the database directory.
+        """
+        return sorted(self.directory.glob("*.yaml"))
+
+    def read(self) -> dict[str, Entry]:
+        """Reads all entries.
+
+        All shard files get parsed at once by `cobib.parsers.YAMLParser.parse_files`. Thus, they get
+        parsed in parallel when `cobib.config.config.YAMLParserConfig.parallel` is set.
+
+        Returns:
+            An `OrderedDict` mapping the labels to the entries in the order recorded by the
+            manifest. Entries which are stored in a shard file but are missing from the manifest
+            get appended.
+        """
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        _, _, locations = self._read_manifest()
+        entries = YAMLParser().parse_files(self.shard_files())
+
+        bib: dict[str, Entry] = OrderedDict()
+        for label in locations:
+            if label in entries:
+                bib[label] = entries.pop(label)
+            else:
+                LOGGER.warning(
+                    "The entry '%s' is listed in the manifest but missing from its shard file.",
+                    label,
+                )
+        bib.update(entries)
+        return bib
+
+    def write(self, changes: dict[str, Entry | None]) -> list[Path]:
+        """Writes changed entries.
+
+        Only the shard files which contain changed entries (before or after the change) get
+        rewritten. The unchanged entries of these shards keep their raw YAML documents.
+
+        Args:
+            changes: a dictionary mapping the labels of changed entries (as they are currently
+                stored) to their new contents. A value of `None` indicates that the entry has been
+                deleted. If the label of the new entry differs from the key, the entry has been
+                renamed and keeps its position.
+
+        Returns:
+            The paths of all files which have been written.
+        """
+        from cobib.parsers.yaml import YAMLParser  # noqa: PLC0415
+
+        partition, shards, locations = self._read_manifest()
+
+        new_locations: dict[str, str] = OrderedDict()
+        changed: dict[str, Entry] = {}
+        touched: set[str] = set()
+        for label, shard in locations.items():
+            if label not in changes:
+                new_locations.setdefault(label, shard)
+                continue
+            touched.add(shard)
+            entry = changes[label]
+            if entry is None:
+                LOGGER.debug('Deleting entry "%s".', label)
+                continue
+            LOGGER.debug('Writing modified entry "%s".', entry.label)
+            new_locations[entry.label] = self.shard_of(entry, partition, shards)
+            changed[entry.label] = entry
+        for entry in changes.values():
+            if entry is None or entry.label in changed:
+                continue
+            LOGGER.debug('Adding new entry "%s".', entry.label)
+            new_locations[entry.label] = self.shard_of(entry, partition, shards)
+            changed[entry.label] = entry
+        touched.update(new_locations[label] for label in changed)
+
+        yml = YAMLParser()
+        written: list[Path] = []
+        for shard in sorted(touched):
+            path = self.directory / shard
+            data = path.read_bytes() if path.exists() else b""
+            spans = YAMLParser.index_documents(data)
+            for label in spans:
+                # keep entries which have been added to the shard without updating the manifest
+                if label not in locations and label not in changes:
+                    new_locations.setdefault(label, shard)
+
+            documents: list[bytes] = []
+            missing: list[str] = []
+            for label, location in new_locations.items():
+                if location != shard:
+                    continue
+                if label in changed:
+                    documents.append(changed[label].save(parser=yml).encode("utf-8"))
+                elif label in spans:
+                    start, end = spans[label]
+                    documents.append(data[start:end])
+                else:
+                    missing.append(label)
+            for label in missing:
+                del new_locations[label]
+
+            LOGGER.info("Writing database shard: %s", path)
+            path.write_bytes(b"".join(documents))
+            written.append(path)
+
+        if list(new_locations.items()) != list(locations.items()):
+            self._write_manifest(partition, shards, new_locations)
+            written.append(self.manifest)
+
+        return written
@@ -0,0 +1,270 @@
+"""coBib's sort index.
+
+This module implements the per-field sort orders of the entries which are maintained by the
+`cobib.database.Database` class. These allow sorted listings (see
+`cobib.commands.ListCommand.sort_entries`) to walk the entries in order rather than having to
+stringify and sort all of them every time.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from natsort import natsort_keygen
+
+from cobib.config import config
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+_NATSORT_KEY = natsort_keygen()
+"""@private the key function used by `natsort.natsorted` with its default settings."""
+
+
+class SortIndex:
+    """The natural sort orders of the entries of the database by some of their fields.
+
+    For every indexed field, this stores the natural sort keys (as used by `natsort.natsorted`) of
+    the stringified field values (see `cobib.database.Entry.stringify_field`) of all entries in a
+    sorted list. Entries with identical keys are ordered by their position in the database, such
+    that walking an index yields exactly the order produced by sorting the entries with
+    `natsort.natsorted`.
+
+    The indexes are maintained incrementally through `SortIndex.update` and `SortIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty sort index."""
+        self._sequence: dict[str, int] = {}
+        """The sequence numbers of all entries which reflect their positions in the database. These
+        are only tracked while at least one field is indexed."""
+
+        self._next_sequence: int = 0
+        """The sequence number which gets assigned to the next new entry."""
+
+        self._keys: dict[str, dict[str, Any]] = {}
+        """The sort keys of all entries, indexed by field and label."""
+
+        self._orders: dict[str, list[tuple[Any, int, str]]] = {}
+        """The sorted triplets of sort key, sequence number and label, indexed by field."""
+
+        self._separators: dict[str, str | None] = {}
+        """The list separators (see `cobib.config.config.StringifyConfig.list_separator`) with which
+        the indexed fields were stringified."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether any field is indexed."""
+        return bool(self._orders)
+
+    def __contains__(self, field: object) -> bool:
+        """Returns whether the given field is indexed and its index is still valid.
+
+        An index becomes invalid when the list separator configured for its field changes.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            Whether the field is indexed.
+        """
+        return field in self._orders and self._separators[field] == self._separator(str(field))
+
+    def clear(self) -> None:
+        """Drops all indexes."""
+        self._sequence = {}
+        self._next_sequence = 0
+        self._keys = {}
+        self._orders = {}
+        self._separators = {}
+        self.modified = False
+
+    @staticmethod
+    def _separator(field: str) -> str | None:
+        """Returns the list separator configured for the given field.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            The configured list separator or `None`.
+        """
+        return getattr(config.database.stringify.list_separator, field, None)
+
+    @staticmethod
+    def sort_key(entry: Entry, field: str) -> Any:
+        """Computes the natural sort key of an entry.
+
+        Args:
+            entry: the entry.
+            field: the name of the field by which to sort.
+
+        Returns:
+            The key with which `natsort.natsorted` would sort the entry by the given field.
+        """
+        return _NATSORT_KEY(entry.stringify_field(field) or "")
+
+    def build(self, field: str, entries: Iterable[tuple[str, Entry]]) -> None:
+        """Builds the index of a field.
+
+        Args:
+            field: the name of the field.
+            entries: the pairs of labels and entries of the entire database in its order.
+        """
+        LOGGER.info("Building the sort index of the '%s' field.", field)
+        if not self._orders:
+            self._sequence = {}
+            self._next_sequence = 0
+        keys: dict[str, Any] = {}
+        for label, entry in entries:
+            if label not in self._sequence:
+                self._sequence[label] = self._next_sequence
+                self._next_sequence += 1
+            keys[label] = self.sort_key(entry, field)
+        self._keys[field] = keys
+        self._orders[field] = sorted(
+            (key, self._sequence[label], label) for label, key in keys.items()
+        )
+        self._separators[field] = self._separator(field)
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the indexes after an entry has been added or changed.
+
+        A new entry gets placed behind all existing ones while a changed entry keeps its position.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        if not self._orders:
+            return
+        if label not in self._sequence:
+            self._sequence[label] = self._next_sequence
+            self._next_sequence += 1
+        for field, order in self._orders.items():
+            self._discard(field, label)
+            key = self.sort_key(entry, field)
+            self._keys[field][label] = key
+            insort(order, (key, self._sequence[label], label))
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the indexes after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        if label not in self._sequence:
+            return
+        for field in self._orders:
+            self._discard(field, label)
+        del self._sequence[label]
+        self.modified = True
+
+    def _discard(self, field: str, label: str) -> None:
+        """Removes an entry from the index of a field.
+
+        Args:
+            field: the name of the field.
+            label: the label of the entry.
+        """
+        if label not in self._keys[field]:
+            return
+        item = (self._keys[field].pop(label), self._sequence[label], label)
+        order = self._orders[field]
+        position = bisect_left(order, item)
+        if position < len(order) and order[position] == item:
+            del order[position]
+
+    def walk(self, field: str, *, reverse: bool = False) -> Iterator[str]:
+        """Walks the index of a field.
+
+        Args:
+            field: the name of the field. This must be indexed.
+            reverse: whether to walk the index in reverse. Like `natsort.natsorted`, this keeps the
+                order of entries with identical keys.
+
+        Yields:
+            The labels of all entries in sorted order.
+        """
+        order = self._orders[field]
+        if not reverse:
+            for _, _, label in order:
+                yield label
+            return
+        end = len(order)
+        while end > 0:
+            # the 1-tuple compares lower than all triplets starting with the same key
+            start = bisect_left(order, (order[end - 1][0],), 0, end)
+            for _, _, label in order[start:end]:
+                yield label
+            end = start
+
+    def dump(self) -> dict[str, tuple[str | None, list[tuple[Any, str]]]]:
+        """Returns the state of all valid indexes for storage.
+
+        Returns:
+            A dictionary mapping the indexed fields to their list separator and their sorted pairs
+            of sort key and label.
+        """
+        return {
+            field: (self._separators[field], [(key, label) for key, _, label in order])
+            for field, order in self._orders.items()
+            if field in self
+        }
+
+    def load(
+        self,
+        state: dict[str, tuple[str | None, list[tuple[Any, str]]]],
+        labels: list[str],
+        construct: Callable[[str], Entry],
+        outdated: set[str],
+    ) -> None:
+        """Restores the indexes from their stored state.
+
+        Stale indexes are dropped and the keys of entries which are missing from an index or have
+        changed get recomputed.
+
+        Args:
+            state: the stored state as returned by `SortIndex.dump`.
+            labels: the labels of the entire database in its order.
+            construct: a callable returning the entry of a label.
+            outdated: the labels of all entries which have changed since the state was stored.
+        """
+        self.clear()
+        self._sequence = {label: position for position, label in enumerate(labels)}
+        self._next_sequence = len(labels)
+        for field, (separator, stored) in state.items():
+            if separator != self._separator(field):
+                LOGGER.info("Dropping the stale sort index of the '%s' field.", field)
+                self.modified = True
+                continue
+            keys: dict[str, Any] = {}
+            order: list[tuple[Any, int, str]] = []
+            for key, label in stored:
+                if label in self._sequence and label not in outdated:
+                    keys[label] = key
+                    order.append((key, self._sequence[label], label))
+            for label in labels:
+                if label not in keys:
+                    keys[label] = self.sort_key(construct(label), field)
+                    order.append((keys[label], self._sequence[label], label))
+                    self.modified = True
+            if len(order) != len(stored):
+                self.modified = True
+            # NOTE: the stored order is (nearly) sorted already, which makes this sort linear
+            order.sort()
+            self._keys[field] = keys
+            self._orders[field] = order
+            self._separators[field] = separator
+        if not self._orders:
+            self._sequence = {}
+            self._next_sequence = 0
@@ -0,0 +1,205 @@
+"""coBib's SQLite storage backend.
+
+When `cobib.config.config.DatabaseConfig.backend` is set to `"sqlite"`, the database file is an
+SQLite database rather than a YAML file. This module implements the storage of the entries in such
+a file. The runtime interface remains the `cobib.database.Database` class.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+from typing import Any, ClassVar
+
+from .author import Author
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+
+class SQLiteBackend:
+    """Stores the entries of a database in an SQLite file.
+
+    Every entry is stored as one row of the `entries` table. Its fields are stored as a JSON object
+    in the `data` column. In addition, the `label`, `ENTRYTYPE`, `year` and `doi` fields are stored
+    in indexed columns of their own and the tags of all entries are stored in the indexed `tags`
+    table. The order of the entries is preserved through the `position` column.
+
+    The stored fields are those of `cobib.database.Entry.formatted`, i.e. exactly those which would
+    be written into a YAML database file. Field values which have no JSON representation get stored
+    as strings.
+    """
+
+    SCHEMA_VERSION: ClassVar[int] = 1
+    """The version of the database schema. It is stored as the `user_version` of the SQLite file."""
+
+    _SCHEMA: ClassVar[str] = """
+        CREATE TABLE entries (
+            label TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            entrytype TEXT,
+            year INTEGER,
+            doi TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX entries_position ON entries (position);
+        CREATE INDEX entries_entrytype ON entries (entrytype);
+        CREATE INDEX entries_year ON entries (year);
+        CREATE INDEX entries_doi ON entries (doi);
+        CREATE TABLE tags (
+            label TEXT NOT NULL,
+            tag TEXT NOT NULL
+        );
+        CREATE INDEX tags_label ON tags (label);
+        CREATE INDEX tags_tag ON tags (tag);
+    """
+    """The database schema."""
+
+    def __init__(self, file: Path) -> None:
+        """Initializes the backend.
+
+        Args:
+            file: the path to the SQLite file.
+        """
+        self.file = file
+        """The path to the SQLite file."""
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connects to the SQLite file and initializes its schema, if necessary.
+
+        Returns:
+            The open connection.
+
+        Raises:
+            sqlite3.DatabaseError: if the file has been written with an unsupported schema version.
+        """
+        connection = sqlite3.connect(self.file)
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version == 0:
+            LOGGER.info("Initializing the SQLite database schema in %s", self.file)
+            connection.executescript(self._SCHEMA)
+            connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        elif version != self.SCHEMA_VERSION:
+            connection.close()
+            raise sqlite3.DatabaseError(
+                f"The SQLite database {self.file} uses the unsupported schema version {version}."
+            )
+        return connection
+
+    def read(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Reads all entries.
+
+        Yields:
+            Pairs of the labels and fields of all entries in their stored order.
+        """
+        with closing(self._connect()) as connection:
+            for label, data in connection.execute(
+                "SELECT label, data FROM entries ORDER BY position"
+            ):
+                yield label, json.loads(data)
+
+    def write(self, changes: dict[str, Entry | None]) -> None:
+        """Writes changed entries.
+
+        All changes are written in a single transaction.
+
+        Args:
+            changes: a dictionary mapping the labels of changed entries (as they are currently
+                stored) to their new contents. A value of `None` indicates that the entry has been
+                deleted. If the label of the new entry differs from the key, the entry has been
+                renamed and keeps its position.
+        """
+        with closing(self._connect()) as connection, connection:
+            positions: dict[str, int] = {}
+            for label in changes:
+                row = connection.execute(
+                    "SELECT position FROM entries WHERE label = ?", (label,)
+                ).fetchone()
+                if row is not None:
+                    positions[label] = row[0]
+            # a renamed entry keeps the position stored under its old label
+            for label, entry in changes.items():
+                if entry is not None and label in positions:
+                    positions.setdefault(entry.label, positions[label])
+            (next_position,) = connection.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM entries"
+            ).fetchone()
+
+            connection.executemany(
+                "DELETE FROM entries WHERE label = ?", ((label,) for label in changes)
+            )
+
+            rows: list[tuple[Any, ...]] = []
+            tags: list[tuple[str, str]] = []
+            written: set[str] = set()
+            for label, entry in changes.items():
+                if entry is None or entry.label in written:
+                    continue
+                position = positions.get(entry.label)
+                if position is None:
+                    position = next_position
+                    next_position += 1
+                LOGGER.debug('Writing entry "%s".', entry.label)
+                data = self.encode(entry)
+                rows.append(
+                    (
+                        entry.label,
+                        position,
+                        self._column(data.get("ENTRYTYPE")),
+                        self._column(data.get("year")),
+                        self._column(data.get("doi")),
+                        json.dumps(data, ensure_ascii=False, default=str),
+                    )
+                )
+                tags.extend((entry.label, tag) for tag in entry.tags)
+                written.add(entry.label)
+
+            connection.executemany(
+                "DELETE FROM tags WHERE label = ?",
+                ((label,) for label in {*changes.keys(), *written}),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (label, position, entrytype, year, doi, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany("INSERT INTO tags (label, tag) VALUES (?, ?)", tags)
+
+    @staticmethod
+    def _column(value: Any) -> str | int | None:
+        """Converts a field value for storage in an indexed column.
+
+        Args:
+            value: the field value.
+
+        Returns:
+            The value, if it is a string or an integer, and `None` otherwise.
+        """
+        return value if isinstance(value, (str, int)) else None
+
+    @staticmethod
+    def encode(entry: Entry) -> dict[str, Any]:
+        """Encodes the fields of an entry for storage.
+
+        Args:
+            entry: the entry to encode.
+
+        Returns:
+            The formatted fields of the entry (see `cobib.database.Entry.formatted`) in which all
+            `cobib.database.Author` objects have been converted to dictionaries.
+        """
+        data = entry.formatted().data
+        for key, value in data.items():
+            if isinstance(value, list):
+                data[key] = [
+                    {k: v for k, v in item._asdict().items() if v is not None}
+                    if isinstance(item, Author)
+                    else item
+                    for item in value
+                ]
+        return data
@@ -0,0 +1,192 @@
+"""coBib's extracted-text cache.
+
+This module implements the cache of the text which the
+`cobib.config.config.SearchCommandConfig.extractor` command extracts from the associated files of
+entries. It allows `cobib.database.Entry.grep` to search these files in-process with the same regex
+engine which is used for the entries themselves rather than by spawning the
+`cobib.config.config.SearchCommandConfig.grep` tool. The cache can be filled ahead of time via
+`cobib search --warm-cache`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import subprocess
+from bisect import bisect_right
+from hashlib import sha256
+from itertools import accumulate
+from pathlib import Path
+
+from cobib.config import config
+from cobib.utils.regex import regex
+from cobib.utils.rel_path import RelPath
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+_VERSION = 1
+"""@private the version of the format of the cache records. Records written with a different
+version are ignored."""
+
+_PLACEHOLDER = "{}"
+"""@private the argument of the extractor command which gets replaced by the path of the file."""
+
+
+def directory() -> Path | None:
+    """Returns the directory storing the extracted-text cache.
+
+    This is the `extracted` directory inside of `config.database.cache`.
+
+    Returns:
+        The path to the directory or `None`, if caching is disabled.
+    """
+    if config.database.cache is None:
+        return None
+    return RelPath(config.database.cache).path / "extracted"
+
+
+def _record_file(cache: Path, path: str) -> Path:
+    """Returns the path to the cache record of a file.
+
+    Args:
+        cache: the directory storing the cache (see `directory`).
+        path: the path of the file.
+
+    Returns:
+        The path to the cache record which is named after the hash of the path of the file.
+    """
+    return cache / sha256(path.encode()).hexdigest()
+
+
+def _stamp(path: str, command: list[str]) -> tuple[str, int, int, tuple[str, ...]] | None:
+    """Returns the key under which the text of a file gets cached.
+
+    Args:
+        path: the path of the file.
+        command: the extractor command.
+
+    Returns:
+        The path, size and modification time of the file together with the extractor command or
+        `None`, if the file does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return path, stat.st_size, stat.st_mtime_ns, tuple(command)
+
+
+def extract(path: str, command: list[str], cache: Path) -> str | None:
+    """Returns the text of a file, extracting it only if it has not been cached.
+
+    The extractor command gets run with its `{}` argument replaced by the path of the file (or with
+    the path appended, if it has no such argument) and must print the text to its standard output.
+    The result is cached until the size or modification time of the file or the command change. This
+    includes failed extractions such that these do not get repeated either.
+
+    .. note::
+       This function only depends on its arguments (rather than on the configuration) such that it
+       can be run in a separate process.
+
+    Args:
+        path: the path of the file.
+        command: the extractor command.
+        cache: the directory storing the cache (see `directory`).
+
+    Returns:
+        The extracted text or `None`, if the file does not exist or the extraction failed.
+    """
+    stamp = _stamp(path, command)
+    if stamp is None:
+        return None
+
+    record = _record_file(cache, path)
+    try:
+        version, stored, text = pickle.loads(record.read_bytes())
+        if version == _VERSION and stored == stamp:
+            return text  # type: ignore[no-any-return]
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    if _PLACEHOLDER in command:
+        args = [path if arg == _PLACEHOLDER else arg for arg in command]
+    else:
+        args = [*command, path]
+    LOGGER.debug("Extracting the text of %s", path)
+    try:
+        result = subprocess.run(args, capture_output=True, stdin=subprocess.DEVNULL, check=False)
+    except OSError as err:
+        LOGGER.warning("Could not run the extractor command on %s: %s", path, err)
+        return None
+    text = result.stdout.decode(errors="replace") if result.returncode == 0 else None
+    if text is None:
+        LOGGER.info("The extractor command failed on %s.", path)
+
+    cache.mkdir(parents=True, exist_ok=True)
+    target = record.with_name(f"{record.name}.{os.getpid()}.tmp")
+    target.write_bytes(pickle.dumps((_VERSION, stamp, text), protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(target, record)
+    return text
+
+
+def warm(path: str, command: list[str], cache: Path) -> bool:
+    """Caches the text of a file.
+
+    This is meant to be run in a process pool and, thus, does not return the text itself.
+
+    Args:
+        path: the path of the file.
+        command: the extractor command.
+        cache: the directory storing the cache (see `directory`).
+
+    Returns:
+        Whether the text is available.
+    """
+    return extract(path, command, cache) is not None
+
+
+def grep(text: str, patterns: list[regex.Pattern[str]], context: int) -> list[str]:
+    """Searches an extracted text just like the `cobib.config.config.SearchCommandConfig.grep` tool.
+
+    Every line containing (a part of) a match gets reported together with `context` lines before
+    and after it. Overlapping and adjacent groups of lines get merged and the remaining ones get
+    separated by `--` lines, just like in the output of `grep -C`.
+
+    Args:
+        text: the extracted text.
+        patterns: the compiled regex patterns.
+        context: the number of context lines to provide for each match.
+
+    Returns:
+        The output for every pattern which is empty if it does not match.
+    """
+    lines = text.split("\n") if text else []
+    if text.endswith("\n"):
+        lines.pop()
+    line_offsets = list(accumulate(len(line) + 1 for line in lines))
+
+    outputs: list[str] = []
+    for pattern in patterns:
+        matched: set[int] = set()
+        for match_ in pattern.finditer(text):
+            first = bisect_right(line_offsets, match_.start())
+            last = bisect_right(line_offsets, max(match_.start(), match_.end() - 1))
+            matched.update(range(first, min(last, len(lines) - 1) + 1))
+
+        groups: list[list[int]] = []
+        for line_idx in sorted(matched):
+            start, stop = max(line_idx - context, 0), min(line_idx + context, len(lines) - 1)
+            if groups and start <= groups[-1][1] + 1:
+                groups[-1][1] = stop
+            else:
+                groups.append([start, stop])
+
+        if not groups:
+            outputs.append("")
+            continue
+        outputs.append(
+            "\n--\n".join("\n".join(lines[start : stop + 1]) for start, stop in groups) + "\n"
+        )
+    return outputs
@@ -0,0 +1,352 @@
+"""coBib's value index.
+
+This module implements the inverted index of field values which is maintained by the
+`cobib.database.Database` class for the fields listed in
+`cobib.config.config.DatabaseConfig.indexed_fields`. This allows filters (see
+`cobib.database.filter_plan.FilterPlan.select`) to be evaluated on the distinct values of a field
+rather than on every entry.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, insort
+from collections.abc import Callable, Collection, Iterable, Mapping
+
+from cobib.config import config
+
+from .entry import Entry
+
+LOGGER = logging.getLogger(__name__)
+"""@private module logger."""
+
+
+class ValueIndex:
+    """The inverted index of the values of some fields of all entries in the database.
+
+    For every indexed field, this maps the field value as it is matched against by the filters
+    (i.e. `cobib.database.Entry.stringify_field` without LaTeX encoding) to the set of labels of all
+    entries with that value. Fields storing lists (like `tags`) are additionally indexed by their
+    individual elements. The labels of the entries which lack a field are tracked separately.
+
+    The indexes are maintained incrementally through `ValueIndex.update` and `ValueIndex.remove`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty value index."""
+        self._entries: dict[str, dict[str, tuple[str, tuple[str, ...]]]] = {}
+        """The indexed value and elements of every entry, indexed by field and label."""
+
+        self._missing: dict[str, set[str]] = {}
+        """The labels of the entries which lack a field, indexed by field."""
+
+        self._values: dict[str, dict[str, set[str]]] = {}
+        """The labels of the entries with a given value, indexed by field and value."""
+
+        self._elements: dict[str, dict[str, set[str]]] = {}
+        """The labels of the entries with a given list element, indexed by field and element."""
+
+        self._sorted: dict[str, list[str]] = {}
+        """The sorted distinct values, indexed by field."""
+
+        self._separators: dict[str, str | None] = {}
+        """The list separators (see `cobib.config.config.StringifyConfig.list_separator`) with which
+        the indexed fields were stringified."""
+
+        self.modified: bool = False
+        """Indicates whether this index has been modified since it was last loaded or stored."""
+
+    def __bool__(self) -> bool:
+        """Returns whether any field is indexed."""
+        return bool(self._entries)
+
+    def __contains__(self, field: object) -> bool:
+        """Returns whether the given field is indexed and its index is still valid.
+
+        An index becomes invalid when the list separator configured for its field changes.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            Whether the field is indexed.
+        """
+        return field in self._entries and self._separators[field] == self._separator(str(field))
+
+    def clear(self) -> None:
+        """Drops all indexes."""
+        self._entries = {}
+        self._missing = {}
+        self._values = {}
+        self._elements = {}
+        self._sorted = {}
+        self._separators = {}
+        self.modified = False
+
+    @staticmethod
+    def _separator(field: str) -> str | None:
+        """Returns the list separator configured for the given field.
+
+        Args:
+            field: the name of the field.
+
+        Returns:
+            The configured list separator or `None`.
+        """
+        return getattr(config.database.stringify.list_separator, field, None)
+
+    @staticmethod
+    def tokens(entry: Entry, field: str) -> tuple[str, tuple[str, ...]] | None:
+        """Computes the indexed value and elements of an entry.
+
+        Args:
+            entry: the entry.
+            field: the name of the field.
+
+        Returns:
+            The pair of the stringified field value and the stringified list elements (or the value
+            itself, if the field does not store a list) or `None`, if the entry lacks the field.
+        """
+        value = entry.stringify_field(field, encode_latex=False)
+        if value is None:
+            return None
+        raw = entry.data.get(field, None)
+        if field != "author" and isinstance(raw, list) and ValueIndex._separator(field) is not None:
+            return value, tuple(str(item) for item in raw)
+        return value, (value,)
+
+    def _add(self, field: str, label: str, tokens: tuple[str, tuple[str, ...]] | None) -> None:
+        """Adds an entry to the index of a field.
+
+        Args:
+            field: the name of the field.
+            label: the label of the entry.
+            tokens: the indexed value and elements of the entry as returned by `ValueIndex.tokens`.
+        """
+        if tokens is None:
+            self._missing[field].add(label)
+            return
+        value, elements = tokens
+        self._entries[field][label] = tokens
+        values = self._values[field]
+        if value not in values:
+            values[value] = set()
+            insort(self._sorted[field], value)
+        values[value].add(label)
+        for element in elements:
+            self._elements[field].setdefault(element, set()).add(label)
+
+    def _discard(self, field: str, label: str) -> None:
+        """Removes an entry from the index of a field.
+
+        Args:
+            field: the name of the field.
+            label: the label of the entry.
+        """
+        self._missing[field].discard(label)
+        tokens = self._entries[field].pop(label, None)
+        if tokens is None:
+            return
+        value, elements = tokens
+        values = self._values[field]
+        values[value].discard(label)
+        if not values[value]:
+            del values[value]
+            ordered = self._sorted[field]
+            del ordered[bisect_left(ordered, value)]
+        for element in elements:
+            labels = self._elements[field].get(element, None)
+            if labels is not None:
+                labels.discard(label)
+                if not labels:
+                    del self._elements[field][element]
+
+    def _initialize(self, field: str) -> None:
+        """Initializes the empty index of a field.
+
+        Args:
+            field: the name of the field.
+        """
+        self._entries[field] = {}
+        self._missing[field] = set()
+        self._values[field] = {}
+        self._elements[field] = {}
+        self._sorted[field] = []
+        self._separators[field] = self._separator(field)
+
+    def build(self, field: str, entries: Iterable[tuple[str, Entry]]) -> None:
+        """Builds the index of a field.
+
+        Args:
+            field: the name of the field.
+            entries: the pairs of labels and entries of the entire database.
+        """
+        LOGGER.info("Building the value index of the '%s' field.", field)
+        self._initialize(field)
+        for label, entry in entries:
+            self._add(field, label, self.tokens(entry, field))
+        self.modified = True
+
+    def update(self, label: str, entry: Entry) -> None:
+        """Updates the indexes after an entry has been added or changed.
+
+        Args:
+            label: the label of the entry.
+            entry: the entry.
+        """
+        for field in self._entries:
+            self._discard(field, label)
+            self._add(field, label, self.tokens(entry, field))
+        self.modified = True
+
+    def remove(self, label: str) -> None:
+        """Updates the indexes after an entry has been removed.
+
+        Args:
+            label: the label of the entry.
+        """
+        for field in self._entries:
+            if label in self._entries[field] or label in self._missing[field]:
+                self._discard(field, label)
+                self.modified = True
+
+    def labels(self, field: str) -> Collection[str]:
+        """Returns the labels of all entries which have a field.
+
+        Args:
+            field: the name of the field. This must be indexed.
+
+        Returns:
+            The labels of all entries which have the field.
+        """
+        return self._entries[field].keys()
+
+    def elements(self, field: str) -> Mapping[str, Collection[str]]:
+        """Returns the labels of the entries containing every distinct list element of a field.
+
+        For fields which do not store lists, the elements are the field values themselves.
+
+        Args:
+            field: the name of the field. This must be indexed.
+
+        Returns:
+            A read-only mapping of the distinct elements to the labels of the entries containing
+            them.
+        """
+        return self._elements[field]
+
+    def match(self, field: str, predicate: Callable[[str], bool]) -> set[str]:
+        """Returns the labels of all entries whose value satisfies a predicate.
+
+        The predicate only gets evaluated once for every distinct value of the field.
+
+        Args:
+            field: the name of the field. This must be indexed.
+            predicate: the predicate to evaluate on the stringified field values.
+
+        Returns:
+            The labels of all matching entries.
+        """
+        labels: set[str] = set()
+        for value, value_labels in self._values[field].items():
+            if predicate(value):
+                labels.update(value_labels)
+        return labels
+
+    def contains(self, field: str, literal: str) -> set[str] | None:
+        """Returns the labels of all entries whose value contains a literal string.
+
+        The literal gets looked up among the distinct list elements of the field. This is only
+        equivalent to a lookup among the stringified values, if the literal does not contain any
+        character of the list separator. An empty literal is contained in every value (even in the
+        value of an empty list, which has no elements at all).
+
+        Args:
+            field: the name of the field. This must be indexed.
+            literal: the string to look up.
+
+        Returns:
+            The labels of all matching entries or `None`, if the literal cannot be looked up among
+            the list elements.
+        """
+        if not literal:
+            return set(self._entries[field])
+        separator = self._separators[field]
+        if separator is not None and any(char in literal for char in separator):
+            return None
+        labels: set[str] = set()
+        for element, element_labels in self._elements[field].items():
+            if literal in element:
+                labels.update(element_labels)
+        return labels
+
+    def startswith(self, field: str, prefix: str) -> set[str]:
+        """Returns the labels of all entries whose value starts with a prefix.
+
+        Args:
+            field: the name of the field. This must be indexed.
+            prefix: the prefix to look up.
+
+        Returns:
+            The labels of all matching entries.
+        """
+        labels: set[str] = set()
+        ordered = self._sorted[field]
+        for position in range(bisect_left(ordered, prefix), len(ordered)):
+            value = ordered[position]
+            if not value.startswith(prefix):
+                break
+            labels.update(self._values[field][value])
+        return labels
+
+    def dump(
+        self,
+    ) -> dict[str, tuple[str | None, dict[str, tuple[str, tuple[str, ...]]], set[str]]]:
+        """Returns the state of all valid indexes for storage.
+
+        Returns:
+            A dictionary mapping the indexed fields to their list separator, the indexed value and
+            elements of every entry which has the field and the labels of all entries which lack it.
+        """
+        return {
+            field: (self._separators[field], entries, self._missing[field])
+            for field, entries in self._entries.items()
+            if field in self
+        }
+
+    def load(
+        self,
+        state: dict[str, tuple[str | None, dict[str, tuple[str, tuple[str, ...]]], set[str]]],
+        labels: list[str],
+        construct: Callable[[str], Entry],
+        outdated: set[str],
+    ) -> None:
+        """Restores the indexes from their stored state.
+
+        Stale indexes as well as fields which are no longer listed in
+        `cobib.config.config.DatabaseConfig.indexed_fields` are dropped and the values of entries
+        which are missing from an index or have changed get recomputed.
+
+        Args:
+            state: the stored state as returned by `ValueIndex.dump`.
+            labels: the labels of the entire database.
+            construct: a callable returning the entry of a label.
+            outdated: the labels of all entries which have changed since the state was stored.
+        """
+        self.clear()
+        for field, (separator, stored, missing) in state.items():
+            if separator != self._separator(field) or field not in config.database.indexed_fields:
+                LOGGER.info("Dropping the stale value index of the '%s' field.", field)
+                self.modified = True
+                continue
+            self._initialize(field)
+            for label in labels:
+                if label in outdated or (label not in stored and label not in missing):
+                    self._add(field, label, self.tokens(construct(label), field))
+                    self.modified = True
+                elif label in stored:
+                    self._add(field, label, stored[label])
+                else:
+                    self._missing[field].add(label)
+            if len(self._entries[field]) + len(self._missing[field]) != len(stored) + len(missing):
+                self.modified = True
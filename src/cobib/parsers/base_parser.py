@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import cobib.database
@@ -53,3 +53,19 @@ class Parser(ABC):
             error should be logged. This function should *not* raise an actual error or exit
             prematurely.
         """
+
+    def dump_key(self, entry: cobib.database.Entry) -> tuple[Any, ...] | None:
+        """Returns the key under which the `dump` of an entry gets memoized.
+
+        The key must capture everything (apart from the entry itself) which affects the result of
+        `dump`, such as the settings of this parser. The memoized dump gets invalidated whenever the
+        entry gets modified (see `cobib.database.Entry.memoized_dump`).
+
+        Args:
+            entry: the `cobib.database.Entry` to be dumped.
+
+        Returns:
+            The key or `None`, if the result of `dump` must not be memoized. The latter is the
+            default.
+        """
+        return None
@@ -7,12 +7,14 @@ from __future__ import annotations
 
 import logging
 from collections import OrderedDict
+from typing import Any
 
 import bibtexparser
 from typing_extensions import override
 
 from cobib.config import Event, config
 from cobib.database import Entry
+from cobib.utils.rel_path import RelPath
 
 from .base_parser import Parser
 
@@ -69,8 +71,30 @@ class BibtexParser(Parser):
 
         return bib
 
+    @override
+    def dump_key(self, entry: Entry) -> tuple[Any, ...] | None:
+        if config.events.get(Event.PreBibtexDump) or config.events.get(Event.PostBibtexDump):
+            return None
+        note: tuple[str, int] | None = None
+        if self.inline_note and entry.notes is not None:
+            # the contents of the note file may change independently of the entry
+            path = RelPath(entry.notes).path
+            note = (str(path), path.stat().st_mtime_ns if path.exists() else -1)
+        return (
+            self.name,
+            self.encode_latex,
+            note,
+            repr(config.database.stringify.list_separator),
+        )
+
     @override
     def dump(self, entry: Entry) -> str:
+        key = self.dump_key(entry)
+        if key is not None:
+            memoized = entry.memoized_dump(key)
+            if memoized is not None:
+                return memoized
+
         Event.PreBibtexDump.fire(entry)
 
         database = bibtexparser.bibdatabase.BibDatabase()
@@ -91,4 +115,7 @@ class BibtexParser(Parser):
 
         string = Event.PostBibtexDump.fire(string) or string
 
+        if key is not None:
+            entry.memoize_dump(key, string)
+
         return string
@@ -7,15 +7,21 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
+import math
+import re
 import sys
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import IO
+from typing import IO, Any, ClassVar
 
 from rich.console import Console
 from rich.progress import track
 from ruamel import yaml
+from ruamel.yaml.nodes import ScalarNode
 from typing_extensions import override
 
 from cobib.config import Event, config
@@ -35,15 +41,36 @@ class YAMLParser(Parser):
 
     _yaml: yaml.YAML | None = None
 
+    _dumper: _SchemaDumper | None = None
+
+    _PARALLEL_CHUNK_SIZE: int = 500
+    """The minimum number of documents which get parsed by a single process when parsing in parallel
+    (see `cobib.config.config.YAMLParserConfig.parallel`)."""
+
     def __init__(self) -> None:
         """Initializes a YAMLParser."""
         if YAMLParser._yaml is None:
             # we need to lazily construct this in order to be able to respect the config setting
-            YAMLParser._yaml = yaml.YAML(typ="safe", pure=not config.parsers.yaml.use_c_lib_yaml)
-            YAMLParser._yaml.explicit_start = True  # type: ignore[assignment]
-            YAMLParser._yaml.explicit_end = True  # type: ignore[assignment]
-            YAMLParser._yaml.default_flow_style = False
-            YAMLParser._yaml.register_class(Author)
+            YAMLParser._yaml = YAMLParser._construct_yaml(not config.parsers.yaml.use_c_lib_yaml)
+        if YAMLParser._dumper is None:
+            YAMLParser._dumper = _SchemaDumper(YAMLParser._yaml)
+
+    @staticmethod
+    def _construct_yaml(pure: bool) -> yaml.YAML:
+        """Constructs the `ruamel.yaml.YAML` instance used for loading and dumping.
+
+        Args:
+            pure: whether to use the Python-based implementation of the YAML parser.
+
+        Returns:
+            The configured YAML instance.
+        """
+        yml = yaml.YAML(typ="safe", pure=pure)
+        yml.explicit_start = True  # type: ignore[assignment]
+        yml.explicit_end = True  # type: ignore[assignment]
+        yml.default_flow_style = False
+        yml.register_class(Author)
+        return yml
 
     @override
     def parse(self, string: str | Path) -> dict[str, Entry]:
@@ -67,11 +94,153 @@ class YAMLParser(Parser):
 
         return bib
 
+    _DOCUMENT_START = re.compile(rb"^---[ \t]*\r?$", re.MULTILINE)
+    """The pattern matching the explicit start marker of a YAML document."""
+
+    _DOCUMENT_END = re.compile(rb"^\.\.\.[^\n]*(?:\n|\Z)", re.MULTILINE)
+    """The pattern matching the explicit end marker of a YAML document (including its newline)."""
+
+    _DOCUMENT_LABEL = re.compile(rb"\n([^\n]+?):[ \t]*\r?\n")
+    """The pattern matching the root node (i.e. the label) of a YAML document."""
+
+    @staticmethod
+    def index_documents(data: bytes, offset: int = 0) -> dict[str, tuple[int, int]]:
+        """Indexes the byte ranges of all documents in the raw contents of a database file.
+
+        coBib stores every entry as its own YAML document with an explicit start (`---`) and end
+        (`...`) marker. This method locates these markers without parsing the actual YAML contents
+        and, thus, provides a cheap way of determining where in a file each entry is stored.
+
+        Args:
+            data: the raw (binary) contents of a YAML database file.
+            offset: an optional offset which gets added to all computed byte positions. This can be
+                used to index only a tail of the actual file.
+
+        Returns:
+            An `OrderedDict` mapping the entry labels to pairs of the start (inclusive) and end
+            (exclusive) byte positions of their documents. The range includes both markers as well
+            as the newline character trailing the end marker.
+        """
+        spans: dict[str, tuple[int, int]] = OrderedDict()
+
+        pos = 0
+        while True:
+            start = YAMLParser._DOCUMENT_START.search(data, pos)
+            if start is None:
+                break
+            end = YAMLParser._DOCUMENT_END.search(data, start.end())
+            stop = len(data) if end is None else end.end()
+
+            label = YAMLParser._DOCUMENT_LABEL.match(data, start.end())
+            if label is not None and label.end() <= stop:
+                spans[YAMLParser._unquote_label(label.group(1).decode("utf-8"))] = (
+                    offset + start.start(),
+                    offset + stop,
+                )
+
+            pos = stop
+
+        return spans
+
+    @staticmethod
+    def count_documents(data: bytes) -> int:
+        """Counts the number of documents in the raw contents of a database file.
+
+        Args:
+            data: the raw (binary) contents of a YAML database file.
+
+        Returns:
+            The number of explicit document start markers (`---`).
+        """
+        return len(YAMLParser._DOCUMENT_START.findall(data))
+
+    def parse_document(self, document: str) -> Entry:
+        """Parses a single YAML document storing exactly one entry.
+
+        Contrary to `parse`, this method neither fires the `PreYAMLParse` and `PostYAMLParse`
+        events nor displays a progress bar. This makes it suitable for parsing entries individually
+        (see also `cobib.config.config.DatabaseConfig.lazy`).
+
+        Args:
+            document: the YAML document.
+
+        Returns:
+            The parsed entry.
+
+        Raises:
+            ValueError: if the document does not contain exactly one entry.
+        """
+        if config.parsers.yaml.use_fast_loader:
+            documents = list(_SchemaLoader(self._yaml).load_all(document))  # type: ignore[arg-type]
+            data = documents[0] if len(documents) == 1 else None
+        else:
+            data = self._yaml.load(document)  # type: ignore[union-attr]
+        if not isinstance(data, dict) or len(data) != 1:
+            raise ValueError("A YAML document must store exactly one entry.")
+        ((label, fields),) = data.items()
+        return Entry(label, fields)
+
+    @staticmethod
+    def _unquote_label(label: str) -> str:
+        """Removes any YAML quoting from a label as it appears in the raw contents of a document.
+
+        Args:
+            label: the raw label text.
+
+        Returns:
+            The label as it would be obtained by actually parsing the YAML document.
+        """
+        if len(label) > 1 and label[0] == label[-1] == "'":
+            return label[1:-1].replace("''", "'")
+        if len(label) > 1 and label[0] == label[-1] == '"':
+            try:
+                return str(json.loads(label))
+            except json.JSONDecodeError:  # pragma: no cover
+                return label[1:-1]  # pragma: no cover
+        return label
+
     def _load_all(self, stream: IO) -> dict[str, Entry]:  # type: ignore[type-arg]
+        chunks: list[bytes] = []
+        if config.parsers.yaml.parallel > 1:
+            contents = stream.read()
+            chunks = self._split_documents(contents.encode("utf-8"), config.parsers.yaml.parallel)
+            stream = io.StringIO(contents)
+
+        documents: Iterable[dict[str, Any]]
+        if len(chunks) > 1:
+            documents = self._load_parallel(chunks, config.parsers.yaml.parallel)
+        else:
+            documents = self._load_stream(stream)
+
+        return self._construct_entries(documents)
+
+    def _load_stream(self, stream: IO) -> Iterable[dict[str, Any]]:  # type: ignore[type-arg]
+        """Loads all YAML documents of a stream in the current process.
+
+        Args:
+            stream: the stream of YAML documents.
+
+        Returns:
+            The loaded documents.
+        """
+        if config.parsers.yaml.use_fast_loader:
+            return _SchemaLoader(self._yaml).load_all(stream.read())  # type: ignore[arg-type]
+        return self._yaml.load_all(stream)  # type: ignore[union-attr,no-any-return]
+
+    @staticmethod
+    def _construct_entries(documents: Iterable[dict[str, Any]]) -> dict[str, Entry]:
+        """Constructs the entries of loaded YAML documents.
+
+        Args:
+            documents: the loaded YAML documents.
+
+        Returns:
+            An `OrderedDict` mapping the labels to their entries.
+        """
         bib: dict[str, Entry] = OrderedDict()
 
         for entry in track(
-            self._yaml.load_all(stream),  # type: ignore[union-attr]
+            documents,
             description="Reading database...",
             transient=True,
             console=Console(file=sys.stderr),
@@ -89,17 +258,1244 @@ class YAMLParser(Parser):
 
         return bib
 
+    def parse_files(self, files: list[Path]) -> dict[str, Entry]:
+        """Parses multiple YAML files at once.
+
+        This is used to read sharded databases (see `cobib.database.shards`). When
+        `cobib.config.config.YAMLParserConfig.parallel` is set, every file gets parsed by its own
+        process. Contrary to `parse`, the `PreYAMLParse` event gets fired for every file but the
+        `PostYAMLParse` event gets fired only once for the combined entries.
+
+        Args:
+            files: the paths of the YAML files.
+
+        Returns:
+            An `OrderedDict` mapping the labels to the entries of all files in the given order.
+        """
+        chunks: list[bytes] = []
+        for file in files:
+            string = Event.PreYAMLParse.fire(str(file)) or str(file)
+            try:
+                LOGGER.debug("Attempting to load YAML data from file: %s.", string)
+                chunks.append(Path(string).read_bytes())
+            except OSError:
+                LOGGER.debug("Attempting to load YAML data from string: %s.", string)
+                chunks.append(string.encode("utf-8"))
+
+        documents: Iterable[dict[str, Any]]
+        if config.parsers.yaml.parallel > 1 and len(chunks) > 1:
+            documents = self._load_parallel(chunks, config.parsers.yaml.parallel)
+        else:
+            documents = (
+                document
+                for chunk in chunks
+                for document in self._load_stream(io.StringIO(chunk.decode("utf-8")))
+            )
+
+        bib = self._construct_entries(documents)
+
+        Event.PostYAMLParse.fire(bib)
+
+        return bib
+
+    @staticmethod
+    def _split_documents(data: bytes, processes: int) -> list[bytes]:
+        """Splits the raw contents of a YAML file into chunks of complete documents.
+
+        The chunks are split at the explicit document start markers (`---`). Each chunk contains at
+        least `YAMLParser._PARALLEL_CHUNK_SIZE` documents and there are no more than four chunks per
+        process.
+
+        Args:
+            data: the raw (binary) contents of a YAML file.
+            processes: the number of processes among which the chunks get distributed.
+
+        Returns:
+            The list of chunks which, when concatenated, are identical to `data`.
+        """
+        starts = [match.start() for match in YAMLParser._DOCUMENT_START.finditer(data)]
+        size = max(YAMLParser._PARALLEL_CHUNK_SIZE, math.ceil(len(starts) / (4 * processes)))
+        # any content preceding the first document start marker remains part of the first chunk
+        bounds = [0, *starts[size::size], len(data)]
+        return [data[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    @staticmethod
+    def _load_parallel(chunks: list[bytes], processes: int) -> Iterator[dict[str, Any]]:
+        """Loads the YAML documents of multiple chunks in parallel.
+
+        Args:
+            chunks: the chunks of complete YAML documents as returned by
+                `YAMLParser._split_documents`.
+            processes: the number of processes to use.
+
+        Yields:
+            The loaded documents in their original order.
+        """
+        LOGGER.debug("Loading %d chunks of YAML data in %d processes.", len(chunks), processes)
+        pure = not config.parsers.yaml.use_c_lib_yaml
+        fast = config.parsers.yaml.use_fast_loader
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for documents in executor.map(
+                _load_chunk, chunks, [pure] * len(chunks), [fast] * len(chunks)
+            ):
+                yield from documents
+
+    @override
+    def dump_key(self, entry: Entry) -> tuple[Any, ...] | None:
+        if config.events.get(Event.PreYAMLDump) or config.events.get(Event.PostYAMLDump):
+            return None
+        return (self.name, config.parsers.yaml.use_fast_dumper)
+
     @override
     def dump(self, entry: Entry) -> str | None:
+        key = self.dump_key(entry)
+        if key is not None:
+            memoized = entry.memoized_dump(key)
+            if memoized is not None:
+                return memoized
+
         Event.PreYAMLDump.fire(entry)
 
         LOGGER.debug("Converting entry %s to YAML format.", entry.label)
-        stream = io.StringIO()
-        self._yaml.dump(  # type: ignore[union-attr]
-            {entry.label: dict(sorted(entry.data.items()))}, stream=stream
-        )
-        string = stream.getvalue()
+        string: str | None = None
+        if config.parsers.yaml.use_fast_dumper:
+            try:
+                string = self._dumper.dump(entry.label, entry.data)  # type: ignore[union-attr]
+            except _UnsupportedDocument:
+                LOGGER.debug("Falling back to ruamel.yaml for dumping entry %s.", entry.label)
+        if string is None:
+            stream = io.StringIO()
+            self._yaml.dump(  # type: ignore[union-attr]
+                {entry.label: dict(sorted(entry.data.items()))}, stream=stream
+            )
+            string = stream.getvalue()
 
         string = Event.PostYAMLDump.fire(string) or string
 
+        if key is not None:
+            entry.memoize_dump(key, string)
+
         return string
+
+
+def _load_chunk(chunk: bytes, pure: bool, fast: bool) -> list[dict[str, Any]]:
+    """Loads all YAML documents of a chunk.
+
+    This function is executed in the worker processes of `YAMLParser._load_parallel`. It returns the
+    plain loaded data rather than constructed `cobib.database.Entry` objects, since the latter
+    depend on the runtime configuration which is not available to the worker processes.
+
+    Args:
+        chunk: the raw (binary) contents of complete YAML documents.
+        pure: whether to use the Python-based implementation of the YAML parser.
+        fast: whether to use the purpose-built loader (see
+            `cobib.config.config.YAMLParserConfig.use_fast_loader`).
+
+    Returns:
+        The list of loaded documents.
+    """
+    yml = YAMLParser._construct_yaml(pure)
+    if fast:
+        return list(_SchemaLoader(yml).load_all(chunk.decode("utf-8")))
+    return list(yml.load_all(chunk.decode("utf-8")))
+
+
+class _UnsupportedDocument(Exception):
+    """Raised by the `_SchemaLoader` and `_SchemaDumper` upon an unsupported document."""
+
+
+class _SchemaLoader:
+    """A purpose-built loader for the restricted YAML schema of coBib's database files.
+
+    Every document of a database file is a single-key mapping of the entry label to a block mapping
+    of fields. The field values are plain or quoted (possibly multi-line) scalars, literal block
+    scalars or block sequences of such scalars and of flat mappings (as used by
+    `cobib.database.Author`). This loader handles exactly this subset of YAML line by line and
+    resolves plain scalars with the resolver of `ruamel.yaml`.
+
+    Any document which does not fit into this schema gets loaded by `ruamel.yaml` instead. Thus,
+    the loaded data is always identical to what `ruamel.yaml` would produce.
+    """
+
+    _ESCAPES: ClassVar[dict[str, str]] = {
+        "0": "\0",
+        "a": "\a",
+        "b": "\b",
+        "t": "\t",
+        "\t": "\t",
+        "n": "\n",
+        "v": "\v",
+        "f": "\f",
+        "r": "\r",
+        "e": "\x1b",
+        " ": " ",
+        '"': '"',
+        "/": "/",
+        "\\": "\\",
+        "N": "\x85",
+        "_": "\xa0",
+        "L": "\u2028",
+        "P": "\u2029",
+    }
+    """The escape sequences of double-quoted scalars which consist of a single character."""
+
+    _ESCAPE = re.compile(r"\\(x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)", re.DOTALL)
+    """The pattern matching an escape sequence in a double-quoted scalar."""
+
+    _LINE_BREAKS = re.compile("[\r\x85\u2028\u2029]")
+    """The pattern matching characters other than `\\n` which YAML treats as line breaks."""
+
+    _INDICATORS = frozenset("[]{},&*!|>%@`#")
+    """The characters which may not start a plain scalar."""
+
+    _SIMPLE_INT = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+    """The pattern of integers whose value can be obtained trivially."""
+
+    def __init__(self, yml: yaml.YAML) -> None:
+        """Initializes the loader.
+
+        Args:
+            yml: the `ruamel.yaml.YAML` instance used for resolving plain scalars and for loading
+                any document which this loader cannot handle.
+        """
+        self._yaml = yml
+        self._resolver = yml.resolver
+
+    def load_all(self, text: str) -> Iterator[Any]:
+        """Loads all documents of a YAML file.
+
+        Args:
+            text: the contents of the YAML file.
+
+        Yields:
+            The loaded documents.
+        """
+        documents = self._split(text)
+        if documents is None:
+            yield from self._yaml.load_all(text)
+            return
+        for document in documents:
+            yield self.load(document)
+
+    def load(self, document: list[str]) -> Any:
+        """Loads a single document.
+
+        Args:
+            document: the lines of the document excluding its start and end markers.
+
+        Returns:
+            The loaded document.
+        """
+        try:
+            return self._load_entry(document)
+        except _UnsupportedDocument:
+            return self._yaml.load("\n".join(["---", *document, "..."]))
+
+    @staticmethod
+    def _split(text: str) -> list[list[str]] | None:
+        """Splits the contents of a YAML file into its documents.
+
+        Args:
+            text: the contents of the YAML file.
+
+        Returns:
+            The lines of every document excluding its start and end markers, or `None` if the file
+            contains anything other than comments outside of explicitly started documents.
+        """
+        documents: list[list[str]] = []
+        current: list[str] | None = None
+        for raw_line in text.split("\n"):
+            line = raw_line.removesuffix("\r")
+            stripped = line.rstrip(" \t")
+            if stripped == "---":
+                current = []
+                documents.append(current)
+            elif current is not None and stripped == "...":
+                current = None
+            elif stripped.startswith(("---", "...")):
+                return None
+            elif current is not None:
+                current.append(line)
+            elif stripped and not stripped.lstrip(" \t").startswith("#"):
+                return None
+        return documents
+
+    @staticmethod
+    def _indent(line: str) -> int:
+        """Computes the indentation of a line.
+
+        Args:
+            line: the line.
+
+        Returns:
+            The number of leading spaces.
+
+        Raises:
+            _UnsupportedDocument: if the indentation contains tabs.
+        """
+        indent = len(line) - len(line.lstrip(" "))
+        if line[indent : indent + 1] == "\t":
+            raise _UnsupportedDocument
+        return indent
+
+    def _load_entry(self, lines: list[str]) -> dict[str, Any]:
+        """Loads the lines of a document which stores a single entry.
+
+        Args:
+            lines: the lines of the document excluding its start and end markers.
+
+        Returns:
+            The loaded document.
+
+        Raises:
+            _UnsupportedDocument: if the document does not fit into the supported schema.
+        """
+        if any(self._LINE_BREAKS.search(line) for line in lines):
+            raise _UnsupportedDocument
+        rows = [(line, self._indent(line)) for line in lines]
+
+        pos = self._skip_blank(rows, 0)
+        if pos == len(rows) or rows[pos][1] != 0:
+            raise _UnsupportedDocument
+        label, rest = self._split_key(rows[pos][0])
+        if rest:
+            raise _UnsupportedDocument
+        pos = self._skip_blank(rows, pos + 1)
+
+        fields: dict[str, Any] = {}
+        field_indent = rows[pos][1] if pos < len(rows) else 0
+        if pos < len(rows) and field_indent == 0:
+            raise _UnsupportedDocument
+        while pos < len(rows):
+            line, indent = rows[pos]
+            if indent != field_indent:
+                raise _UnsupportedDocument
+            key, rest = self._split_key(line[indent:])
+            if key in fields:
+                raise _UnsupportedDocument
+            fields[key], pos = self._load_value(rows, pos, indent, rest)
+            pos = self._skip_blank(rows, pos)
+
+        return {label: fields or None}
+
+    def _load_value(
+        self, rows: list[tuple[str, int]], pos: int, indent: int, rest: str
+    ) -> tuple[Any, int]:
+        """Loads the value of a field.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the line on which the field starts.
+            indent: the indentation of the field key.
+            rest: the remainder of the line after the field key.
+
+        Returns:
+            The loaded value and the index of the line following it.
+
+        Raises:
+            _UnsupportedDocument: if the value does not fit into the supported schema.
+        """
+        if rest.startswith("|"):
+            return self._load_literal(rows, pos, indent, rest)
+        if rest:
+            return self._load_scalar(rows, pos, indent, rest)
+
+        nxt = self._skip_blank(rows, pos + 1)
+        if nxt < len(rows) and rows[nxt][1] >= indent:
+            line, seq_indent = rows[nxt]
+            if line[seq_indent:].rstrip(" ") == "-" or line[seq_indent:].startswith("- "):
+                return self._load_sequence(rows, nxt, seq_indent)
+            if seq_indent > indent:
+                raise _UnsupportedDocument
+        return None, pos + 1
+
+    def _load_sequence(
+        self, rows: list[tuple[str, int]], pos: int, indent: int
+    ) -> tuple[list[Any], int]:
+        """Loads a block sequence.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the line on which the first item starts.
+            indent: the indentation of the `-` indicators.
+
+        Returns:
+            The loaded sequence and the index of the line following it.
+
+        Raises:
+            _UnsupportedDocument: if the sequence does not fit into the supported schema.
+        """
+        items: list[Any] = []
+        while pos < len(rows):
+            line, line_indent = rows[pos]
+            if line_indent < indent:
+                break
+            content = line[indent:]
+            if line_indent > indent or not content.startswith("- "):
+                if line_indent == indent and not content.startswith("-"):
+                    break
+                raise _UnsupportedDocument
+            content = content[2:].lstrip(" ")
+            item_indent = len(line) - len(content)
+            if not content or content == "-" or content.startswith("- "):
+                raise _UnsupportedDocument
+            if content[0] in "'\"" or not self._is_key(content):
+                item, pos = self._load_scalar(rows, pos, indent, content)
+            else:
+                item, pos = self._load_mapping(rows, pos, item_indent, content)
+            items.append(item)
+            pos = self._skip_blank(rows, pos)
+        return items, pos
+
+    def _load_mapping(
+        self, rows: list[tuple[str, int]], pos: int, indent: int, first: str
+    ) -> tuple[dict[str, Any], int]:
+        """Loads a flat block mapping which is an item of a block sequence.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the line on which the mapping starts.
+            indent: the indentation of the mapping keys.
+            first: the remainder of the first line, starting with the first key.
+
+        Returns:
+            The loaded mapping and the index of the line following it.
+
+        Raises:
+            _UnsupportedDocument: if the mapping does not fit into the supported schema.
+        """
+        mapping: dict[str, Any] = {}
+        content = first
+        while True:
+            key, rest = self._split_key(content)
+            if not rest or rest[0] == "|" or key in mapping:
+                raise _UnsupportedDocument
+            mapping[key], pos = self._load_scalar(rows, pos, indent, rest)
+            pos = self._skip_blank(rows, pos)
+            if pos == len(rows) or rows[pos][1] < indent:
+                return mapping, pos
+            line, line_indent = rows[pos]
+            if line_indent != indent:
+                raise _UnsupportedDocument
+            content = line[indent:]
+
+    def _load_scalar(
+        self, rows: list[tuple[str, int]], pos: int, indent: int, first: str
+    ) -> tuple[Any, int]:
+        """Loads a plain or quoted scalar which may span multiple lines.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the line on which the scalar starts.
+            indent: the indentation of the parent node. All continuation lines must be indented
+                further than this.
+            first: the remainder of the first line, starting with the scalar.
+
+        Returns:
+            The loaded scalar and the index of the line following it.
+
+        Raises:
+            _UnsupportedDocument: if the scalar does not fit into the supported schema.
+        """
+        lines = [first]
+        pos += 1
+        while pos < len(rows) and (not rows[pos][0].strip(" ") or rows[pos][1] > indent):
+            lines.append(rows[pos][0])
+            pos += 1
+        while len(lines) > 1 and not lines[-1].strip(" "):
+            lines.pop()
+            pos -= 1
+
+        if first[0] == "'":
+            return self._load_single_quoted(lines), pos
+        if first[0] == '"':
+            return self._load_double_quoted(lines), pos
+
+        if first[0] in self._INDICATORS or first[:2] in ("- ", "? ", ": "):
+            raise _UnsupportedDocument
+        for line in lines:
+            stripped = line.strip(" ")
+            if (
+                " #" in line
+                or ": " in line
+                or stripped.startswith("#")
+                or stripped.endswith(":")
+                or "\t" in stripped
+            ):
+                raise _UnsupportedDocument
+        return self._resolve(self._fold(lines)), pos
+
+    def _load_single_quoted(self, lines: list[str]) -> str:
+        """Loads a single-quoted scalar.
+
+        Args:
+            lines: the lines of the scalar, the first one starting with the opening quote.
+
+        Returns:
+            The loaded scalar.
+
+        Raises:
+            _UnsupportedDocument: if the scalar is not closed properly.
+        """
+        text = "\n".join(lines)
+        pos = 1
+        while True:
+            pos = text.find("'", pos)
+            if pos < 0:
+                raise _UnsupportedDocument
+            if text[pos + 1 : pos + 2] != "'":
+                break
+            pos += 2
+        if text[pos + 1 :].strip(" "):
+            raise _UnsupportedDocument
+        return self._fold(text[1:pos].split("\n")).replace("''", "'")
+
+    def _load_double_quoted(self, lines: list[str]) -> str:
+        """Loads a double-quoted scalar.
+
+        Args:
+            lines: the lines of the scalar, the first one starting with the opening quote.
+
+        Returns:
+            The loaded scalar.
+
+        Raises:
+            _UnsupportedDocument: if the scalar is not closed properly or contains unknown escape
+                sequences.
+        """
+        text = "\n".join(lines)
+        pos = 1
+        while True:
+            pos = text.find('"', pos)
+            if pos < 0:
+                raise _UnsupportedDocument
+            escape = pos
+            while text[escape - 1] == "\\":
+                escape -= 1
+            if (pos - escape) % 2 == 0:
+                break
+            pos += 1
+        if text[pos + 1 :].strip(" "):
+            raise _UnsupportedDocument
+
+        content = text[1:pos].split("\n")
+        for line in content[:-1]:
+            if line.rstrip(" \t").endswith("\\") and line != line.rstrip(" \t"):
+                raise _UnsupportedDocument
+        # escaped line breaks join two lines without folding them
+        segments: list[list[str]] = [[]]
+        for line in content:
+            segments[-1].append(line)
+            backslashes = len(line) - len(line.rstrip("\\"))
+            if backslashes % 2 == 1:
+                segments.append([])
+        folded = []
+        for idx, segment in enumerate(segments):
+            if idx > 0:
+                segment[0] = segment[0].lstrip(" \t")
+            if idx < len(segments) - 1:
+                segment[-1] = segment[-1][:-1]
+            folded.append(self._fold(segment) if len(segment) > 1 else segment[0])
+        return self._ESCAPE.sub(self._unescape, "".join(folded))
+
+    @classmethod
+    def _unescape(cls, match: re.Match[str]) -> str:
+        """Replaces an escape sequence of a double-quoted scalar.
+
+        Args:
+            match: the match of `_SchemaLoader._ESCAPE`.
+
+        Returns:
+            The escaped character.
+
+        Raises:
+            _UnsupportedDocument: if the escape sequence is unknown.
+        """
+        code = match.group(1)
+        if len(code) > 1:
+            return chr(int(code[1:], 16))
+        if code not in cls._ESCAPES:
+            raise _UnsupportedDocument
+        return cls._ESCAPES[code]
+
+    def _load_literal(
+        self, rows: list[tuple[str, int]], pos: int, indent: int, header: str
+    ) -> tuple[str, int]:
+        """Loads a literal block scalar.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the line containing the block header.
+            indent: the indentation of the parent node.
+            header: the block header (`|`, `|-` or `|+`).
+
+        Returns:
+            The loaded scalar and the index of the line following it.
+
+        Raises:
+            _UnsupportedDocument: if the block header is not supported or the block is not
+                indented consistently.
+        """
+        chomping = header.rstrip(" ")[1:]
+        if chomping not in ("", "-", "+"):
+            raise _UnsupportedDocument
+
+        lines: list[tuple[str, int]] = []
+        pos += 1
+        while pos < len(rows) and (not rows[pos][0].strip(" ") or rows[pos][1] > indent):
+            lines.append(rows[pos])
+            pos += 1
+
+        block_indent = next((i for line, i in lines if line.strip(" ")), None)
+        if block_indent is None:
+            raise _UnsupportedDocument
+        content: list[str] = []
+        for line, line_indent in lines:
+            if not line.strip(" "):
+                if len(line) > block_indent:
+                    raise _UnsupportedDocument
+                content.append("")
+            elif line_indent < block_indent:
+                raise _UnsupportedDocument
+            else:
+                content.append(line[block_indent:])
+
+        trailing = 0
+        while content and not content[-1]:
+            content.pop()
+            trailing += 1
+        text = "\n".join(content)
+        if chomping == "-":
+            return text, pos
+        if chomping == "+":
+            return text + "\n" * (1 + trailing), pos
+        return text + "\n", pos
+
+    @staticmethod
+    def _fold(lines: list[str]) -> str:
+        """Folds the lines of a multi-line flow scalar.
+
+        Args:
+            lines: the lines of the scalar.
+
+        Returns:
+            The folded scalar: line breaks are converted into spaces and empty lines into line
+            breaks.
+        """
+        if len(lines) == 1:
+            return lines[0]
+        parts = [lines[0].rstrip(" \t")]
+        empty = 0
+        for idx, line in enumerate(lines[1:], start=2):
+            content = line.lstrip(" \t") if idx == len(lines) else line.strip(" \t")
+            if not content and idx < len(lines):
+                empty += 1
+                continue
+            parts.append("\n" * empty if empty else " ")
+            parts.append(content)
+            empty = 0
+        return "".join(parts)
+
+    def _split_key(self, content: str) -> tuple[str, str]:
+        """Splits a line of a block mapping into its key and the remainder.
+
+        Args:
+            content: the line, excluding its indentation.
+
+        Returns:
+            The key and the (stripped) remainder of the line.
+
+        Raises:
+            _UnsupportedDocument: if the key is not a string or the line is not a mapping entry.
+        """
+        if content[:1] in ("'", '"'):
+            quote = content[0]
+            end = content.find(quote + ":", 1)
+            if end < 0 or content[end + 2 : end + 3] not in ("", " "):
+                raise _UnsupportedDocument
+            raw = content[: end + 1]
+            key = (
+                self._load_single_quoted([raw]) if quote == "'" else self._load_double_quoted([raw])
+            )
+            return key, content[end + 2 :].strip(" ")
+
+        if not self._is_key(content) or content[0] in self._INDICATORS:
+            raise _UnsupportedDocument
+        sep = content.find(": ")
+        if sep < 0:
+            sep = len(content.rstrip(" ")) - 1
+        key, rest = content[:sep].rstrip(" "), content[sep + 1 :].strip(" ")
+        if not key or " #" in key or not isinstance(self._resolve(key), str):
+            raise _UnsupportedDocument
+        return key, rest
+
+    @staticmethod
+    def _is_key(content: str) -> bool:
+        """Checks whether a line of plain text starts a block mapping entry.
+
+        Args:
+            content: the line, excluding its indentation.
+
+        Returns:
+            Whether the line contains a key indicator (`: ` or a trailing `:`).
+        """
+        return ": " in content or content.rstrip(" ").endswith(":")
+
+    def _resolve(self, value: str) -> Any:
+        """Resolves a plain scalar.
+
+        Args:
+            value: the plain scalar.
+
+        Returns:
+            The value as resolved by `ruamel.yaml`.
+
+        Raises:
+            _UnsupportedDocument: if the scalar resolves to a type other than a string, a null, a
+                boolean or a decimal integer.
+        """
+        tag = str(self._resolver.resolve(ScalarNode, value, (True, False)))
+        if tag == "tag:yaml.org,2002:str":
+            return value
+        if tag == "tag:yaml.org,2002:int" and self._SIMPLE_INT.fullmatch(value):
+            return int(value)
+        if tag == "tag:yaml.org,2002:null":
+            return None
+        if tag == "tag:yaml.org,2002:bool":
+            return value.lower() == "true"
+        raise _UnsupportedDocument
+
+    @staticmethod
+    def _skip_blank(rows: list[tuple[str, int]], pos: int) -> int:
+        """Skips over empty lines.
+
+        Args:
+            rows: the lines of the document along with their indentation.
+            pos: the index of the current line.
+
+        Returns:
+            The index of the next non-empty line.
+
+        Raises:
+            _UnsupportedDocument: if a comment line is encountered.
+        """
+        while pos < len(rows):
+            stripped = rows[pos][0].strip(" ")
+            if stripped.startswith("#"):
+                raise _UnsupportedDocument
+            if stripped:
+                break
+            pos += 1
+        return pos
+
+
+class _SchemaDumper:
+    """A purpose-built emitter for the restricted YAML schema of coBib's database files.
+
+    This emitter writes the label and the (sorted) fields of an entry directly into a single output
+    buffer. It supports string and integer fields as well as block sequences of such scalars and of
+    flat mappings (as used by `cobib.database.Author`). The choice of scalar styles and the folding
+    of long lines mirror the emitter of `ruamel.yaml` exactly, such that the output is identical to
+    what `ruamel.yaml` would produce.
+
+    Any entry which does not fit into this schema raises an `_UnsupportedDocument` exception and
+    must be dumped by `ruamel.yaml` instead.
+    """
+
+    _BEST_WIDTH: ClassVar[int] = 80
+    """The preferred line width of `ruamel.yaml`."""
+
+    _MAX_SIMPLE_KEY_LENGTH: ClassVar[int] = 128
+    """The maximum length of a key which `ruamel.yaml` writes without an explicit `?` indicator."""
+
+    _BREAKS = "\n\x85\u2028\u2029"
+    """The characters which are written as line breaks."""
+
+    _ESCAPES: ClassVar[dict[str, str]] = {
+        "\0": "0",
+        "\x07": "a",
+        "\x08": "b",
+        "\x09": "t",
+        "\x0a": "n",
+        "\x0b": "v",
+        "\x0c": "f",
+        "\x0d": "r",
+        "\x1b": "e",
+        '"': '"',
+        "\\": "\\",
+        "\x85": "N",
+        "\xa0": "_",
+        "\u2028": "L",
+        "\u2029": "P",
+    }
+    """The characters which are written as a single-character escape sequence in double quotes."""
+
+    _SPECIAL = re.compile("[^\n\x20-\x7e\x85\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]|\ufeff")
+    """The pattern matching characters which can only be written in double quotes."""
+
+    _UNPRINTABLE = re.compile(
+        '[^\x20-\x7e\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]|["\\\\\x85\u2028\u2029\ufeff]'
+    )
+    """The pattern matching characters which must be escaped in double quotes."""
+
+    _LINE_BREAK = re.compile("[\n\x85\u2028\u2029]")
+    """The pattern matching line breaks."""
+
+    _SPACE_BREAK = re.compile("[\n\x85\u2028\u2029] | [\n\x85\u2028\u2029]")
+    """The pattern matching a space adjacent to a line break."""
+
+    _BLOCK_INDICATOR = re.compile(
+        "\\A(?:---|\\.\\.\\.|[#,\\[\\]{}&*!|>'\"%@`]|[?:-](?=[\0 \t\r\n\x85\u2028\u2029]|\\Z))"
+        "|:(?=[\0 \t\r\n\x85\u2028\u2029]|\\Z)|(?<=[\0 \t\r\n\x85\u2028\u2029])#"
+    )
+    """The pattern matching indicators which may not appear in a block plain scalar."""
+
+    _WORDS = re.compile(" +|[^ ]+")
+    """The pattern splitting a scalar without line breaks into runs of spaces and words."""
+
+    _QUOTED_WORDS = re.compile(" +|'|[^ ']+")
+    """The pattern splitting a scalar without line breaks into runs of spaces, words and quotes."""
+
+    def __init__(self, yml: yaml.YAML) -> None:
+        """Initializes the emitter.
+
+        Args:
+            yml: the `ruamel.yaml.YAML` instance whose resolver determines which strings need to be
+                quoted.
+        """
+        self._resolver = yml.resolver
+        self._key_styles: dict[str, str] = {}
+        self._buffer: list[str] = []
+        self._column = 0
+        self._indent = 0
+        self._whitespace = True
+        self._indention = True
+
+    def dump(self, label: str, data: dict[str, Any]) -> str:
+        """Dumps an entry into a YAML document.
+
+        Args:
+            label: the label of the entry.
+            data: the fields of the entry.
+
+        Returns:
+            The YAML document.
+
+        Raises:
+            _UnsupportedDocument: if the entry does not fit into the supported schema.
+        """
+        if not isinstance(label, str) or not isinstance(data, dict) or not data:
+            raise _UnsupportedDocument
+
+        self._buffer.clear()
+        self._column = 0
+        self._indent = 0
+        self._whitespace = True
+        self._indention = True
+
+        self._write_indicator("---", True)
+        self._write_line_break()
+        self._write_key(label, 0, cache=False)
+        self._write_mapping(data, 2)
+        self._indent = 0
+        self._write_indent()
+        self._write_indicator("...", True)
+        self._write_indent()
+
+        return "".join(self._buffer)
+
+    def _write_mapping(self, data: dict[str, Any], indent: int) -> None:
+        """Writes the items of a block mapping.
+
+        Args:
+            data: the mapping.
+            indent: the indentation of its keys.
+
+        Raises:
+            _UnsupportedDocument: if the mapping does not fit into the supported schema.
+        """
+        try:
+            keys = sorted(data)
+        except TypeError as exc:
+            raise _UnsupportedDocument from exc
+        for key in keys:
+            self._indent = indent
+            self._write_indent()
+            self._write_key(key, indent, cache=True)
+            value = data[key]
+            if isinstance(value, list):
+                self._write_sequence(value, indent)
+            else:
+                self._indent = indent + 2
+                self._write_scalar(value)
+
+    def _write_sequence(self, items: list[Any], indent: int) -> None:
+        """Writes a block sequence which is the value of a mapping item.
+
+        Args:
+            items: the sequence.
+            indent: the indentation of the mapping keys (since the sequence is not indented).
+
+        Raises:
+            _UnsupportedDocument: if the sequence does not fit into the supported schema.
+        """
+        if not items:
+            self._write_indicator("[", True, whitespace=True)
+            self._write_indicator("]", False)
+            self._write_line_break()
+            return
+        for item in items:
+            self._indent = indent
+            self._write_indent()
+            self._write_indicator("-", True, indention=True)
+            self._indent = indent + 2
+            value = item
+            if isinstance(value, Author):
+                value = {k: v for k, v in value._asdict().items() if v is not None}
+            if isinstance(value, dict):
+                if not value or any(isinstance(field, list) for field in value.values()):
+                    raise _UnsupportedDocument
+                self._write_mapping(value, indent + 2)
+            else:
+                self._write_indent()
+                self._write_scalar(value)
+
+    def _write_key(self, key: str, indent: int, cache: bool) -> None:
+        """Writes a simple mapping key including its trailing colon.
+
+        Args:
+            key: the key.
+            indent: the indentation of the mapping keys.
+            cache: whether to cache the style of the key. This should be done for field names, since
+                these recur in every entry, but not for labels.
+
+        Raises:
+            _UnsupportedDocument: if the key is not a string or is too long to be written as a
+                simple key.
+        """
+        # NOTE: `ruamel.yaml` includes the length of the (implicit) `!!str` tag in this check
+        if type(key) is not str or len(key) + len("!!str") >= self._MAX_SIMPLE_KEY_LENGTH:
+            raise _UnsupportedDocument
+        style = self._key_styles.get(key) if cache else None
+        if style is None:
+            style = self._choose_style(key, simple_key=True)
+            if cache:
+                self._key_styles[key] = style
+        self._indent = indent + 2
+        self._write_styled(key, style, split=False)
+        self._write_indicator(":", False)
+
+    def _write_scalar(self, value: Any) -> None:
+        """Writes a scalar mapping value or sequence item.
+
+        Args:
+            value: the scalar.
+
+        Raises:
+            _UnsupportedDocument: if the scalar is neither a string nor an integer.
+        """
+        if type(value) is int:
+            self._write_plain(str(value), split=True)
+        elif type(value) is str:
+            self._write_styled(value, self._choose_style(value, simple_key=False), split=True)
+        else:
+            raise _UnsupportedDocument
+
+    def _choose_style(self, text: str, simple_key: bool) -> str:
+        """Chooses the style of a string scalar.
+
+        Args:
+            text: the scalar.
+            simple_key: whether the scalar is a simple mapping key.
+
+        Returns:
+            The style: an empty string for plain scalars or the respective quote character.
+
+        Raises:
+            _UnsupportedDocument: if a simple key would span multiple lines.
+        """
+        if not text:
+            return "'"
+        special = self._SPECIAL.search(text) is not None
+        multiline = self._LINE_BREAK.search(text) is not None
+        if simple_key and multiline:
+            raise _UnsupportedDocument
+        space_break = special or self._SPACE_BREAK.search(text) is not None
+        if (
+            not space_break
+            and not multiline
+            and text[0] != " "
+            and text[-1] != " "
+            and self._BLOCK_INDICATOR.search(text) is None
+            and str(self._resolver.resolve(ScalarNode, text, (True, False)))
+            == "tag:yaml.org,2002:str"
+        ):
+            return ""
+        if "'" in text or "\n" in text:
+            return '"'
+        if not space_break:
+            return "'"
+        return '"'
+
+    def _write_styled(self, text: str, style: str, split: bool) -> None:
+        """Writes a string scalar in the given style.
+
+        Args:
+            text: the scalar.
+            style: the style as returned by `_choose_style`.
+            split: whether long lines may be folded.
+        """
+        if style == '"':
+            self._write_double_quoted(text, split)
+        elif style == "'":
+            self._write_single_quoted(text, split)
+        else:
+            self._write_plain(text, split)
+
+    def _write(self, data: str) -> None:
+        """Writes some data to the output buffer.
+
+        Args:
+            data: the data.
+        """
+        self._column += len(data)
+        self._buffer.append(data)
+
+    def _write_indicator(
+        self,
+        indicator: str,
+        need_whitespace: bool,
+        whitespace: bool = False,
+        indention: bool = False,
+    ) -> None:
+        """Writes an indicator.
+
+        Args:
+            indicator: the indicator.
+            need_whitespace: whether the indicator must be preceded by whitespace.
+            whitespace: whether the indicator counts as whitespace.
+            indention: whether the indicator counts as indentation.
+        """
+        if not self._whitespace and need_whitespace:
+            indicator = " " + indicator
+        self._whitespace = whitespace
+        self._indention = self._indention and indention
+        self._write(indicator)
+
+    def _write_indent(self) -> None:
+        """Moves onto a new line (if necessary) and writes the current indentation."""
+        if (
+            not self._indention
+            or self._column > self._indent
+            or (self._column == self._indent and not self._whitespace)
+        ):
+            self._write_line_break()
+        if self._column < self._indent:
+            self._whitespace = True
+            self._write(" " * (self._indent - self._column))
+
+    def _write_line_break(self, data: str = "\n") -> None:
+        """Writes a line break.
+
+        Args:
+            data: the line break character.
+        """
+        self._whitespace = True
+        self._indention = True
+        self._column = 0
+        self._buffer.append(data)
+
+    def _write_plain(self, text: str, split: bool) -> None:
+        """Writes a plain scalar.
+
+        Args:
+            text: the scalar (which never contains line breaks).
+            split: whether long lines may be folded.
+        """
+        if not text:
+            return  # pragma: no cover
+        if not self._whitespace:
+            self._write(" ")
+        self._whitespace = False
+        self._indention = False
+        if self._column + len(text) <= self._BEST_WIDTH:
+            self._write(text)
+            return
+        for match in self._WORDS.finditer(text):
+            data = match.group()
+            if data[0] == " ":
+                if len(data) == 1 and self._column >= self._BEST_WIDTH and split:
+                    self._write_indent()
+                    self._whitespace = False
+                    self._indention = False
+                else:
+                    self._write(data)
+            else:
+                if len(data) + self._column > self._BEST_WIDTH and self._column > self._indent:
+                    # words longer than the line width get a line of their own
+                    self._write_indent()
+                self._write(data)
+
+    def _write_single_quoted(self, text: str, split: bool) -> None:
+        r"""Writes a single-quoted scalar.
+
+        Args:
+            text: the scalar (which never contains a `\n` line break).
+            split: whether long lines may be folded.
+        """
+        self._write_indicator("'", True)
+        if self._LINE_BREAK.search(text) is not None:
+            self._write_single_quoted_breaks(text, split)
+        elif self._column + len(text) < self._BEST_WIDTH and "'" not in text:
+            self._write(text)
+        else:
+            for match in self._QUOTED_WORDS.finditer(text):
+                data = match.group()
+                if data == "'":
+                    self._write("''")
+                elif (
+                    data == " "
+                    and self._column > self._BEST_WIDTH
+                    and split
+                    and match.start() != 0
+                    and match.end() != len(text)
+                ):
+                    self._write_indent()
+                else:
+                    self._write(data)
+        self._write_indicator("'", False)
+
+    def _write_single_quoted_breaks(self, text: str, split: bool) -> None:
+        """Writes the contents of a single-quoted scalar which contains line breaks.
+
+        Args:
+            text: the scalar.
+            split: whether long lines may be folded.
+        """
+        spaces = False
+        breaks = False
+        start = end = 0
+        while end <= len(text):
+            ch = text[end] if end < len(text) else None
+            if spaces:
+                if ch is None or ch != " ":
+                    if (
+                        start + 1 == end
+                        and self._column > self._BEST_WIDTH
+                        and split
+                        and start != 0
+                        and end != len(text)
+                    ):
+                        self._write_indent()
+                    else:
+                        self._write(text[start:end])
+                    start = end
+            elif breaks:
+                if ch is None or ch not in self._BREAKS:
+                    for br in text[start:end]:
+                        self._write_line_break(br)
+                    self._write_indent()
+                    start = end
+            elif ch is None or ch in " \x85\u2028\u2029'":
+                if start < end:
+                    self._write(text[start:end])
+                    start = end
+            if ch == "'":
+                self._write("''")
+                start = end + 1
+            if ch is not None:
+                spaces = ch == " "
+                breaks = ch in self._BREAKS
+            end += 1
+
+    def _write_double_quoted(self, text: str, split: bool) -> None:
+        """Writes a double-quoted scalar.
+
+        Args:
+            text: the scalar.
+            split: whether long lines may be folded.
+        """
+        self._write_indicator('"', True)
+        length = len(text)
+        match = self._UNPRINTABLE.search(text)
+        if self._column + length < self._BEST_WIDTH and match is None:
+            self._write(text)
+            self._write_indicator('"', False)
+            return
+        special = length if match is None else match.start()
+        start = end = 0
+        while end <= length:
+            if end in {special, length}:
+                if start < end:
+                    self._write(text[start:end])
+                    start = end
+                if end < length:
+                    ch = text[end]
+                    if ch in self._ESCAPES:
+                        data = "\\" + self._ESCAPES[ch]
+                    elif ch <= "\xff":
+                        data = f"\\x{ord(ch):02X}"
+                    elif ch <= "\uffff":
+                        data = f"\\u{ord(ch):04X}"
+                    else:
+                        data = f"\\U{ord(ch):08X}"  # pragma: no cover
+                    self._write(data)
+                    start = end + 1
+                    match = self._UNPRINTABLE.search(text, end + 1)
+                    special = length if match is None else match.start()
+            if (
+                0 < end < length - 1
+                and (text[end] == " " or start >= end)
+                and self._column + (end - start) > self._BEST_WIDTH
+                and split
+            ):
+                start = self._fold_double_quoted(text, start, end)
+            end += 1
+            if start < end < length:
+                # nothing happens until the next space, special character or the end of the text
+                space = text.find(" ", end)
+                end = min(special, length if space < 0 else space)
+        self._write_indicator('"', False)
+
+    def _fold_double_quoted(self, text: str, start: int, end: int) -> int:
+        """Folds a double-quoted scalar onto a new line.
+
+        Args:
+            text: the scalar.
+            start: the position of the first character which has not been written yet.
+            end: the position at which to fold.
+
+        Returns:
+            The new position of the first character which has not been written yet.
+        """
+        need_backslash = True
+        try:
+            space_pos = text.index(" ", end)
+            try:
+                space_pos = text.index("\n", end, space_pos)
+            except ValueError:
+                pass
+            if text[space_pos] == "\n" and text[space_pos + 1] != " ":
+                pass
+            elif (
+                '"' not in text[end:space_pos]
+                and "'" not in text[end:space_pos]
+                and text[space_pos + 1] not in " \n"
+                and text[end - 1 : end + 1] != "  "
+                and start != end
+            ):
+                need_backslash = False
+        except (ValueError, IndexError):
+            pass
+        self._write(text[start:end] + ("\\" if need_backslash else ""))
+        start = max(start, end)
+        self._write_indent()
+        self._whitespace = False
+        self._indention = False
+        if text[start] == " ":
+            if need_backslash:
+                self._write("\\")
+            else:
+                # the leading space is reproduced by the folded line break
+                start += 1
+        return start
@@ -14,7 +14,7 @@ from typing_extensions import override
 
 from cobib.commands import AddCommand
 from cobib.config import Event, config
-from cobib.database import Author, Database
+from cobib.database import Author, Database, Entry
 from cobib.utils.logging import HINT
 from cobib.utils.rel_path import RelPath
 
@@ -759,6 +759,83 @@ class TestAddCommand(CommandTest):
             finally:
                 path.path.unlink(missing_ok=True)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ["post_setup", "args", "expected"],
+        [
+            [{"stdin_list": ["cancel"]}, ["-d", "10.1002/ANDP.19053221004"], "doi"],
+            [{"stdin_list": ["cancel"]}, ["-u", "https://doi.org/10.1002/andp.19053221004"], "url"],
+        ],
+        indirect=["post_setup"],
+    )
+    async def test_existing_identifier(
+        self,
+        setup: Any,
+        post_setup: Any,
+        args: list[str],
+        expected: str,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that an existing identifier is detected without querying the parser.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+            post_setup: an additional setup fixture.
+            args: the arguments to pass to the command.
+            expected: the name of the parser which should not be queried.
+            monkeypatch: the built-in pytest fixture.
+            caplog: the built-in pytest fixture.
+        """
+
+        def parse(*_: Any) -> Any:
+            raise AssertionError("The parser must not be queried.")
+
+        monkeypatch.setattr(f"cobib.parsers.{expected}.{expected.upper()}Parser.parse", parse)
+
+        cmd = AddCommand(*args)
+        await cmd.execute()
+
+        assert len(cmd.new_entries) == 0
+        assert list(Database().keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+        assert (
+            "cobib.commands.add",
+            logging.WARNING,
+            f"Cancelling the addition of the new entry from the {expected} '{args[-1]}' without "
+            f"querying the {expected} parser.",
+        ) in caplog.record_tuples
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(["resolution", "queried"], [["keep", False], ["update", True]])
+    async def test_existing_identifier_mismatched_label(
+        self, setup: Any, resolution: str, queried: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test resolving an existing identifier when the parser would return a different label.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+            resolution: the reply to the disambiguation prompt.
+            queried: whether the parser is expected to be queried.
+            monkeypatch: the built-in pytest fixture.
+        """
+        einstein = Database()["einstein"]
+        calls: list[str] = []
+
+        def parse(_: Any, string: str) -> Any:
+            calls.append(string)
+            entry = Entry("Einstein1905", dict(einstein.data))
+            entry.data["note"] = "a new addition"
+            return {"Einstein1905": entry}
+
+        monkeypatch.setattr("cobib.parsers.doi.DOIParser.parse", parse)
+
+        cmd = AddCommand("-d", "10.1002/ANDP.19053221004", "--disambiguation", resolution)
+        await cmd.execute()
+
+        assert bool(calls) == queried
+        assert list(Database().keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+        assert (Database()["einstein"].data.get("note", None) == "a new addition") == queried
+
     @pytest.mark.asyncio
     async def test_disambiguate_identical(
         self, setup: Any, caplog: pytest.LogCaptureFixture
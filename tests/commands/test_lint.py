@@ -12,6 +12,7 @@ from typing_extensions import override
 
 from cobib.commands import LintCommand
 from cobib.config import config
+from cobib.database import Database
 from cobib.utils.logging import HINT
 from cobib.utils.rel_path import RelPath
 from tests.commands.command_test import CommandTest
@@ -131,6 +132,7 @@ class TestLintDatabase(CommandTest):
                 "lint",
                 {
                     "format": True,
+                    "compact": False,
                 },
             )
 
@@ -184,3 +186,39 @@ class TestLintDatabase(CommandTest):
         finally:
             dummy_note.unlink()
             another_dummy_note.unlink()
+
+    @pytest.mark.parametrize(
+        "setup",
+        [
+            {"git": False, "database": True},
+            {"git": True, "database": True},
+        ],
+        indirect=["setup"],
+    )
+    def test_lint_compact(self, setup: Any) -> None:
+        """Test folding the database journal back into the database file.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+        """
+        git = setup.get("git", False)
+
+        config.database.journal = True
+        journal = Database.get_journal_file()
+        try:
+            bib = Database()
+            bib.pop("einstein")
+            bib.save()
+            assert journal.exists()
+
+            cmd = LintCommand("--compact")
+            cmd.execute()
+            assert not journal.exists()
+
+            with open(config.database.file, "r", encoding="utf-8") as file:
+                assert "einstein" not in file.read()
+
+            if git:
+                self.assert_git_commit_message("lint", {"format": False, "compact": True})
+        finally:
+            journal.unlink(missing_ok=True)
@@ -103,6 +103,25 @@ class TestListCommand(CommandTest):
                 {"title"},
                 False,
             ],
+            # the following cases are evaluated on the value index
+            [["++ENTRYTYPE", "^b"], ["latexcompanion"], {"ENTRYTYPE"}, False],
+            [["++ENTRYTYPE", "^b", "++ENTRYTYPE", "misc"], [], {"ENTRYTYPE"}, False],
+            [
+                ["-x", "++ENTRYTYPE", "book", "--journal", "Physik"],
+                ["latexcompanion", "knuthwebsite"],
+                {"ENTRYTYPE", "journal"},
+                False,
+            ],
+            # the following cases are evaluated on the range index
+            [["++year", ">=1905", "++year", "<1950"], ["einstein"], {"year"}, False],
+            [["++year", ">1905"], ["latexcompanion"], {"year"}, False],
+            [["--year", "=1993"], ["einstein", "knuthwebsite"], {"year"}, False],
+            [
+                ["-x", "++pages", "<900", "++ENTRYTYPE", "book"],
+                ["einstein", "latexcompanion"],
+                {"ENTRYTYPE", "pages"},
+                False,
+            ],
             # the following cases test the fuzzy entry matching (if `regex` is available)
             [
                 ["++journal", "Pyhsik"],  # first ensure that we do not match this typo without `-z`
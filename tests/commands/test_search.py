@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import threading
 from io import StringIO
 from itertools import zip_longest
 from pathlib import Path
@@ -184,6 +185,77 @@ class TestSearchCommand(CommandTest):
             "The search for ['missing'] returned no results!",
         ) in caplog.record_tuples
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("args", [["einstein"], ["annalen der"], ["\\bknuth", "Einst.in"]])
+    async def test_full_text_index(self, setup: Any, args: list[str]) -> None:
+        """Test searching with the full-text index.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+            args: the arguments to pass to the command.
+        """
+        cmd = SearchCommand("--skip-files", *args)
+        await cmd.execute()
+        expected = cmd.render_porcelain()
+
+        config.commands.search.full_text_index = True
+        cmd = SearchCommand("--skip-files", *args)
+        await cmd.execute()
+        assert cmd.render_porcelain() == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("args", [[], ["--skip-files", "einstein"]])
+    async def test_warm_cache(self, setup: Any, tmp_path: Path, args: list[str]) -> None:
+        """Test warming the extracted-text cache.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+            tmp_path: the built-in pytest fixture.
+            args: the arguments to pass to the command.
+        """
+        config.database.cache = str(tmp_path / "cache")
+        config.commands.search.extractor = ["cat", "{}"]
+
+        file_path = tmp_path / "einstein.md"
+        file_path.write_text("Dummy file for the 'einstein' entry.")
+        entry = Database()["einstein"]
+        entry.file = [str(file_path)]
+        Database().update({"einstein": entry})
+
+        cmd = SearchCommand("--warm-cache", *args)
+        await cmd.execute()
+        if args:
+            # the search does not wait for the texts to be extracted in the background
+            assert cmd.render_porcelain()[0] == "einstein::2"
+            for thread in threading.enumerate():
+                if thread.name == "warm-cache":
+                    thread.join()
+        else:
+            assert cmd.entries == []
+
+        assert len(list((tmp_path / "cache" / "extracted").iterdir())) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("args", [["einstein"], ["-i", "-c", "2", "quantum", "\\d+"]])
+    async def test_parallel(
+        self, setup: Any, monkeypatch: pytest.MonkeyPatch, args: list[str]
+    ) -> None:
+        """Test searching in parallel.
+
+        Args:
+            setup: the `tests.commands.command_test.CommandTest.setup` fixture.
+            monkeypatch: the built-in pytest fixture.
+            args: the arguments to pass to the command.
+        """
+        cmd = SearchCommand("--skip-files", *args)
+        await cmd.execute()
+        expected = cmd.render_porcelain()
+
+        monkeypatch.setattr(SearchCommand, "_PARALLEL_CHUNK_SIZE", 1)
+        cmd = SearchCommand("--skip-files", "--parallel", "2", *args)
+        await cmd.execute()
+        assert cmd.render_porcelain() == expected
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         ["args", "expected", "config_overwrite"],
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from collections.abc import Generator
+from dataclasses import fields
 from pathlib import Path
 from shutil import copyfile
 from tempfile import TemporaryDirectory
@@ -13,7 +14,7 @@ from typing import Any
 import pytest
 
 from cobib.config import config
-from cobib.config.config import Config, LabelSuffix
+from cobib.config.config import Config, LabelSuffix, TagMarkup
 
 from .. import get_resource
 
@@ -218,3 +219,21 @@ def test_label_suffix_trim(setup: Any) -> None:
     assert LabelSuffix.trim_label("some_test", "_", LabelSuffix.NUMERIC) == ("some_test", 0)
     assert LabelSuffix.trim_label("some_test", "_", LabelSuffix.ALPHA) == ("some_test", 0)
     assert LabelSuffix.trim_label("some_test", "_", LabelSuffix.CAPITAL) == ("some_test", 0)
+
+
+def test_tags_theme_signature(setup: Any) -> None:
+    """Test the `TagsThemeConfig.signature` property covers all tag markups.
+
+    Args:
+        setup: a local pytest fixture.
+    """
+    for field_ in fields(config.theme.tags):
+        if field_.name == "user_tags":
+            continue
+        signature = config.theme.tags.signature
+        setattr(config.theme.tags, field_.name, TagMarkup(-1, "none"))
+        assert config.theme.tags.signature != signature
+
+    signature = config.theme.tags.signature
+    config.theme.tags.user_tags["custom"] = TagMarkup(50, "bold")
+    assert config.theme.tags.signature != signature
@@ -5,17 +5,25 @@ from __future__ import annotations
 import copy
 import logging
 import os
+import sqlite3
 import tempfile
+from collections import OrderedDict
 from collections.abc import Generator
 from pathlib import Path
-from shutil import copyfile
+from shutil import copyfile, rmtree
 from typing import Any, cast
 
 import pytest
+from natsort import natsorted
 
-from cobib.config import LabelSuffix, config
+from cobib.config import Event, LabelSuffix, config
 from cobib.database import Database, Entry
 from cobib.database.database import CacheError
+from cobib.database.filter_plan import FilterPlan
+from cobib.database.range_index import Comparison, RangeIndex
+from cobib.database.shards import ShardedBackend
+from cobib.database.value_index import ValueIndex
+from cobib.exporters import YAMLExporter
 
 from .. import get_resource
 
@@ -213,6 +221,81 @@ def test_find_related_labels(
     assert expected_indirect == indirect
 
 
+def test_database_label_index() -> None:
+    """Test the `cobib.database.Database.label_index` method and the maintenance of its index."""
+    config.database.format.label_suffix = ("_", LabelSuffix.ALPHA)
+    bib = Database()
+    bib.update({label: Entry(label, {}) for label in ["test", "test_a", "test_b", "test_d"]})
+
+    index = Database.label_index()
+    assert index.free_suffix("test") == 3
+    assert bib.disambiguate_label("test", Entry("test", {"title": "other"})) == "test_c"
+    bib.update({"test_c": Entry("test_c", {})})
+    # without any gaps, the next free suffix follows the highest one
+    assert index.free_suffix("test") == 5
+    bib.pop("test_d")
+    assert index.free_suffix("test") == 4
+    bib.rename("test_a", "tester")
+    bib.update({"tester": Entry("tester", {})})
+    assert bib.find_related_labels("test") == ({"test", "test_b", "test_c"}, {"tester"})
+
+    # changing the label suffix invalidates the index
+    config.database.format.label_suffix = ("_", LabelSuffix.NUMERIC)
+    assert not index.is_current()
+    assert bib.disambiguate_label("test", Entry("test", {"title": "other"})) == "test_1"
+
+
+def test_database_identifier_index() -> None:
+    """Test the `cobib.database.Database.identifier_index` method and its maintenance."""
+    bib = Database()
+    bib.read()
+
+    index = Database.identifier_index()
+    assert index.find("doi", "https://doi.org/10.1002/ANDP.19053221004") == {"einstein"}
+    assert index.find("url", "www-cs-faculty.stanford.edu/\\~{}uno/abcde.html/") == {"knuthwebsite"}
+    assert index.find("doi", "not a doi") == set()
+
+    bib.update(
+        {
+            "dummy": Entry(
+                "dummy",
+                {"eprint": "arXiv:2106.12345v2", "isbn": "0-201-36299-6", "doi": "10.1/X"},
+            )
+        }
+    )
+    assert index.find("arxiv", "https://arxiv.org/abs/2106.12345") == {"dummy"}
+    assert index.find("isbn", "978-0-201-36299-2") == {"dummy"}
+    bib["dummy"].data.pop("doi")
+    bib.update({"dummy": bib["dummy"]})
+    assert index.find("doi", "10.1/x") == set()
+    bib.pop("dummy")
+    assert index.find("isbn", "0201362996") == set()
+
+
+def test_database_search_index() -> None:
+    """Test the `cobib.database.Database.search_index` method and its maintenance."""
+    bib = Database()
+    bib.read()
+    assert Database.search_index() is None
+
+    config.commands.search.full_text_index = True
+    index = Database.search_index()
+    assert index is not None
+    assert index.candidates(["Einstein"], skip_files=True) == {"einstein"}
+    assert index.candidates(["annalen der"], skip_files=True) == {"einstein"}
+    assert index.candidates(["einstein annalen"], skip_files=True) == set()
+    assert index.candidates(["\\bknuth", "companio"], skip_files=True) == {
+        "knuthwebsite",
+        "latexcompanion",
+    }
+    assert index.candidates(["Einst.in"], skip_files=True) is None
+
+    bib.update({"dummy": Entry("dummy", {"ENTRYTYPE": "misc", "title": "Quantum Advantage"})})
+    assert index.candidates(["quantum adv"], skip_files=True) == {"dummy"}
+    bib.pop("dummy")
+    assert index.candidates(["quantum"], skip_files=True) == set()
+
+
 def test_database_read() -> None:
     """Test the `cobib.database.Database.read` method."""
     bib = Database()
@@ -314,6 +397,364 @@ def test_database_save_delete() -> None:
         config.database.file = EXAMPLE_LITERATURE
 
 
+def test_database_save_rename() -> None:
+    """Test the `cobib.database.Database.save` method after renaming an entry."""
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.yaml"
+    copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+    # initialize database
+    bib = Database()
+    bib.read()
+    entry = bib["latexcompanion"]
+    entry.label = "companion"
+    bib.update({"companion": entry})
+    bib.rename("latexcompanion", "companion")
+    bib.save()
+
+    try:
+        assert Database._unsaved_entries == {}
+
+        with open(config.database.file, "r", encoding="utf-8") as file:
+            with open(EXAMPLE_LITERATURE, "r", encoding="utf-8") as expected:
+                assert file.read() == expected.read().replace("latexcompanion:", "companion:")
+
+        assert list(Database._entry_spans.keys()) == ["einstein", "companion", "knuthwebsite"]
+    finally:
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+def test_database_entry_spans() -> None:
+    """Test the index of entry locations which gets computed when reading the database."""
+    bib = Database()
+    bib.read()
+
+    with open(EXAMPLE_LITERATURE, "rb") as file:
+        raw = file.read()
+
+    assert list(Database._entry_spans.keys()) == list(bib.keys())
+    for label, (start, end) in Database._entry_spans.items():
+        document = raw[start:end].decode("utf-8")
+        assert document.startswith(f"---\n{label}:\n")
+        assert document.endswith("...\n")
+    assert Database._entry_spans["knuthwebsite"][1] == len(raw)
+
+
+def test_database_save_external_modification() -> None:
+    """Test that `cobib.database.Database.save` handles external changes of the database file."""
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.yaml"
+    copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+    # initialize database
+    bib = Database()
+    bib.read()
+
+    # prepend a comment to the file which invalidates all known entry locations
+    with open(config.database.file, "r", encoding="utf-8") as file:
+        contents = file.read()
+    with open(config.database.file, "w", encoding="utf-8") as file:
+        file.write("# an external comment\n" + contents)
+
+    bib.pop("einstein")
+    bib.save()
+
+    try:
+        with open(config.database.file, "r", encoding="utf-8") as file:
+            saved = file.read()
+        assert saved.startswith("# an external comment\n---\nlatexcompanion:\n")
+        assert "einstein" not in saved
+    finally:
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+def test_database_save_duplicate_labels(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that `cobib.database.Database.save` leaves no stale copies of duplicate labels."""
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.yaml"
+    with open(EXAMPLE_LITERATURE, "r", encoding="utf-8") as file:
+        contents = file.read()
+    start = contents.index("---\neinstein:\n")
+    duplicate = contents[start : contents.index("...\n", start) + 4]
+    with open(config.database.file, "w", encoding="utf-8") as file:
+        file.write(contents + duplicate)
+
+    # initialize database
+    bib = Database()
+    bib.read()
+    entry = copy.deepcopy(bib["einstein"])
+    entry.data["tags"] = "test"
+    bib.update({"einstein": entry})
+    bib.save()
+
+    try:
+        assert Database._unsaved_entries == {}
+        assert (
+            "cobib.database.database",
+            30,
+            "Rewriting the entire database file because not all of its documents could be indexed "
+            "unambiguously. Please run `cobib lint` to check the database for problems.",
+        ) in caplog.record_tuples
+
+        with open(config.database.file, "r", encoding="utf-8") as file:
+            saved = file.read()
+        assert saved.count("\neinstein:\n") == 1
+        assert "  tags: test\n" in saved
+        assert list(Database._entry_spans.keys()) == list(bib.keys())
+
+        Database.reset()
+        Database.read()
+        assert Database()["einstein"].data["tags"] == ["test"]
+    finally:
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+def test_database_journal() -> None:
+    """Test the journal mode of `cobib.database.Database.save`."""
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.yaml"
+    config.database.journal = True
+    copyfile(EXAMPLE_LITERATURE, config.database.file)
+    journal = Database.get_journal_file()
+
+    try:
+        # initialize database
+        bib = Database()
+        bib.read()
+        entry = bib["latexcompanion"]
+        entry.label = "companion"
+        bib.update({"companion": entry})
+        bib.rename("latexcompanion", "companion")
+        bib.pop("einstein")
+        bib.update({"dummy": DUMMY_ENTRY})
+        bib.save()
+
+        # the database file remains untouched
+        with open(config.database.file, "r", encoding="utf-8") as file:
+            with open(EXAMPLE_LITERATURE, "r", encoding="utf-8") as expected:
+                assert file.read() == expected.read()
+        assert journal.exists()
+        assert Database._journal_records == 4
+
+        # the journal gets replayed upon reading
+        Database.reset()
+        bib = Database()
+        assert list(bib.keys()) == ["companion", "knuthwebsite", "dummy"]
+        assert bib["dummy"] == DUMMY_ENTRY
+        assert Database._journaled_entries == {
+            "latexcompanion": "companion",
+            "einstein": None,
+            "dummy": "dummy",
+        }
+
+        # compacting folds the journal into the database file
+        Database.compact()
+        assert not journal.exists()
+        with open(config.database.file, "r", encoding="utf-8") as file:
+            with open(EXAMPLE_LITERATURE, "r", encoding="utf-8") as expected:
+                saved = file.read()
+                assert saved.startswith(
+                    expected.read().replace("latexcompanion:", "companion:").split("...\n", 1)[1]
+                )
+        assert saved.count("---\n") == 3
+        assert "...\n---\ndummy:\n" in saved
+
+        Database.reset()
+        bib = Database()
+        assert list(bib.keys()) == ["companion", "knuthwebsite", "dummy"]
+        assert bib["dummy"] == DUMMY_ENTRY
+    finally:
+        journal.unlink(missing_ok=True)
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+def test_database_journal_threshold() -> None:
+    """Test the automatic compaction of the journal."""
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.yaml"
+    config.database.journal = True
+    config.database.journal_threshold = 2
+    copyfile(EXAMPLE_LITERATURE, config.database.file)
+    journal = Database.get_journal_file()
+
+    try:
+        bib = Database()
+        bib.read()
+        bib.pop("einstein")
+        bib.save()
+        assert journal.exists()
+
+        bib.pop("knuthwebsite")
+        bib.save()
+        assert not journal.exists()
+        assert Database._journaled_entries == {}
+
+        Database.reset()
+        assert list(Database().keys()) == ["latexcompanion"]
+    finally:
+        journal.unlink(missing_ok=True)
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+def test_database_lazy() -> None:
+    """Test reading the database lazily."""
+    eager = OrderedDict(Database())
+
+    config.database.lazy = True
+    Database.reset()
+    bib = Database()
+
+    assert Database._lazy
+    assert list(bib.keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+    assert all(isinstance(value, bytes) for value in dict.values(bib))
+
+    entry = bib["einstein"]
+    assert entry == eager["einstein"]
+    assert isinstance(dict.__getitem__(bib, "einstein"), Entry)
+    assert isinstance(dict.__getitem__(bib, "latexcompanion"), bytes)
+    assert bib.get("missing") is None
+
+    assert bib.pop("knuthwebsite") == eager["knuthwebsite"]
+    assert OrderedDict(bib.items()) == OrderedDict(
+        (label, entry) for label, entry in eager.items() if label != "knuthwebsite"
+    )
+
+
+def test_database_lazy_hooks() -> None:
+    """Test that subscribed YAML parsing hooks disable lazy reading."""
+    config.database.lazy = True
+
+    @Event.PostYAMLParse.subscribe
+    def hook(bib: dict[str, Entry]) -> None:
+        pass
+
+    Database.reset()
+    bib = Database()
+    assert not Database._lazy
+    assert all(isinstance(value, Entry) for value in dict.values(bib))
+
+
+def test_database_sqlite() -> None:
+    """Test the SQLite backend of the `cobib.database.Database`."""
+    eager = OrderedDict(Database())
+
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_file.sqlite"
+    config.database.backend = "sqlite"
+    config.database.file.touch()
+    exported = TMPDIR / "cobib_test_database_export.yaml"
+
+    try:
+        Database.reset()
+        bib = Database()
+        assert len(bib) == 0
+        bib.update(eager)
+        bib.save()
+
+        Database.reset()
+        bib = Database()
+        assert OrderedDict(bib) == eager
+
+        # the YAML export remains unchanged
+        YAMLExporter(str(exported)).write(list(bib.values()))
+        with open(exported, "r", encoding="utf-8") as file:
+            with open(EXAMPLE_LITERATURE, "r", encoding="utf-8") as expected:
+                assert file.read() == expected.read()
+
+        entry = bib["latexcompanion"]
+        entry.label = "companion"
+        bib.update({"companion": entry})
+        bib.rename("latexcompanion", "companion")
+        bib.pop("einstein")
+        bib.update({"dummy": DUMMY_ENTRY})
+        bib.save()
+
+        Database.reset()
+        bib = Database()
+        assert list(bib.keys()) == ["companion", "knuthwebsite", "dummy"]
+        assert bib["dummy"] == DUMMY_ENTRY
+
+        with sqlite3.connect(config.database.file) as connection:
+            rows = connection.execute(
+                "SELECT label, entrytype, year FROM entries ORDER BY position"
+            ).fetchall()
+            assert rows == [
+                ("companion", "book", 1993),
+                ("knuthwebsite", "misc", None),
+                ("dummy", "misc", None),
+            ]
+
+    finally:
+        exported.unlink(missing_ok=True)
+        config.database.file.unlink()
+        config.database.file = EXAMPLE_LITERATURE
+
+
+@pytest.mark.parametrize(["shard_by", "expected"], [("hash", 3), ("year", 3)])
+def test_database_sharded(shard_by: str, expected: int) -> None:
+    """Test the sharded backend of the `cobib.database.Database`.
+
+    Args:
+        shard_by: the partitioning scheme.
+        expected: the expected number of shard files.
+    """
+    eager = OrderedDict(Database())
+
+    # prepare temporary database
+    config.database.file = TMPDIR / "cobib_test_database_shards"
+    config.database.backend = "sharded"
+    backend = ShardedBackend(config.database.file)
+    backend.initialize(shard_by, 4)
+
+    try:
+        Database.reset()
+        bib = Database()
+        assert len(bib) == 0
+        bib.update(eager)
+        bib.save()
+        assert len(backend.shard_files()) == expected
+        assert Database.pop_written_files() == {*backend.shard_files(), backend.manifest}
+
+        Database.reset()
+        bib = Database()
+        assert OrderedDict(bib) == eager
+
+        # modifying an entry only rewrites its shard
+        before = {path: path.read_bytes() for path in backend.shard_files()}
+        manifest = backend.manifest.read_bytes()
+        entry = bib["einstein"]
+        entry.data["note"] = "a note"
+        bib.update({"einstein": entry})
+        bib.save()
+        shard = backend.directory / ShardedBackend.shard_of(entry, shard_by, 4)
+        assert Database.pop_written_files() == {shard}
+        assert backend.manifest.read_bytes() == manifest
+        for path, contents in before.items():
+            assert (path.read_bytes() == contents) == (path != shard)
+
+        entry = bib["latexcompanion"]
+        entry.label = "companion"
+        bib.update({"companion": entry})
+        bib.rename("latexcompanion", "companion")
+        bib.pop("einstein")
+        bib.update({"dummy": DUMMY_ENTRY})
+        bib.save()
+
+        Database.reset()
+        bib = Database()
+        assert list(bib.keys()) == ["companion", "knuthwebsite", "dummy"]
+        assert bib["dummy"] == DUMMY_ENTRY
+        assert bib["companion"] == entry
+    finally:
+        rmtree(config.database.file)
+        config.database.file = EXAMPLE_LITERATURE
+
+
 def test_database_caching_disabled(caplog: pytest.LogCaptureFixture) -> None:
     """Tests that the caching mechanism can be disabled.
 
@@ -400,7 +841,7 @@ def test_database_cache_reading(caplog: pytest.LogCaptureFixture) -> None:
 
 
 def test_database_cache_outdated() -> None:
-    """Test Database.read_cache stops when the cache is outdated."""
+    """Test Database.read_cache stops when the cache is outdated and cannot be repaired."""
     with tempfile.TemporaryDirectory() as tempdir:
         config.database.cache = tempdir
         config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
@@ -411,15 +852,295 @@ def test_database_cache_outdated() -> None:
 
         cache_file = Database._get_cache_file()
         new_time = cast(Path, cache_file).stat().st_mtime_ns
-        # make the cache appear outdated by updating the modified time of the database file
+        # updating only the modified time of the database file does not invalidate the cache
         os.utime(config.database.file, ns=(new_time + 1_000_000, new_time + 1_000_000))
 
+        Database.reset()
+        Database.read_cache()
+
+        with open(config.database.file, "a", encoding="utf-8") as file:
+            file.write(DUMMY_ENTRY_YAML)
+
+        @Event.PostYAMLParse.subscribe
+        def hook(bib: dict[str, Entry]) -> None:
+            pass
+
         Database.reset()
 
         with pytest.raises(CacheError, match="the cached database is outdated"):
             Database.read_cache()
 
 
+def test_database_cache_unmodified(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Database.read_cache does not digest the database file while it is unmodified.
+
+    Args:
+        monkeypatch: the built-in pytest fixture.
+    """
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+
+        digested: list[int] = []
+        digest_documents = Database._digest_documents
+
+        def spy(data: bytes, spans: dict[str, tuple[int, int]], offset: int = 0) -> Any:
+            digested.append(len(spans))
+            return digest_documents(data, spans, offset)
+
+        monkeypatch.setattr(Database, "_digest_documents", spy)
+
+        Database.reset()
+        Database.read_cache()
+        assert digested == []
+        assert list(Database().keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+
+        # touching the database file falls back to the digests and the cache gets updated
+        stat = Path(config.database.file).stat()
+        os.utime(config.database.file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        Database.reset()
+        Database.read_cache()
+        assert digested == [3]
+
+        Database.reset()
+        Database.read_cache()
+        assert digested == [3]
+
+
+def test_database_cache_repair() -> None:
+    """Test Database.read_cache repairs the entries whose documents have changed."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+
+        raw = Path(config.database.file).read_text(encoding="utf-8")
+        raw = raw.replace("pages: 891--921", "pages: 1--2")
+        Path(config.database.file).write_text(raw + DUMMY_ENTRY_YAML, encoding="utf-8")
+
+        Database.reset()
+        Database.read_cache()
+        bib = Database()
+        assert list(bib.keys()) == ["einstein", "latexcompanion", "knuthwebsite", "dummy"]
+        assert isinstance(dict.__getitem__(bib, "einstein"), Entry)
+        assert isinstance(dict.__getitem__(bib, "latexcompanion"), memoryview)
+        assert bib["einstein"].data["pages"] == "1--2"
+        assert bib["dummy"] == DUMMY_ENTRY
+
+        # the repaired cache is valid again
+        Database.reset()
+        Database.read_cache()
+        assert all(isinstance(value, memoryview) for value in dict.values(Database()))
+
+
+def test_database_cache_records() -> None:
+    """Test that entries are read lazily from the cache and that it gets updated in-place."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+        eager = OrderedDict((label, copy.deepcopy(entry)) for label, entry in Database().items())
+        cache_file = cast(Path, Database._get_cache_file())
+        cache_size = cache_file.stat().st_size
+
+        Database.reset()
+        Database.read()
+        bib = Database()
+        assert Database._lazy
+        assert all(isinstance(value, memoryview) for value in dict.values(bib))
+        assert bib["einstein"] == eager["einstein"]
+        assert isinstance(dict.__getitem__(bib, "latexcompanion"), memoryview)
+
+        bib["einstein"].data["pages"] = "1--2"
+        bib.update({"einstein": bib["einstein"]})
+        Database.save()
+        # only the accessed entry got appended to the cache file
+        assert cache_file.stat().st_size < 2 * cache_size
+
+        Database.reset()
+        Database.read()
+        assert Database._lazy
+        assert Database()["einstein"].data["pages"] == "1--2"
+        assert Database()["latexcompanion"] == eager["latexcompanion"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_database_sorted_labels(reverse: bool) -> None:
+    """Test the Database.sorted_labels method and the maintenance of its sort indexes.
+
+    Args:
+        reverse: whether to sort in descending order.
+    """
+
+    def expected(field: str) -> list[str]:
+        return [
+            entry.label
+            for entry in natsorted(
+                Database().values(),
+                reverse=reverse,
+                key=lambda entry: entry.stringify_field(field) or "",
+            )
+        ]
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+        bib = Database()
+        for field in ("year", "ENTRYTYPE", "author"):
+            assert list(Database.sorted_labels(field, reverse=reverse)) == expected(field)
+
+        # the sort indexes get stored alongside the cache
+        Database.reset()
+        Database.read()
+        assert "year" in Database._sort_index
+        assert all(isinstance(value, memoryview) for value in dict.values(Database()))
+        assert list(Database.sorted_labels("year", reverse=reverse)) == expected("year")
+
+        bib = Database()
+        bib.update({"dummy": copy.deepcopy(DUMMY_ENTRY), "dummy2": Entry("dummy2", {})})
+        bib["einstein"].data["year"] = 1993
+        bib.update({"einstein": bib["einstein"]})
+        bib.pop("knuthwebsite")
+        entry = bib["latexcompanion"]
+        entry.label = "companion"
+        bib.update({"companion": entry})
+        bib.rename("latexcompanion", "companion")
+        for field in ("year", "ENTRYTYPE", "author"):
+            assert list(Database.sorted_labels(field, reverse=reverse)) == expected(field)
+
+        Database.save()
+        Database.reset()
+        Database.read()
+        for field in ("year", "ENTRYTYPE", "author"):
+            assert list(Database.sorted_labels(field, reverse=reverse)) == expected(field)
+
+
+def test_database_value_index() -> None:
+    """Test the Database.value_index method and the maintenance of its index."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+        assert Database.value_index(["ENTRYTYPE", "title"]) is None
+        index = cast(ValueIndex, Database.value_index(["ENTRYTYPE", "journal"]))
+        assert index.match("ENTRYTYPE", lambda value: value == "book") == {"latexcompanion"}
+        assert set(index.labels("journal")) == {"einstein"}
+
+        # the value index gets stored alongside the cache
+        Database.reset()
+        Database.read()
+        assert "ENTRYTYPE" in Database._value_index
+        assert all(isinstance(value, memoryview) for value in dict.values(Database()))
+
+        bib = Database()
+        bib.update({"dummy": Entry("dummy", {"ENTRYTYPE": "book", "tags": ["new", "toread"]})})
+        bib.pop("latexcompanion")
+        index = cast(ValueIndex, Database.value_index(["ENTRYTYPE", "tags"]))
+        assert index.startswith("ENTRYTYPE", "b") == {"dummy"}
+        assert index.contains("tags", "read") == {"dummy"}
+        assert index.contains("tags", "new, toread") is None
+        assert Database.tag_index() == {"new": {"dummy"}, "toread": {"dummy"}}
+        bib["dummy"].tags = ["new"]
+        bib.update({"dummy": bib["dummy"]})
+        assert Database.tag_index() == {"new": {"dummy"}}
+
+        plan = FilterPlan({("ENTRYTYPE", True): ["book", "misc"]}, True)
+        assert plan.select(index, bib.keys()) == {"dummy", "knuthwebsite"}
+
+        # an empty literal matches the stringified value of an empty list, which has no elements
+        bib.update({"empty": Entry("empty", {"ENTRYTYPE": "misc", "tags": []})})
+        assert index.contains("tags", "") == {"dummy", "empty"}
+        for positive in (True, False):
+            plan = FilterPlan({("tags", positive): [""]}, False)
+            assert plan.select(index, bib.keys()) == {
+                entry.label for entry in plan.apply(bib.values())
+            }
+
+        # changing the list separator invalidates the index of the affected field
+        config.database.stringify.list_separator.tags = "; "
+        assert "tags" not in Database._value_index
+        assert "ENTRYTYPE" in Database._value_index
+
+
+def test_database_range_index() -> None:
+    """Test the Database.range_index method and the maintenance of its index."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        config.database.file = Path(tempdir) / "cobib_test_database_file.yaml"
+        copyfile(EXAMPLE_LITERATURE, config.database.file)
+
+        Database.reset()
+        Database.read()
+        assert Database.range_index(["year", "title"]) is None
+        index = cast(RangeIndex, Database.range_index(["year", "pages"]))
+        assert index.select("year", cast(Comparison, Comparison.parse(">=1905"))) == {
+            "einstein",
+            "latexcompanion",
+        }
+        assert index.select("pages", cast(Comparison, Comparison.parse("<900"))) == {"einstein"}
+
+        # the range index gets stored alongside the cache
+        Database.reset()
+        Database.read()
+        assert "year" in Database._range_index
+
+        bib = Database()
+        bib.update({"dummy": Entry("dummy", {"ENTRYTYPE": "misc", "date": "2015-03-01"})})
+        bib.update({"dummy2": Entry("dummy2", {"ENTRYTYPE": "misc", "year": "2015"})})
+        bib.pop("einstein")
+        index = cast(RangeIndex, Database.range_index(["year", "date"]))
+        assert index.select("year", cast(Comparison, Comparison.parse("<2000"))) == {
+            "latexcompanion"
+        }
+        # dates get compared at the precision of the bound
+        for pattern, expected in [(">=2015", {"dummy"}), (">2015", set()), (">2015-02", {"dummy"})]:
+            assert index.select("date", cast(Comparison, Comparison.parse(pattern))) == expected
+
+        plan = FilterPlan({("year", True): ["=2015"], ("date", True): ["<2016"]}, True)
+        values = cast(ValueIndex, Database.value_index(plan.fields - plan.comparison_fields))
+        assert plan.select(values, bib.keys(), index) == {"dummy", "dummy2"}
+        assert [entry.label for entry in plan.apply(bib.values())] == ["dummy", "dummy2"]
+
+        # filters on other fields remain regex patterns
+        bib.update({"bounds": Entry("bounds", {"ENTRYTYPE": "misc", "title": "Bounds for n <5"})})
+        bib.update({"seven": Entry("seven", {"ENTRYTYPE": "misc", "title": "7"})})
+        plan = FilterPlan({("title", True): ["<5"]}, False)
+        assert plan.comparison_fields == set()
+        assert [entry.label for entry in plan.apply(bib.values())] == ["bounds"]
+        plan = FilterPlan({("title", True): [">5"]}, False)
+        assert [entry.label for entry in plan.apply(bib.values())] == []
+
+
+def test_database_cache_outdated_format() -> None:
+    """Test Database.read_cache rejects cache files written in an outdated format."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        config.database.cache = tempdir
+        cache_file = cast(Path, Database._get_cache_file())
+        cache_file.write_bytes(b"\x80\x04" + b"\x00" * 64)
+
+        Database.reset()
+
+        with pytest.raises(CacheError, match="the cached database was written in an outdated"):
+            Database.read_cache()
+
+
 def test_database_bypass_cache() -> None:
     """Test handling of the `bypass_cache` keyword argument."""
     Database._instance = None
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 from typing import Any, Generator
 
 import pytest
 
-from cobib.config import AuthorFormat, config
+from cobib.config import AuthorFormat, Event, TagMarkup, config
 from cobib.database import Author, Entry
+from cobib.database.filter_plan import FilterPlan
 from cobib.parsers.bibtex import BibtexParser
 from cobib.utils.match import Match, Span
 from cobib.utils.regex import HAS_OPTIONAL_REGEX
@@ -321,6 +323,28 @@ def test_match_with_wrong_key() -> None:
     assert entry.matches(filter_, or_=False)
 
 
+def test_filter_plan() -> None:
+    """Test the `cobib.database.filter_plan.FilterPlan` class."""
+    entries = [
+        Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT),
+        Entry("Einstein_1905", {"ENTRYTYPE": "article", "author": "Albert Einstein", "year": 1905}),
+        Entry("no_fields", {"ENTRYTYPE": "misc"}),
+    ]
+    filter_ = {("author", True): ["Einstein", "Rossmannek"], ("year", False): ["2023"]}
+    for or_ in (False, True):
+        plan = FilterPlan(filter_, or_)
+        assert plan.fields == {"author", "year"}
+        assert [len(patterns) for _, _, patterns in plan.clauses] == [2, 1]
+        expected = [entry for entry in entries if entry.matches(filter_, or_=or_)]
+        assert list(plan.apply(entries)) == expected
+
+    # the remaining fields do not get stringified once the result is determined
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
+    assert FilterPlan(filter_, True).matches(entry)
+    assert ("author", False) in entry._stringified
+    assert ("year", False) not in entry._stringified
+
+
 @pytest.mark.parametrize(
     ["query", "context", "ignore_case", "expected"],
     [
@@ -604,6 +628,140 @@ def test_search_with_skipped_file() -> None:
         assert res == exp
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        ["Chem", "Letters"],
+        ["Chem", "Chemistry", "emi"],
+        ["Chem", "(Che)m"],
+        ["Chem", "x*"],
+    ],
+)
+def test_search_multiple_queries(query: list[str]) -> None:
+    """Test the `cobib.database.Entry.search` method with multiple (overlapping) queries.
+
+    Args:
+        query: the strings to search for.
+    """
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
+    entry.file = EXAMPLE_YAML_FILE
+    results = entry.search(query, context=1)
+    expected = [match for query_str in query for match in entry.search([query_str], context=1)]
+    assert results == expected
+
+
+def test_search_with_grep_outputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the `cobib.database.Entry.search` method with the outputs of `Entry.grep`.
+
+    Args:
+        monkeypatch: the built-in pytest fixture.
+    """
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
+    entry.file = [EXAMPLE_YAML_FILE, EXAMPLE_BIBTEX_FILE]
+    other = Entry("other", {"ENTRYTYPE": "misc", "file": EXAMPLE_YAML_FILE})
+    query = ["Chem", "Letters"]
+    expected = entry.search(query, context=1)
+
+    # all files are searched in a single batch and the outputs are split back into the files
+    grep_outputs = Entry.grep([*entry.file, *other.file], query, 1)
+    assert set(grep_outputs.keys()) == set(entry.file)
+
+    monkeypatch.setattr("cobib.database.entry.GREP_BATCH_SIZE", 1)
+    assert Entry.grep(entry.file, query, 1) == grep_outputs
+
+    monkeypatch.setattr(Entry, "_grep_batches", None)
+    assert entry.search(query, context=1, grep_outputs=grep_outputs) == expected
+
+
+@pytest.mark.parametrize(
+    ["query", "invocations"],
+    [[["Chem", "Letters"], 1], [["Chem", "Chemistry", "x*"], 1], [["Chem", "(Che)m"], 2]],
+)
+def test_grep_multiple_queries(
+    query: list[str], invocations: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the `cobib.database.Entry.grep` method attributes the matches of multiple queries.
+
+    Args:
+        query: the strings to search for.
+        invocations: the expected number of invocations of the search tool.
+        monkeypatch: the built-in pytest fixture.
+    """
+    files = [EXAMPLE_YAML_FILE, EXAMPLE_BIBTEX_FILE]
+    expected: dict[str, list[str]] = {file_: [] for file_ in files}
+    for query_str in query:
+        outputs = Entry.grep(files, [query_str], 1)
+        for file_ in files:
+            expected[file_].extend(outputs.get(file_, [""]))
+
+    calls: list[list[str]] = []
+    grep_batches = Entry._grep_batches
+
+    def spy(paths: list[str], query: list[str], context: int) -> Any:
+        calls.append(query)
+        return grep_batches(paths, query, context)
+
+    monkeypatch.setattr(Entry, "_grep_batches", spy)
+    assert Entry.grep(files, query, 1) == expected
+    assert len(calls) == invocations
+
+
+def test_grep_ambiguous_paths(tmp_path: Path) -> None:
+    """Test the `cobib.database.Entry.grep` method with paths which prefix each other.
+
+    Args:
+        tmp_path: the built-in pytest fixture.
+    """
+    first, second = tmp_path / "x", tmp_path / "x-1"
+    # the context line `1-alpha` of the first file gets reported as `.../x-1-alpha`
+    first.write_text("quantum\n1-alpha\n")
+    second.write_text("quantum\nbeta\n")
+    files = [str(first), str(second)]
+    assert Entry._ambiguous(files)
+    assert not Entry._ambiguous([str(first), str(tmp_path / "y")])
+
+    expected = {file_: Entry.grep([file_], ["quantum", "beta"], 3)[file_] for file_ in files}
+    assert Entry.grep(files, ["quantum", "beta"], 3) == expected
+    assert expected[str(first)] == ["quantum\n1-alpha\n", ""]
+
+
+def test_search_with_extractor(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test the `cobib.database.Entry.search` method with extracted texts.
+
+    Args:
+        monkeypatch: the built-in pytest fixture.
+        tmp_path: the built-in pytest fixture.
+    """
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
+    entry.file = [EXAMPLE_YAML_FILE, EXAMPLE_BIBTEX_FILE]
+    query = ["Chem", "Letters"]
+    expected = entry.search(query, context=1)
+
+    config.database.cache = str(tmp_path)
+    config.commands.search.extractor = ["cat", "{}"]
+    assert entry.search(query, context=1) == expected
+    assert len(list((tmp_path / "extracted").iterdir())) == len(entry.file)
+
+    # the cached texts are searched without spawning any subprocess
+    monkeypatch.setattr("subprocess.run", None)
+    monkeypatch.setattr(Entry, "_grep_batches", None)
+    assert entry.search(query, context=1) == expected
+
+
+def test_search_with_text_matches() -> None:
+    """Test the `cobib.database.Entry.search` method with the results of `Entry.search_texts`."""
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
+    entry.file = [EXAMPLE_YAML_FILE]
+    query = ["Chem", "[0-9]+"]
+    expected = entry.search(query, context=2, ignore_case=True)
+
+    texts = [(entry.searchable_text(), None)]
+    [text_matches] = pickle.loads(
+        pickle.dumps(Entry.search_texts(texts, query, context=2, ignore_case=True))
+    )
+    assert entry.search(query, context=2, ignore_case=True, text_matches=text_matches) == expected
+
+
 def test_search_with_missing_file(caplog: pytest.LogCaptureFixture) -> None:
     """Test the `cobib.database.Entry.search` method with a missing file.
 
@@ -688,6 +846,85 @@ def test_save(author_format: AuthorFormat, reference_file: str) -> None:
             assert line == truth.strip("\n")
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Journal of Chemical Physics",
+        "Schr\u00f6dinger",
+        'R\\"{o}ssmannek',
+        "pp. 1--10",
+        "100% & more~",
+        "``quoted''",
+        "!`Hola!",
+        "",
+    ],
+)
+def test_latex_codec(value: str) -> None:
+    """Test the `cobib.database.Entry.encode_latex` and `cobib.database.Entry.decode_latex` methods.
+
+    Args:
+        value: the value to encode and decode.
+    """
+    Entry.clear_latex_codec()
+    encoder = Entry._get_unicode_to_latex_encoder()
+    decoder = Entry._get_latex_to_text_decoder()
+    for _ in range(2):
+        assert Entry.encode_latex(value) == encoder.unicode_to_latex(value)
+        assert Entry.decode_latex(value) == decoder.latex_to_text(value)
+
+    info = Entry.latex_codec_info()
+    if value.isascii():
+        assert info["encode"] == (2, 0, 0, 0)
+    else:
+        assert info["encode"] == (0, 1, 1, 1)
+    if value in ("Journal of Chemical Physics", "Schr\u00f6dinger", ""):
+        assert info["decode"] == (2, 0, 0, 0)
+    else:
+        assert info["decode"] == (0, 1, 1, 1)
+
+
+def test_memoized_dump() -> None:
+    """Test the memoization of the dumps of an entry."""
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT.copy())
+    saved = entry.save()
+    bibtex = BibtexParser().dump(entry)
+    assert len(entry._dumps) == 2
+    assert entry.save() is saved
+    assert BibtexParser().dump(entry) is bibtex
+    assert BibtexParser(encode_latex=False).dump(entry) is not bibtex
+
+    # any modification invalidates the memoized dumps
+    key = BibtexParser().dump_key(entry)
+    assert key is not None
+    assert entry.memoized_dump(key) is bibtex
+    entry.data["year"] = 2024
+    assert entry.memoized_dump(key) is None
+    assert "year = {2024}" in BibtexParser().dump(entry)
+    entry.tags = ["new"]
+    assert "- new\n" in entry.save()
+    entry.label = "renamed"
+    assert entry.save().startswith("---\nrenamed:")
+    entry.merge(Entry("other", {"volume": 42}))
+    assert "volume = {42}" in BibtexParser().dump(entry)
+    entry.data = {"ENTRYTYPE": "misc"}
+    assert BibtexParser().dump(entry) == "@misc{renamed\n}\n"
+
+    # the memoized dumps are not pickled
+    assert pickle.loads(pickle.dumps(entry))._dumps == {}
+
+
+def test_memoized_dump_hooks() -> None:
+    """Test that subscribed dumping hooks disable the memoization."""
+
+    @Event.PostBibtexDump.subscribe
+    def hook(string: str) -> str:
+        return string + "%"
+
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT.copy())
+    assert BibtexParser().dump(entry).endswith("%")
+    assert entry._dumps == {}
+
+
 def test_merge_ours() -> None:
     """Test the `cobib.database.Entry.merge` method with the `ours` strategy."""
     entry = Entry(
@@ -739,12 +976,41 @@ def test_stringify() -> None:
     assert entry.stringify() == expected
 
 
+def test_stringify_field() -> None:
+    """Test the `cobib.database.Entry.stringify_field` method."""
+    entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT.copy())
+    for encode_latex in (True, False):
+        stringified = entry.stringify(encode_latex=encode_latex)
+        for field, expected in stringified.items():
+            assert entry.stringify_field(field, encode_latex=encode_latex) == expected
+    assert entry.stringify_field("missing") is None
+
+    # the result is memoized until the entry or the list separator change
+    title = entry.stringify_field("title")
+    assert entry.stringify_field("title") is title
+    entry.data["title"] = "Another title"
+    assert entry.stringify_field("title") == "Another title"
+    entry.tags = ["tag1", "tag2"]
+    assert entry.stringify_field("tags") == "tag1, tag2"
+    config.database.stringify.list_separator.tags = "; "
+    assert entry.stringify_field("tags") == "tag1; tag2"
+
+
 def test_markup_label() -> None:
     """Test the `cobib.database.Entry.markup_label` method."""
     entry = Entry("Rossmannek_2023", EXAMPLE_ENTRY_DICT)
     entry.tags = ["new", "medium"]
     markup_label = entry.markup_label()
     assert markup_label == "[tag.new][tag.medium]Rossmannek_2023[/tag.medium][/tag.new]"
+    # the markup gets memoized until the tags or their configured markup change
+    memoized = entry._markup
+    entry.data["title"] = "Another title"
+    assert entry.markup_label() == markup_label
+    assert entry._markup is memoized
+    entry.tags = ["low", "unstyled"]
+    assert entry.markup_label() == "[tag.low]Rossmannek_2023[/tag.low]"
+    config.theme.tags.user_tags["unstyled"] = TagMarkup(50, "bold")
+    assert entry.markup_label() == "[tag.low][tag.unstyled]Rossmannek_2023[/tag.unstyled][/tag.low]"
 
 
 @pytest.mark.parametrize(
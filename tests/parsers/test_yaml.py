@@ -2,18 +2,59 @@
 
 from __future__ import annotations
 
+import random
 import tempfile
-from typing import Dict, Optional, cast
+from pathlib import Path
+from typing import Any, Dict, Optional, cast
 
 import pytest
 
 from cobib.config import Event, config
-from cobib.database import Entry
+from cobib.database import Author, Entry
 from cobib.parsers import YAMLParser
+from cobib.parsers.yaml import _SchemaDumper
 
+from .. import get_resource
 from .parser_test import ParserTest
 
 
+def _random_entries(seed: int) -> list[Entry]:
+    """Generates random entries whose fields are full of characters which are special to YAML.
+
+    Args:
+        seed: the seed of the random number generator.
+
+    Returns:
+        The list of generated entries.
+    """
+    rng = random.Random(seed)
+    words = [
+        *("quantum", "Über", "it's", '"quoted"', "Knuth:", "a: b", "#1", "x #y", "- z"),
+        *('{\\"o}', "\\LaTeX\\", "50%", "[1]", "&", "*", "|", "> ", "2023", "1.5"),
+        *("true", "null", "~", "", " ", "\t", "\n", "\n\n", "\\", "\u2028", "\x85"),
+        *("x" * 90, "y" * 30 + " " * 3, " " * 2 + "\n"),
+    ]
+
+    def text(length: int) -> str:
+        return " ".join(rng.choice(words) for _ in range(length))
+
+    entries = []
+    for idx in range(50):
+        data = {
+            "ENTRYTYPE": "article",
+            "author": [
+                Author(text(1), text(2), particle=rng.choice([None, text(1)])),
+                *({"first": text(1), "last": text(2)} for _ in range(rng.randint(0, 2))),
+            ],
+            "title": text(rng.randint(1, 30)),
+            "abstract": "\n\n".join(text(rng.randint(1, 40)) for _ in range(3)),
+            "tags": [text(1) for _ in range(rng.randint(0, 3))],
+            "year": rng.randint(1900, 2100),
+        }
+        entries.append(Entry(f"{text(1)}{idx}", data))
+    return entries
+
+
 class TestYAMLParser(ParserTest):
     """Tests for coBib's YAMLParser."""
 
@@ -83,6 +124,145 @@ class TestYAMLParser(ParserTest):
         with pytest.raises(FileNotFoundError):
             YAMLParser().parse("test/missing_file.yaml")
 
+    def test_index_documents(self) -> None:
+        """Test the indexing of the document locations in raw YAML data."""
+        raw = (
+            b"# a leading comment\n"
+            b"---\nplain:\n  ENTRYTYPE: misc\n...\n"
+            b"---\n'1234':\n  ENTRYTYPE: misc\n...\n"
+            b'---\n"double quoted":\n  ENTRYTYPE: misc\n...'
+        )
+        spans = YAMLParser.index_documents(raw)
+        assert list(spans.keys()) == ["plain", "1234", "double quoted"]
+        assert spans["plain"] == (20, 53)
+        assert raw[slice(*spans["1234"])] == b"---\n'1234':\n  ENTRYTYPE: misc\n...\n"
+        assert spans["double quoted"][1] == len(raw)
+
+        offset_spans = YAMLParser.index_documents(raw, offset=10)
+        assert offset_spans["plain"] == (30, 63)
+
+        assert YAMLParser.count_documents(raw) == 3
+
+    def test_parse_document(self) -> None:
+        """Test parsing a single YAML document."""
+        with open(self.EXAMPLE_YAML_FILE, "r", encoding="utf-8") as file:
+            entry = YAMLParser().parse_document(file.read())
+        assert entry.label == "Rossmannek_2023"
+        assert entry.data == self.EXAMPLE_ENTRY_DICT
+
+        with pytest.raises(ValueError):
+            YAMLParser().parse_document("---\nfirst: 1\nsecond: 2\n...\n")
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_fast_loader(self, seed: int) -> None:
+        """Test that the fast loader round-trips randomly generated entries like `ruamel.yaml`.
+
+        Args:
+            seed: the seed of the random number generator.
+        """
+        raw = [YAMLParser().dump(entry) for entry in _random_entries(seed)]
+        raw.append("---\nliteral:\n  abstract: |\n    first\n\n      second\n  year: 2000\n...\n")
+
+        reference = YAMLParser().parse("".join(raw))
+        config.parsers.yaml.use_fast_loader = True
+        try:
+            assert YAMLParser().parse("".join(raw)) == reference
+            for document, entry in zip(raw, reference.values()):
+                assert YAMLParser().parse_document(document) == entry
+        finally:
+            config.parsers.yaml.use_fast_loader = False
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_fast_dumper(self, seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the fast dumper produces the same output as `ruamel.yaml`.
+
+        Args:
+            seed: the seed of the random number generator.
+            monkeypatch: the built-in pytest fixture.
+        """
+        entries = _random_entries(seed)
+        entries.append(Entry("unsupported", {"float": 1.5, "nested": {"list": [1, 2]}}))
+        entries.append(Entry("x" * 130, {"year": 2000}))
+
+        reference = [YAMLParser().dump(entry) for entry in entries]
+
+        calls: list[str] = []
+        dump = _SchemaDumper.dump
+
+        def spy(self: _SchemaDumper, label: str, data: dict[str, Any]) -> str:
+            calls.append(label)
+            return dump(self, label, data)
+
+        monkeypatch.setattr(_SchemaDumper, "dump", spy)
+        config.parsers.yaml.use_fast_dumper = True
+        try:
+            # the memoized dumps of ruamel.yaml must not be reused by the fast dumper
+            assert [YAMLParser().dump(entry) for entry in entries] == reference
+            assert calls == [entry.label for entry in entries]
+        finally:
+            config.parsers.yaml.use_fast_dumper = False
+
+    def test_parse_parallel(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test parsing a YAML file in parallel.
+
+        Args:
+            monkeypatch: the built-in pytest fixture.
+            caplog: the built-in pytest fixture.
+        """
+        with open(get_resource("example_literature.yaml"), "r", encoding="utf-8") as file:
+            raw = "# leading comment\n" + file.read()
+        raw += raw[raw.index("---") : raw.index("...") + 4]
+        sequential = YAMLParser().parse(raw)
+
+        monkeypatch.setattr(YAMLParser, "_PARALLEL_CHUNK_SIZE", 1)
+        chunks = YAMLParser._split_documents(raw.encode("utf-8"), 2)
+        assert len(chunks) == 4
+        assert b"".join(chunks) == raw.encode("utf-8")
+
+        config.parsers.yaml.parallel = 2
+        try:
+            caplog.clear()
+            entries = YAMLParser().parse(raw)
+        finally:
+            config.parsers.yaml.parallel = 0
+
+        assert entries == sequential
+        assert list(entries.keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+        assert any(
+            "An entry with label 'einstein' was already encountered" in message
+            for _, _, message in caplog.record_tuples
+        )
+
+    @pytest.mark.parametrize("parallel", [0, 2])
+    def test_parse_files(self, parallel: int) -> None:
+        """Test parsing multiple YAML files at once.
+
+        Args:
+            parallel: the number of processes to use.
+        """
+        sequential = YAMLParser().parse(get_resource("example_literature.yaml"))
+        with open(get_resource("example_literature.yaml"), "r", encoding="utf-8") as file:
+            raw = file.read()
+        split = raw.index("...\n") + 4
+
+        tmpdir = Path(tempfile.gettempdir())
+        files = [tmpdir / f"cobib_test_parse_files_{idx}.yaml" for idx in (0, 1)]
+        files[0].write_text(raw[:split], encoding="utf-8")
+        files[1].write_text(raw[split:], encoding="utf-8")
+
+        config.parsers.yaml.parallel = parallel
+        try:
+            entries = YAMLParser().parse_files(files)
+        finally:
+            config.parsers.yaml.parallel = 0
+            for file in files:
+                file.unlink()
+
+        assert entries == sequential
+        assert list(entries.keys()) == ["einstein", "latexcompanion", "knuthwebsite"]
+
     def test_event_pre_yaml_parse(self) -> None:
         """Tests the PreYAMLParse event."""
 